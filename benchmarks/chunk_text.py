@@ -0,0 +1,57 @@
+"""Benchmark ops.chunk_text over synthetic transcripts of 1k-100k segments.
+
+Usage:
+    python benchmarks/chunk_text.py [--chunk-size 2048] [--sizes 1000 10000 100000]
+"""
+
+import argparse
+import random
+import time
+
+from platogram.ops import chunk_text, render
+
+WORDS = "the of and to in is that it was for on are as with his they at be this from".split()
+
+
+def make_transcript(n_segments: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    return render(
+        {
+            i: " ".join(rng.choice(WORDS) for _ in range(rng.randint(5, 25))) + "."
+            for i in range(n_segments)
+        }
+    )
+
+
+def estimate_tokens(text: str) -> int:
+    return (len(text) + 3) // 4
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ops.chunk_text")
+    parser.add_argument("--chunk-size", type=int, default=2048)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    args = parser.parse_args()
+
+    for n_segments in args.sizes:
+        text = make_transcript(n_segments)
+        calls = 0
+
+        def token_count_fn(text: str) -> int:
+            nonlocal calls
+            calls += 1
+            return estimate_tokens(text)
+
+        start = time.perf_counter()
+        chunks = chunk_text(text, args.chunk_size, token_count_fn)
+        elapsed = time.perf_counter() - start
+        print(
+            f"segments={n_segments:>7} chunks={len(chunks):>5} "
+            f"token_count_calls={calls:>7} time={elapsed * 1000:9.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
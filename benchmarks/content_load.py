@@ -0,0 +1,98 @@
+"""Benchmark loading library content from JSON and from the binary memory-mapped format.
+
+Writes a synthetic word-level transcript of a 10-hour recording (150 words per minute) to a
+library in each format, then loads it in a fresh interpreter per run and reports load time
+and peak RSS. "open" reads the document and one transcript event, "scan" also decodes the
+text of every event.
+
+Usage:
+    python benchmarks/content_load.py [--hours 10] [--runs 5]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from platogram.library import get_local_dumb
+from platogram.types import Content, SpeechEvent
+
+PROBE = """
+import resource, sys, time
+from pathlib import Path
+from platogram.library import get_local_dumb
+library = get_local_dumb(Path({home!r}))
+start = time.perf_counter()
+content = library.get_content("recording")
+content.transcript[len(content.transcript) // 2]
+if {scan}:
+    sum(len(event.text) for event in content.transcript)
+elapsed = time.perf_counter() - start
+# ru_maxrss survives exec on Linux and would report the parent's peak, VmHWM does not
+try:
+    hwm = [line for line in open("/proc/self/status") if line.startswith("VmHWM")]
+    maxrss_kb = int(hwm[0].split()[1])
+except (OSError, IndexError):
+    maxrss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(elapsed, maxrss_kb)
+"""
+
+
+def make_content(hours: float) -> Content:
+    n_words = int(hours * 60 * 150)
+    transcript = [
+        SpeechEvent(time_ms=i * 400, text=f"word{i % 5000}", speaker=f"Speaker {i // 2000 % 3}")
+        for i in range(n_words)
+    ]
+    passages = [
+        " ".join(event.text for event in transcript[i : i + 300]) + f"【{i}】"
+        for i in range(0, n_words, 300)
+    ]
+    return Content(
+        title="Ten hours",
+        summary="A long recording.",
+        chapters={0: "Start"},
+        passages=passages,
+        transcript=transcript,
+    )
+
+
+def measure(home: Path, scan: bool, runs: int) -> tuple[float, float]:
+    times, rss = [], []
+    for _ in range(runs):
+        output = subprocess.check_output(
+            [sys.executable, "-c", PROBE.format(home=str(home), scan=scan)], text=True
+        )
+        elapsed, maxrss_kb = output.split()
+        times.append(float(elapsed))
+        rss.append(int(maxrss_kb) / 1024)
+    return statistics.median(times), statistics.median(rss)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark library content loading")
+    parser.add_argument("--hours", type=float, default=10)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    content = make_content(args.hours)
+    print(f"{len(content.transcript)} transcript events, {len(content.passages)} passages")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for binary in [False, True]:
+            home = Path(temp_dir) / ("binary" if binary else "json")
+            get_local_dumb(home, binary=binary).put("recording", content)
+            size = sum(f.stat().st_size for f in home.rglob("*") if f.is_file())
+            for scan in [False, True]:
+                elapsed, rss = measure(home, scan, args.runs)
+                print(
+                    f"{'binary' if binary else 'json':<7} {'scan' if scan else 'open':<5}"
+                    f" load={elapsed * 1000:8.1f}ms max_rss={rss:7.1f}MB"
+                    f" size={size / 1024 / 1024:6.1f}MB"
+                )
+
+
+if __name__ == "__main__":
+    main()
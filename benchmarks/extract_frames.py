@@ -0,0 +1,95 @@
+"""Benchmark frame extraction: one ffmpeg seek per timestamp vs. platogram.frames.
+
+Generates a synthetic 1280x720 video with ffmpeg and extracts one frame every `--step`
+seconds, the way `platogram --images` requests a frame for every transcript event. With
+`--lecture` the video cycles through four test patterns ("slides") every 30 seconds and
+keyframe extraction, one image per distinct slide, is measured as well.
+
+Usage:
+    python benchmarks/extract_frames.py [--minutes 5] [--step 2] [--format jpg] [--lecture]
+"""
+
+import argparse
+import os
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from platogram.frames import extract_frames, extract_keyframes
+
+SLIDES = ["testsrc2", "smptebars", "rgbtestsrc", "smptehdbars"]
+
+
+def make_video(path: Path, minutes: float, lecture: bool) -> None:
+    if lecture:
+        n_slides = max(1, int(minutes * 2))
+        inputs = []
+        for i in range(n_slides):
+            inputs += ["-f", "lavfi", "-i", f"{SLIDES[i % 4]}=duration=30:size=1280x720:rate=30"]
+        filters = [
+            "-filter_complex",
+            f"{''.join(f'[{i}]' for i in range(n_slides))}concat=n={n_slides}:v=1",
+        ]
+    else:
+        inputs = ["-f", "lavfi", "-i", f"testsrc2=duration={minutes * 60}:size=1280x720:rate=30"]
+        filters = []
+    subprocess.run(
+        ["ffmpeg", *inputs, *filters]
+        + ["-c:v", "libx264", "-preset", "ultrafast", "-g", "250", "-pix_fmt", "yuv420p"]
+        + [str(path)],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def extract_per_timestamp(video: Path, output_dir: Path, timestamps_ms: list[int]) -> None:
+    """The extraction loop `ingest.extract_images` used before `platogram.frames`."""
+    output_dir.mkdir()
+    for timestamp_ms in timestamps_ms:
+        subprocess.run(
+            ["ffmpeg", "-ss", f"{timestamp_ms / 1000:.3f}", "-i", str(video)]
+            + ["-frames:v", "1", "-q:v", "2", "-f", "image2"]
+            + [str(output_dir / f"image_{timestamp_ms:09d}.png")],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark frame extraction")
+    parser.add_argument("--minutes", type=float, default=5)
+    parser.add_argument("--step", type=float, default=2)
+    parser.add_argument("--format", default="png", choices=["png", "jpg", "webp"])
+    parser.add_argument("--lecture", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        video = Path(temp_dir) / "video.mp4"
+        make_video(video, args.minutes, args.lecture)
+        timestamps_ms = list(range(0, int(args.minutes * 60_000), int(args.step * 1000)))
+        print(f"{len(timestamps_ms)} timestamps, {os.cpu_count()} CPUs")
+
+        runs = [
+            ("per-timestamp png", extract_per_timestamp, ()),
+            (f"single-pass {args.format}", extract_frames, (args.format,)),
+        ]
+        if args.lecture:
+            runs.append((f"keyframes {args.format}", extract_keyframes, (None, args.format)))
+        for name, function, extra_args in runs:
+            output_dir = Path(temp_dir) / name.replace(" ", "_")
+            start = time.perf_counter()
+            function(video, output_dir, timestamps_ms, *extra_args)
+            elapsed = time.perf_counter() - start
+            files = list(output_dir.iterdir())
+            size = sum(file.stat().st_size for file in files)
+            print(
+                f"{name:<18} {elapsed:8.2f}s files={len(files):5d}"
+                f" size={size / 1024 / 1024:7.1f}MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
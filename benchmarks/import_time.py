@@ -0,0 +1,47 @@
+"""Benchmark import time and resident memory of platogram modules.
+
+Every measurement runs in a fresh interpreter, so nothing is cached between runs.
+
+Usage:
+    python benchmarks/import_time.py [--runs 10] [--modules platogram platogram.ops]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+PROBE = """
+import resource, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def measure(module: str, runs: int) -> tuple[float, float]:
+    times, rss = [], []
+    for _ in range(runs):
+        output = subprocess.check_output([sys.executable, "-c", PROBE.format(module=module)], text=True)
+        elapsed, maxrss_kb = output.split()
+        times.append(float(elapsed))
+        rss.append(int(maxrss_kb) / 1024)
+    return statistics.median(times), statistics.median(rss)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark platogram import time")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--modules", nargs="+", default=["platogram", "platogram.cli", "platogram.ops"]
+    )
+    args = parser.parse_args()
+
+    for module in args.modules:
+        elapsed, rss = measure(module, args.runs)
+        print(f"{module:<24} import={elapsed * 1000:8.1f}ms max_rss={rss:7.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Benchmark image extraction from a remote video: download first vs. range requests.
+
+Serves a synthetic 1280x720 video from a local HTTP server that supports range requests
+and is throttled to `--mbps`, then extracts one frame every `--step` seconds either after
+downloading the whole file (what `extract_images` does by default) or by letting ffmpeg
+seek the remote file (`stream=True`). Reports time and bytes served.
+
+Usage:
+    python benchmarks/remote_frames.py [--minutes 10] [--step 60] [--mbps 50]
+"""
+
+import argparse
+import re
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+import urllib.request
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from platogram.frames import RemoteVideo, extract_frames
+
+
+class ThrottledRangeRequestHandler(SimpleHTTPRequestHandler):
+    bytes_sent = 0
+    bytes_per_second = 50e6 / 8
+
+    def setup(self):
+        self.request.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 16 * 1024)
+        super().setup()
+
+    def send_head(self):
+        match = re.fullmatch(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+        path = Path(self.translate_path(self.path))
+        if not match or not path.is_file():
+            return super().send_head()
+
+        size = path.stat().st_size
+        start = int(match.group(1))
+        end = min(int(match.group(2) or size - 1), size - 1)
+        file = path.open("rb")
+        file.seek(start)
+        self.send_response(206)
+        self.send_header("Content-Type", self.guess_type(str(path)))
+        self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+        return file
+
+    def copyfile(self, source, outputfile):
+        while chunk := source.read(16 * 1024):
+            try:
+                outputfile.write(chunk)
+            except (BrokenPipeError, ConnectionResetError):
+                return
+            ThrottledRangeRequestHandler.bytes_sent += len(chunk)
+            time.sleep(len(chunk) / self.bytes_per_second)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark remote image extraction")
+    parser.add_argument("--minutes", type=float, default=10)
+    parser.add_argument("--step", type=float, default=60)
+    parser.add_argument("--mbps", type=float, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        video = Path(temp_dir) / "video.mp4"
+        subprocess.run(
+            ["ffmpeg", "-f", "lavfi"]
+            + ["-i", f"testsrc2=duration={args.minutes * 60}:size=1280x720:rate=30"]
+            + ["-c:v", "libx264", "-preset", "ultrafast", "-g", "250", "-pix_fmt", "yuv420p"]
+            + ["-movflags", "+faststart", str(video)],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        ThrottledRangeRequestHandler.bytes_per_second = args.mbps * 1e6 / 8
+        handler = partial(ThrottledRangeRequestHandler, directory=temp_dir)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/video.mp4"
+
+        timestamps_ms = list(range(0, int(args.minutes * 60_000), int(args.step * 1000)))
+        size = video.stat().st_size
+        print(
+            f"{len(timestamps_ms)} timestamps, {size / 1024 / 1024:.1f}MB video,"
+            f" {args.mbps} Mbps"
+        )
+
+        ThrottledRangeRequestHandler.bytes_sent = 0
+        start = time.perf_counter()
+        downloaded = Path(temp_dir) / "downloaded.mp4"
+        with urllib.request.urlopen(url) as response, downloaded.open("wb") as file:
+            shutil.copyfileobj(response, file)
+        extract_frames(downloaded, Path(temp_dir) / "download", timestamps_ms)
+        elapsed = time.perf_counter() - start
+        sent = ThrottledRangeRequestHandler.bytes_sent
+        print(f"download  {elapsed:8.2f}s sent={sent / 1024 / 1024:7.1f}MB")
+
+        ThrottledRangeRequestHandler.bytes_sent = 0
+        start = time.perf_counter()
+        extract_frames(RemoteVideo(url=url), Path(temp_dir) / "stream", timestamps_ms)
+        elapsed = time.perf_counter() - start
+        sent = ThrottledRangeRequestHandler.bytes_sent
+        print(f"stream    {elapsed:8.2f}s sent={sent / 1024 / 1024:7.1f}MB")
+
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
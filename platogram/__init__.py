@@ -15,16 +15,26 @@
 #    min_duration=1.0,
 # )
 
-from platogram.ops import index, get_paragraphs  # noqa: E402
-from platogram.ingest import extract_transcript  # noqa: E402
-from platogram import llm, asr, library, ops  # noqa: E402
-from platogram.types import Content, SpeechEvent  # noqa: E402
+# Submodules and their dependencies (tqdm, yt_dlp, requests, the anthropic SDK) are imported
+# on first attribute access, so `import platogram` and CLI commands that only read the library
+# do not pay for them.
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from platogram.ops import index, index_incremental, index_stream, get_paragraphs, get_paragraphs_iter  # noqa: F401
+    from platogram.ingest import extract_transcript  # noqa: F401
+    from platogram import llm, asr, library, ops  # noqa: F401
+    from platogram.types import Content, SpeechEvent  # noqa: F401
 
 
 __all__ = [
     "index",
+    "index_incremental",
+    "index_stream",
     "extract_transcript",
     "get_paragraphs",
+    "get_paragraphs_iter",
     "llm",
     "asr",
     "library",
@@ -32,3 +42,32 @@ __all__ = [
     "Content",
     "SpeechEvent",
 ]
+
+_submodules = {"llm", "asr", "library", "ops"}
+
+_attributes = {
+    "index": "platogram.ops",
+    "index_incremental": "platogram.ops",
+    "index_stream": "platogram.ops",
+    "get_paragraphs": "platogram.ops",
+    "get_paragraphs_iter": "platogram.ops",
+    "extract_transcript": "platogram.ingest",
+    "Content": "platogram.types",
+    "SpeechEvent": "platogram.types",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _submodules:
+        value = importlib.import_module(f"{__name__}.{name}")
+    elif name in _attributes:
+        value = getattr(importlib.import_module(_attributes[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,45 @@
+import json
+import os
+import shutil
+from pathlib import Path
+
+from platogram.utils import get_sha256_hash
+
+
+class Checkpoint:
+    """
+    Persists results of every finished chunk of `get_paragraphs_iter` so that a failed run
+    can resume from the last completed chunk instead of starting over.
+
+    Each chunk is stored as `<home_dir>/<key>/<chunk index>.json` holding its paragraphs and,
+    in sequential mode, the tail carried into the next chunk.
+    """
+
+    def __init__(self, home_dir: Path, key: str) -> None:
+        self.dir = home_dir / key
+
+    def load(self) -> dict[int, dict]:
+        if not self.dir.exists():
+            return {}
+
+        chunks = {}
+        for file in self.dir.glob("*.json"):
+            with open(file, "r") as f:
+                chunks[int(file.stem)] = json.load(f)
+        return chunks
+
+    def save(self, i: int, paragraphs: list[str], tail: str | None = None) -> None:
+        self.dir.mkdir(parents=True, exist_ok=True)
+        file = self.dir / f"{i:06d}.json"
+        temp_file = file.with_suffix(".tmp")
+        with open(temp_file, "w") as f:
+            json.dump({"paragraphs": paragraphs, "tail": tail}, f)
+        os.replace(temp_file, file)
+
+    def clear(self) -> None:
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+
+def get_checkpoint_key(text: str, **params) -> str:
+    """Hash of the transcript and every parameter that changes chunking or LLM output."""
+    return get_sha256_hash(json.dumps({"text": text, **params}, sort_keys=True))
@@ -5,15 +5,16 @@ from pathlib import Path
 from typing import Callable, Literal, Sequence
 from urllib.parse import urlparse
 
-from tqdm import tqdm
-
 import platogram as plato
-import platogram.ingest as ingest
 from platogram.library import Library
+from platogram.library.storage import METADATA_FIELDS
+from platogram.llm.cache import ResponseCache
 from platogram.types import Assistant, Content, User
 from platogram.utils import make_filesystem_safe
 
 CACHE_DIR = Path("./.platogram-cache")
+CHECKPOINT_DIR = ".checkpoints"
+RESPONSE_CACHE_FILE = "llm-cache.sqlite"
 
 
 def format_time(ms):
@@ -23,7 +24,7 @@ def format_time(ms):
     return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
 
 
-def render_reference(url: str, transcript: list[plato.SpeechEvent], i: int) -> str:
+def render_reference(url: str, transcript: Sequence[plato.SpeechEvent], i: int) -> str:
     link = f" [[{i+1}]]({url}#t={transcript[i].time_ms // 1000})"
     return link
 
@@ -58,34 +59,60 @@ def process_url(
     anthropic_api_key: str,
     assemblyai_api_key: str | None = None,
     extract_images: bool = False,
+    stream_video: bool = False,
     lang: str | None = None,
+    cache: ResponseCache | None = None,
 ) -> Content:
+    from tqdm import tqdm
+
+    import platogram.ingest as ingest
+
     if not lang:
         lang = "en"
 
-    llm = plato.llm.get_model("anthropic/claude-3-5-sonnet", anthropic_api_key)
+    id = make_filesystem_safe(url)
+
+    if library.exists(id):
+        return library.get_content(id, fields=METADATA_FIELDS)
+
+    llm = plato.llm.get_model("anthropic/claude-3-5-sonnet", anthropic_api_key, cache=cache)
     asr = (
         plato.asr.get_model("assembly-ai/best", assemblyai_api_key)
         if assemblyai_api_key
         else None
     )
-    id = make_filesystem_safe(url)
-
-    if library.exists(id):
-        return library.get_content(id)
 
     with tqdm(total=4, desc=f"Processing {url}", file=sys.stderr) as pbar:
         transcript = plato.extract_transcript(url, asr, lang=lang)
         pbar.update(1)
         pbar.set_description("Indexing content")
-        content = plato.index(transcript, llm, lang=lang)
+        passages = []
+        fields = {}
+        for field, value in plato.index_stream(
+            transcript, llm, lang=lang, checkpoint_dir=library.home / CHECKPOINT_DIR
+        ):
+            if field == "paragraph":
+                passages.append(value)
+                pbar.set_description(f"Indexing content: {len(passages)} paragraphs")
+            else:
+                fields[field] = value
+                pbar.set_description(f"Indexing content: {field}")
+        content = Content(passages=passages, transcript=transcript, **fields)
         pbar.update(1)
         if extract_images:
             pbar.set_description("Extracting images")
             images_dir = library.home / id
             images_dir.mkdir(exist_ok=True)
             timestamps_ms = [event.time_ms for event in content.transcript]
-            images = ingest.extract_images(url, images_dir, timestamps_ms)
+            chapter_timestamps_ms = [
+                content.transcript[i].time_ms
+                for i in content.chapters
+                if 0 <= i < len(content.transcript)
+            ]
+            # One image per scene, content.images[i] is the image on screen at event i
+            images = ingest.extract_keyframes(
+                url, images_dir, timestamps_ms, chapter_timestamps_ms, stream=stream_video
+            )
             content.images = [str(image.relative_to(library.home)) for image in images]
             pbar.update(1)
         pbar.set_description("Saving content")
@@ -100,8 +127,9 @@ def prompt_context(
     prompt: Sequence[Assistant | User],
     context_size: Literal["small", "medium", "large"],
     anthropic_api_key: str | None,
+    cache: ResponseCache | None = None,
 ) -> str:
-    llm = plato.llm.get_model("anthropic/claude-3-5-sonnet", anthropic_api_key)
+    llm = plato.llm.get_model("anthropic/claude-3-5-sonnet", anthropic_api_key, cache=cache)
     response = llm.prompt(
         prompt=prompt,
         context=context,
@@ -145,10 +173,16 @@ def main():
     parser.add_argument("--chapters", action="store_true", help="Include chapters")
     parser.add_argument("--references", action="store_true", help="Include references")
     parser.add_argument("--images", action="store_true", help="Include images")
+    parser.add_argument(
+        "--stream-video",
+        action="store_true",
+        help="Extract images by seeking the remote video with range requests instead of "
+        "downloading it",
+    )
     parser.add_argument("--origin", action="store_true", help="Include origin URL")
     parser.add_argument(
         "--retrieval-method",
-        choices=["keyword", "semantic", "dumb"],
+        choices=["keyword", "semantic", "dumb", "sqlite"],
         default="dumb",
         help="Retrieval method",
     )
@@ -160,25 +194,61 @@ def main():
     parser.add_argument(
         "--inline-references", action="store_true", help="Render references inline"
     )
+    parser.add_argument(
+        "--cache-responses",
+        action="store_true",
+        help="Cache LLM responses on disk and reuse them for identical prompts",
+    )
+    parser.add_argument(
+        "--embedding-model",
+        default="openai/text-embedding-3-large",
+        help="Embedding model for semantic retrieval: openai/<model>, "
+        "local/all-MiniLM-L6-v2 (CPU, offline) or sentence-transformers/<model>",
+    )
+    parser.add_argument(
+        "--binary-storage",
+        action="store_true",
+        help="Store new documents in the memory-mapped binary format instead of JSON",
+    )
+    parser.add_argument(
+        "--migrate-library",
+        action="store_true",
+        help="Import JSON documents from the library directory into the SQLite library",
+    )
     args = parser.parse_args()
 
+    cache = ResponseCache(CACHE_DIR / RESPONSE_CACHE_FILE) if args.cache_responses else None
+
     if args.lang:
         lang = args.lang
     else:
         lang = "en"
 
     if args.retrieval_method == "semantic":
-        library = plato.library.get_semantic_local_chroma(CACHE_DIR)
+        library = plato.library.get_semantic_local_chroma(
+            CACHE_DIR, binary=args.binary_storage, embedding_model=args.embedding_model
+        )
     elif args.retrieval_method == "keyword":
-        library = plato.library.get_keyword_local_bm25(CACHE_DIR)
+        library = plato.library.get_keyword_local_bm25(CACHE_DIR, binary=args.binary_storage)
     elif args.retrieval_method == "dumb":
-        library = plato.library.get_local_dumb(CACHE_DIR)
+        library = plato.library.get_local_dumb(CACHE_DIR, binary=args.binary_storage)
+    elif args.retrieval_method == "sqlite":
+        library = plato.library.get_local_sqlite(CACHE_DIR)
     else:
         raise ValueError(f"Invalid retrieval method: {args.retrieval_method}")
 
+    if args.migrate_library:
+        from platogram.library.local_sqlite import LocalSQLiteLibrary, migrate_json_library
+
+        if not isinstance(library, LocalSQLiteLibrary):
+            raise ValueError("--migrate-library requires --retrieval-method sqlite")
+        for id in migrate_json_library(CACHE_DIR, library):
+            print(f"Migrated {id}", file=sys.stderr)
+
     if not args.inputs:
         ids = library.ls()
-        context = [library.get_content(id) for id in ids]
+        # Passages and transcript are loaded only if an option below reads them
+        context = [library.get_content(id, fields=METADATA_FIELDS) for id in ids]
     else:
         ids = [make_filesystem_safe(url_or_file) for url_or_file in args.inputs]
         context = [
@@ -188,14 +258,13 @@ def main():
                 args.anthropic_api_key,
                 args.assemblyai_api_key,
                 extract_images=args.images,
+                stream_video=args.stream_video,
                 lang=lang,
+                cache=cache,
             )
             for url_or_file in args.inputs
         ]
 
-    if args.retrieval_method == "keyword":
-        library.put(ids[0], context[0])
-
     if args.retrieve:
         n_results = int(args.retrieve)
         context, scores = library.retrieve(args.query, n_results, ids)
@@ -212,12 +281,12 @@ def main():
 
         result += f"""\n\n{
             prompt_context(
-                context, prompt, args.context_size, args.anthropic_api_key,
+                context, prompt, args.context_size, args.anthropic_api_key, cache=cache,
             )}\n\n"""
 
     for content in context:
         if args.images and content.images:
-            images = "\n".join([str(image) for image in content.images])
+            images = "\n".join(str(image) for image in dict.fromkeys(content.images))
             result += f"""{images}\n\n\n\n"""
 
         if args.origin:
@@ -0,0 +1,60 @@
+import json
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+EXAMPLES_DIR = Path(__file__).parent / "data" / "rewrite_examples"
+EXAMPLES_VERSION = 1
+
+registered_examples: dict[str, list[dict]] = {}
+registry_lock = threading.Lock()
+
+
+def load_examples_file(file: Path) -> list[dict]:
+    with open(file, "r") as f:
+        data = json.load(f)
+
+    if data.get("version") != EXAMPLES_VERSION:
+        raise ValueError(
+            f"Unsupported rewrite examples version in {file}: {data.get('version')}"
+        )
+    return data["examples"]
+
+
+def register_rewrite_examples(lang: str, examples: list[dict] | Path) -> None:
+    """
+    Registers rewrite examples for a language, replacing the bundled ones.
+    Args:
+        lang: Language code, e.g. "en".
+        examples: List of {"input": str, "output": list[str]} pairs, or a path to a
+            versioned examples file in the same format as the bundled ones.
+    """
+    if isinstance(examples, Path):
+        examples = load_examples_file(examples)
+
+    with registry_lock:
+        registered_examples[lang] = examples
+        get_rewrite_examples.cache_clear()
+
+
+def available_languages() -> list[str]:
+    return sorted(
+        {file.stem for file in EXAMPLES_DIR.glob("*.json")} | set(registered_examples)
+    )
+
+
+@lru_cache(maxsize=None)
+def get_rewrite_examples(lang: str) -> dict[str, list[str]]:
+    """
+    Rewrite examples for a language as a mapping of transcript to paragraphs.
+    Loaded from disk on first use and memoized. Do not mutate the result.
+    """
+    if lang in registered_examples:
+        examples = registered_examples[lang]
+    else:
+        file = EXAMPLES_DIR / f"{lang}.json"
+        if not file.exists():
+            raise ValueError(f"No rewrite examples for language: {lang}")
+        examples = load_examples_file(file)
+
+    return {str(example["input"]): list(example["output"]) for example in examples}
@@ -0,0 +1,362 @@
+import math
+import os
+import re
+import shutil
+import subprocess
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Literal
+
+from pydantic import BaseModel
+
+ImageFormat = Literal["png", "jpg", "webp"]
+
+MAX_TIMESTAMPS_PER_RANGE = 64
+MAX_RANGE_GAP_S = 5.0
+# Decode this far past the last timestamp of a range to find the frame that follows it
+RANGE_SLACK_S = 2.0
+# Timestamps past the last frame get the last frame, found within this many seconds of the end
+LAST_FRAME_WINDOW_S = 3.0
+SCENE_THRESHOLD = 0.3
+# Keyframes whose perceptual hashes differ in at most this many of 64 bits are duplicates
+MAX_HASH_DISTANCE = 6
+# Scene detection compares frames at this width
+SCENE_WIDTH = 160
+SHOWINFO_TIME_BASE_PATTERN = re.compile(r"config in time_base:\s*(\d+)/(\d+)")
+SHOWINFO_FRAME_PATTERN = re.compile(r"\bn:\s*(\d+)\s+pts:\s*(-?\d+)")
+ENCODER_OPTIONS: dict[str, list[str]] = {
+    "png": [],
+    "jpg": ["-q:v", "2"],
+    "webp": ["-c:v", "libwebp", "-quality", "80"],
+}
+
+
+class RemoteVideo(BaseModel):
+    """
+    Media URL that ffmpeg reads directly. Seeks become HTTP range requests, so only the
+    parts of the video around the extracted frames are transferred.
+    """
+
+    url: str
+    http_headers: dict[str, str] = {}
+
+    def __str__(self) -> str:
+        return self.url
+
+
+Video = Path | RemoteVideo
+
+
+def input_args(video: Video) -> list[str]:
+    if isinstance(video, RemoteVideo):
+        headers = "".join(f"{name}: {value}\r\n" for name, value in video.http_headers.items())
+        return (["-headers", headers] if headers else []) + ["-i", video.url]
+    return ["-i", str(video)]
+
+
+def select_expression(times_s: list[float]) -> str:
+    """
+    ffmpeg select expression that passes the first frame at or after each of `times_s`.
+    A frame is selected once even if it is the first frame after several of them.
+    """
+    terms = [
+        f"gte(t,{t:.3f})*(isnan(prev_selected_t)+lt(prev_selected_t,{t:.3f}))" for t in times_s
+    ]
+    return f"gt({'+'.join(terms)},0)"
+
+
+def parse_showinfo(log: str) -> list[tuple[int, Fraction]]:
+    """(frame number, time in seconds) of every frame in the log of an ffmpeg showinfo filter."""
+    time_base = Fraction(1)
+    frames = []
+    for line in log.splitlines():
+        if "showinfo" not in line:
+            continue
+        if match := SHOWINFO_TIME_BASE_PATTERN.search(line):
+            time_base = Fraction(int(match.group(1)), int(match.group(2)))
+        elif match := SHOWINFO_FRAME_PATTERN.search(line):
+            frames.append((int(match.group(1)), int(match.group(2)) * time_base))
+    return frames
+
+
+def split_ranges(times_s: list[float], workers: int) -> list[list[float]]:
+    """
+    Splits sorted times into contiguous ranges, at least one per worker. Gaps longer than
+    MAX_RANGE_GAP_S start a new range so that ffmpeg seeks over them instead of decoding.
+    """
+    size = max(1, min(MAX_TIMESTAMPS_PER_RANGE, -(-len(times_s) // workers)))
+    ranges: list[list[float]] = []
+    for t in times_s:
+        if not ranges or len(ranges[-1]) >= size or t - ranges[-1][-1] > MAX_RANGE_GAP_S:
+            ranges.append([])
+        ranges[-1].append(t)
+    return ranges
+
+
+def extract_range(
+    video: Video,
+    output_dir: Path,
+    times_s: list[float],
+    image_format: ImageFormat,
+    width: int | None,
+) -> list[tuple[float, Path]]:
+    """
+    Decodes `video` once from the first to the last of `times_s` and writes the
+    selected frames to `output_dir`.
+    Returns:
+        (time in seconds, image path) of every written frame, in time order.
+    """
+    start_s = times_s[0]
+    filters = [f"select='{select_expression([t - start_s for t in times_s])}'"]
+    if width:
+        filters.append(f"scale={width}:-2")
+    filters.append("showinfo")
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    command = [
+        "ffmpeg",
+        "-hide_banner",
+        "-nostats",
+        "-ss",
+        f"{start_s:.3f}",
+        "-t",
+        f"{times_s[-1] - start_s + RANGE_SLACK_S:.3f}",
+        *input_args(video),
+        "-an",
+        "-vf",
+        ",".join(filters),
+        "-fps_mode",
+        "passthrough",
+        *ENCODER_OPTIONS[image_format],
+        "-f",
+        "image2",
+        str(output_dir / f"frame_%06d.{image_format}"),
+    ]
+    result = subprocess.run(
+        command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+
+    return [
+        (start_s + float(time_s), output_dir / f"frame_{n + 1:06d}.{image_format}")
+        for n, time_s in parse_showinfo(result.stderr)
+    ]
+
+
+def extract_last_frame(
+    video: Video, output_dir: Path, image_format: ImageFormat, width: int | None
+) -> Path:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    image_path = output_dir / f"last.{image_format}"
+    subprocess.run(
+        ["ffmpeg", "-hide_banner", "-nostats", "-sseof", f"-{LAST_FRAME_WINDOW_S:.3f}"]
+        + [*input_args(video), "-an"]
+        + (["-vf", f"scale={width}:-2"] if width else [])
+        + ["-fps_mode", "passthrough", *ENCODER_OPTIONS[image_format]]
+        + ["-update", "1", "-f", "image2", str(image_path)],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    if not image_path.exists():
+        raise RuntimeError(f"No frames extracted from {video}")
+    return image_path
+
+
+def extract_frames(
+    video: Video,
+    output_dir: Path,
+    timestamps_ms: list[int],
+    image_format: ImageFormat = "png",
+    width: int | None = None,
+    workers: int | None = None,
+) -> list[Path]:
+    """
+    Extracts the first frame at or after each timestamp, decoding the video once.
+
+    The sorted timestamps are split into ranges that are decoded by parallel ffmpeg
+    processes; each process seeks to the start of its range and passes only the requested
+    frames through a select filter. Timestamps after the last frame get the last frame.
+
+    Args:
+        video: Local video file or remote video.
+        output_dir: Directory for images, named `image_<timestamp_ms>.<format>`.
+        timestamps_ms: Timestamps in milliseconds, in any order and with repeats.
+        image_format: "png", "jpg" or "webp".
+        width: Output width in pixels, keeping the aspect ratio. Source size if None.
+        workers: Number of parallel ffmpeg processes. Defaults to the number of CPUs.
+
+    Returns:
+        Image paths, one per timestamp in the order of `timestamps_ms`.
+    """
+    if not timestamps_ms:
+        return []
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    times_s = sorted({timestamp_ms / 1000 for timestamp_ms in timestamps_ms})
+    ranges = split_ranges(times_s, workers or os.cpu_count() or 1)
+
+    with TemporaryDirectory(dir=output_dir) as temp_dir:
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            futures = [
+                executor.submit(
+                    extract_range,
+                    video,
+                    Path(temp_dir) / f"range_{i:05d}",
+                    times,
+                    image_format,
+                    width,
+                )
+                for i, times in enumerate(ranges)
+            ]
+            frames = sorted(frame for future in futures for frame in future.result())
+
+        if not frames or frames[-1][0] < times_s[-1] - 0.0001:
+            last_frame = extract_last_frame(video, Path(temp_dir), image_format, width)
+            frames.append((math.inf, last_frame))
+
+        frame_for_time: dict[float, Path] = {}
+        i = 0
+        for t in times_s:
+            # Tolerate float error in the start of the range plus the frame time
+            while i < len(frames) - 1 and frames[i][0] < t - 0.0001:
+                i += 1
+            frame_for_time[t] = frames[i][1]
+
+        image_paths = []
+        for timestamp_ms in timestamps_ms:
+            image_path = output_dir / f"image_{timestamp_ms:09d}.{image_format}"
+            if not image_path.exists():
+                shutil.copyfile(frame_for_time[timestamp_ms / 1000], image_path)
+            image_paths.append(image_path)
+
+    return image_paths
+
+
+def difference_hash(pixels: bytes) -> int:
+    """64-bit difference hash of a 9x8 grayscale image: one bit per horizontal neighbour pair."""
+    bits = 0
+    for row in range(8):
+        for column in range(8):
+            i = row * 9 + column
+            bits = (bits << 1) | (pixels[i] < pixels[i + 1])
+    return bits
+
+
+def detect_keyframes(
+    video: Video,
+    chapter_timestamps_ms: list[int] | None = None,
+    scene_threshold: float = SCENE_THRESHOLD,
+) -> list[tuple[int, int]]:
+    """
+    Finds the first frame, the first frames of scenes and the first frame at or after each
+    chapter timestamp, in one decoding pass over a downscaled video.
+
+    Returns:
+        (time in milliseconds, difference hash) of each keyframe, in time order. Times are
+        rounded down, so that extracting at them yields the same frames.
+    """
+    times_s = sorted({timestamp_ms / 1000 for timestamp_ms in chapter_timestamps_ms or []})
+    expression = f"gt(scene,{scene_threshold})+eq(n,0)"
+    if times_s:
+        expression += f"+{select_expression(times_s)}"
+    filters = [
+        f"scale={SCENE_WIDTH}:-2",
+        f"select='{expression}'",
+        "showinfo",
+        "scale=9:8",
+        "format=gray",
+    ]
+    result = subprocess.run(
+        ["ffmpeg", "-hide_banner", "-nostats", *input_args(video), "-an"]
+        + ["-vf", ",".join(filters), "-fps_mode", "passthrough", "-f", "rawvideo", "-"],
+        check=True,
+        capture_output=True,
+    )
+
+    frames = parse_showinfo(result.stderr.decode(errors="replace"))
+    pixels = result.stdout
+    return [
+        (math.floor(time_s * 1000), difference_hash(pixels[i * 72 : (i + 1) * 72]))
+        for i, (_, time_s) in enumerate(frames)
+    ]
+
+
+def deduplicate_keyframes(
+    keyframes: list[tuple[int, int]], max_distance: int = MAX_HASH_DISTANCE
+) -> dict[int, int]:
+    """
+    Maps the time of each keyframe to the time of the earliest keyframe that looks the same,
+    e.g. a slide shown again after a cut to the speaker.
+    """
+    representatives: list[tuple[int, int]] = []
+    mapping = {}
+    for time_ms, image_hash in keyframes:
+        for representative_ms, representative_hash in representatives:
+            if (image_hash ^ representative_hash).bit_count() <= max_distance:
+                mapping[time_ms] = representative_ms
+                break
+        else:
+            representatives.append((time_ms, image_hash))
+            mapping[time_ms] = time_ms
+    return mapping
+
+
+def extract_keyframes(
+    video: Video,
+    output_dir: Path,
+    timestamps_ms: list[int],
+    chapter_timestamps_ms: list[int] | None = None,
+    image_format: ImageFormat = "png",
+    width: int | None = None,
+    scene_threshold: float = SCENE_THRESHOLD,
+    max_distance: int = MAX_HASH_DISTANCE,
+    scene_video: Video | None = None,
+) -> list[Path]:
+    """
+    Extracts one image per distinct scene instead of one per timestamp.
+
+    Keyframes are taken at scene changes and chapter boundaries, near-duplicates are
+    dropped by perceptual hash, and each timestamp gets the image of the keyframe that was on
+    screen at that time.
+
+    Args:
+        video: Local video file or remote video.
+        output_dir: Directory for images, named `image_<keyframe time in ms>.<format>`.
+        timestamps_ms: Timestamps in milliseconds, e.g. of every transcript event.
+        chapter_timestamps_ms: Timestamps in milliseconds that always start a new keyframe.
+        image_format: "png", "jpg" or "webp".
+        width: Output width in pixels, keeping the aspect ratio. Source size if None.
+        scene_threshold: Scene change score from 0 to 1 above which a frame starts a scene.
+        max_distance: Keyframes with hashes at most this many bits apart are duplicates.
+        scene_video: Rendition of `video` to detect scenes in, e.g. the smallest one of a
+            remote video, which is decoded in full. `video` itself if None. Only the
+            distinct keyframes are read from `video`.
+
+    Returns:
+        Image paths, one per timestamp in the order of `timestamps_ms`. Paths repeat for
+        timestamps within the same scene.
+    """
+    if not timestamps_ms:
+        return []
+
+    keyframes = detect_keyframes(scene_video or video, chapter_timestamps_ms, scene_threshold)
+    if not keyframes:
+        raise RuntimeError(f"No frames extracted from {video}")
+
+    mapping = deduplicate_keyframes(keyframes, max_distance)
+    representatives = sorted(set(mapping.values()))
+    images = dict(
+        zip(
+            representatives,
+            extract_frames(video, output_dir, representatives, image_format, width),
+        )
+    )
+
+    keyframe_times = [time_ms for time_ms, _ in keyframes]
+    return [
+        images[mapping[keyframe_times[max(bisect_right(keyframe_times, timestamp_ms) - 1, 0)]]]
+        for timestamp_ms in timestamps_ms
+    ]
@@ -1,13 +1,22 @@
+import copy
+import hashlib
 import logging
 import mimetypes
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from functools import lru_cache
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from typing import Iterator, Sequence
 
 import requests  # type: ignore
+from requests.adapters import HTTPAdapter  # type: ignore
 from yt_dlp import YoutubeDL  # type: ignore
-import subprocess
 
+from platogram import frames
+from platogram.frames import ImageFormat, RemoteVideo, Video, extract_frames
 from platogram.parsers import parse_subtitles, parse_waffly
 from platogram.asr import ASRModel
 from platogram.types import SpeechEvent
@@ -16,18 +25,67 @@ from platogram.utils import get_sha256_hash
 
 logger = logging.getLogger(__name__)
 
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_MAX_RETRIES = 5
+MAX_MEDIA_SESSIONS = 32
+# Signed media URLs of e.g. YouTube are valid for a few hours
+MEDIA_SESSION_TTL_S = 30 * 60
+
+
+class MediaSession:
+    """
+    One yt-dlp resolution of a URL, shared by everything ingest does with it.
+
+    The page and its formats are resolved once, without processing. Downloads of subtitles,
+    audio and video, and stream lookups, then select formats from a copy of the cached info
+    with their own options instead of resolving the URL again. The info is resolved again
+    after `ttl_s`, before signed format URLs expire. Failures are not cached.
+    """
+
+    def __init__(self, url: str, ttl_s: float = MEDIA_SESSION_TTL_S) -> None:
+        self.url = url
+        self.ttl_s = ttl_s
+        self.lock = threading.Lock()
+        self.info: dict | None = None
+        self.extracted_at = 0.0
+
+    def extract(self) -> dict:
+        with self.lock:
+            if self.info is None or time.monotonic() - self.extracted_at > self.ttl_s:
+                with YoutubeDL({"quiet": True}) as ydl:
+                    self.info = ydl.extract_info(self.url, download=False, process=False)
+                self.extracted_at = time.monotonic()
+            return self.info  # type: ignore
+
+    def process(self, params: dict, download: bool = True) -> dict:
+        """Runs format selection, and downloads unless `download` is False, with `params`."""
+        with YoutubeDL({"quiet": True, **params}) as ydl:
+            info = copy.deepcopy(self.extract())
+            return ydl.process_ie_result(info, download=download)
+
+
+media_sessions: OrderedDict[str, MediaSession] = OrderedDict()
+media_sessions_lock = threading.Lock()
+
+
+def get_media_session(url: str) -> MediaSession:
+    """Session for `url`, shared by callers. The MAX_MEDIA_SESSIONS most recent are kept."""
+    with media_sessions_lock:
+        session = media_sessions.get(url)
+        if session is None:
+            session = media_sessions[url] = MediaSession(url)
+        media_sessions.move_to_end(url)
+        while len(media_sessions) > MAX_MEDIA_SESSIONS:
+            media_sessions.popitem(last=False)
+        return session
 
-@lru_cache(maxsize=None)
-def get_metadata(url: str) -> dict:
-    ydl_opts = {"skip_download": True, "quiet": True}
-    with YoutubeDL(ydl_opts) as ydl:
-        try:
-            meta = ydl.extract_info(url, download=False)
-        except Exception as e:
-            logger.warning(f"Failed to extract metadata: {e}")
-            return {}
 
-    return meta  # type: ignore
+def get_metadata(url: str) -> dict:
+    try:
+        return get_media_session(url).extract()
+    except Exception as e:
+        logger.warning(f"Failed to extract metadata: {e}")
+        return {}
 
 
 def has_subtitles(url: str) -> bool:
@@ -54,7 +112,7 @@ def download_subtitles(url: str, output_dir: Path, lang: str | None = None) -> P
             lang = subtitle_lang
             break
 
-    with YoutubeDL(
+    get_media_session(url).process(
         {
             "writesubtitles": True,
             "writeautomaticsub": True,
@@ -62,11 +120,9 @@ def download_subtitles(url: str, output_dir: Path, lang: str | None = None) -> P
             "subtitlesformat": "vtt",
             "outtmpl": str(output_dir / "subtitles"),
             "skip_download": True,
-            "quiet": True,
         }
-    ) as ydl:
-        ydl.download([url])
-        return output_dir / f"subtitles.{lang}.vtt"
+    )
+    return output_dir / f"subtitles.{lang}.vtt"
 
 
 def get_id(url: str) -> str:
@@ -87,20 +143,17 @@ def download_video(url: str, output_dir: Path) -> Path | None:
         return Path(url.replace("file://", ""))
 
     try:
-        with YoutubeDL(
+        get_media_session(url).process(
             {
                 "format": "bestvideo/best",
                 "outtmpl": f"{file_path}.%(ext)s",
                 "external-downloader": "aria2c",
                 "external-downloader-args": "-c -j 3 -x 3 -s 3 -k 1M",
-                "quiet": True,
             }
-        ) as ydl:
-            ydl.download([url])
-
-            for file in output_dir.glob(f"{filename}.*"):
-                file_path = file
-            return file_path
+        )
+        for file in output_dir.glob(f"{filename}.*"):
+            file_path = file
+        return file_path
     except Exception as e:
         logger.warning(f"Failed to download video: {e}")
         return None
@@ -113,95 +166,205 @@ def download_audio(url: str, output_dir: Path) -> Path:
     if url.lower().startswith("file://"):
         return Path(url.replace("file://", ""))
 
-    with YoutubeDL(
+    get_media_session(url).process(
         {
             "format": "bestaudio/best",
             "outtmpl": f"{file_path}.%(ext)s",
             "external-downloader": "aria2c",
             "external-downloader-args": "-c -j 3 -x 3 -s 3 -k 1M",
-            "quiet": True,
         }
-    ) as ydl:
-        ydl.download([url])
+    )
+    for file in output_dir.glob(f"{filename}.*"):
+        file_path = file
+    return file_path
 
-        for file in output_dir.glob(f"{filename}.*"):
-            file_path = file
-        return file_path
 
+@lru_cache(maxsize=None)
+def get_session() -> requests.Session:
+    """Session shared by all downloads, so that connections to the same host are reused."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def download_file(
+    url: str,
+    output_dir: Path,
+    chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    sha256: str | None = None,
+    max_retries: int = DOWNLOAD_MAX_RETRIES,
+) -> Path:
+    """
+    Streams `url` to `output_dir` in chunks of `chunk_size` bytes, so memory use does not
+    depend on the file size. A dropped connection is resumed with a range request where
+    the server supports it, and restarted otherwise.
+
+    Args:
+        sha256: Expected hex digest of the file. Raises ValueError on mismatch.
+        max_retries: Number of times to resume after a connection error.
 
-def download_file(url: str, output_dir: Path) -> Path:
+    Returns:
+        Path: `asset<extension>` in `output_dir`, with the extension from Content-Type.
+    """
     if url.lower().startswith("file://"):
         return Path(url.replace("file://", ""))
 
-    with requests.get(url) as response:
-        response.raise_for_status()
-        content_type = response.headers.get("Content-Type", None)
-        assert content_type is not None, "Content-Type header not found"
-        extension = mimetypes.guess_extension(content_type)
-        file = output_dir / f"asset{extension}"
-        file.write_bytes(response.content)
-        return file
+    session = get_session()
+    partial_file = output_dir / "asset.part"
+    digest = hashlib.sha256()
+    offset = 0
+    with partial_file.open("wb") as f:
+        for attempt in range(max_retries + 1):
+            headers = {"Range": f"bytes={offset}-"} if offset else {}
+            try:
+                with session.get(url, headers=headers, stream=True, timeout=60) as response:
+                    response.raise_for_status()
+                    if offset and response.status_code != 206:
+                        # Range not supported, start over
+                        f.seek(0)
+                        f.truncate()
+                        digest, offset = hashlib.sha256(), 0
+
+                    content_type = response.headers.get("Content-Type", None)
+                    assert content_type is not None, "Content-Type header not found"
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        f.write(chunk)
+                        digest.update(chunk)
+                        offset += len(chunk)
+                break
+            except (requests.ConnectionError, requests.exceptions.ChunkedEncodingError) as e:
+                if attempt == max_retries:
+                    raise
+                logger.warning(f"Download interrupted at {offset} bytes, resuming: {e}")
+
+    if sha256 is not None and digest.hexdigest() != sha256.lower():
+        partial_file.unlink()
+        raise ValueError(f"Checksum mismatch for {url}: {digest.hexdigest()} != {sha256}")
+
+    extension = mimetypes.guess_extension(content_type.split(";")[0].strip())
+    file = output_dir / f"asset{extension}"
+    partial_file.replace(file)
+    return file
+
+
+def get_stream(url: str, width: int | None = None) -> RemoteVideo:
+    """
+    Resolves the media URL of a video without downloading it. Picks the smallest video
+    rendition at least `width` pixels wide if `width` is given, else the best one.
+    """
+    if url.lower().startswith("file://"):
+        raise ValueError(f"Not a remote video: {url}")
+
+    # DASH fragments can't be read by ffmpeg as a single URL
+    format_selector = "bestvideo[protocol!*=dash]/best[protocol!*=dash]"
+    if width:
+        format_selector = f"worstvideo[width>={width}][protocol!*=dash]/{format_selector}"
+    info = get_media_session(url).process({"format": format_selector}, download=False)
+    formats = info.get("requested_formats") or [info]  # type: ignore
+    return RemoteVideo(url=formats[0]["url"], http_headers=formats[0].get("http_headers", {}))
+
+
+@contextmanager
+def open_video(
+    url: str, output_dir: Path, stream: bool = False, width: int | None = None
+) -> Iterator[Video]:
+    if stream and not url.lower().startswith("file://"):
+        yield get_stream(url, width)
+        return
+
+    video_path = download_video(url, output_dir)
+    if video_path is None:
+        raise RuntimeError(f"Failed to download video: {url}")
+
+    try:
+        yield video_path
+    finally:
+        # Delete the downloaded video file, but never a local file passed in by the caller
+        if not url.lower().startswith("file://"):
+            video_path.unlink(missing_ok=True)
 
 
 def extract_images(
-    url: str, output_dir: Path, timestamps_ms: list[int] | None = None
+    url: str,
+    output_dir: Path,
+    timestamps_ms: list[int] | None = None,
+    image_format: ImageFormat = "png",
+    width: int | None = None,
+    stream: bool = False,
 ) -> list[Path]:
     """
     Extracts images from a video at the specified timestamps.
 
+    The video is decoded once for all timestamps, see `platogram.frames.extract_frames`.
+
     Args:
         url (str): The URL of the video.
         timestamps_ms (list[int], optional): A list of timestamps in milliseconds at which to extract images.
             If not provided, a single image will be extracted at the start of the video.
+        image_format (str): "png", "jpg" or "webp".
+        width (int, optional): Image width in pixels, keeping the aspect ratio.
+        stream (bool): Read the frames from the remote video with range requests instead of
+            downloading it first, picking the smallest rendition at least `width` wide.
 
     Returns:
-        list[Path]: A list of file paths to the extracted images.
+        list[Path]: A list of file paths to the extracted images, one per timestamp.
     """
-    video_path = download_video(url, output_dir)
-
     if timestamps_ms is None:
         timestamps_ms = [0]
 
-    image_paths = []
-    try:
-        for timestamp_ms in timestamps_ms:
-            timestamp_s = timestamp_ms / 1000
-            image_path = Path(output_dir) / f"image_{timestamp_ms:09d}.png"
-
-            subprocess.run(
-                [
-                    "ffmpeg",
-                    "-ss",
-                    f"{timestamp_s:.3f}",
-                    "-i",
-                    str(video_path),
-                    "-frames:v",
-                    "1",
-                    "-q:v",
-                    "2",
-                    "-f",
-                    "image2",
-                    str(image_path),
-                ],
-                check=True,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
+    with open_video(url, output_dir, stream, width) as video:
+        return extract_frames(video, output_dir, timestamps_ms, image_format, width)
 
-            image_paths.append(image_path)
-    finally:
-        # Delete the downloaded video file
-        if video_path:
-            video_path.unlink()
 
-    return image_paths
+def extract_keyframes(
+    url: str,
+    output_dir: Path,
+    timestamps_ms: list[int],
+    chapter_timestamps_ms: list[int] | None = None,
+    image_format: ImageFormat = "png",
+    width: int | None = None,
+    stream: bool = False,
+) -> list[Path]:
+    """
+    Extracts images at scene changes and chapter boundaries, without near-duplicates.
+
+    Args:
+        url (str): The URL of the video.
+        timestamps_ms (list[int]): Timestamps in milliseconds, e.g. of every transcript event.
+        chapter_timestamps_ms (list[int], optional): Chapter start times in milliseconds.
+        image_format (str): "png", "jpg" or "webp".
+        width (int, optional): Image width in pixels, keeping the aspect ratio.
+        stream (bool): Read the remote video with range requests instead of downloading it.
+            Scenes are detected in the smallest rendition at least SCENE_WIDTH wide.
+
+    Returns:
+        list[Path]: The image on screen at each timestamp. Timestamps within the same scene
+            share the same file.
+    """
+    with open_video(url, output_dir, stream, width) as video:
+        # Scene detection decodes the whole video: read the smallest rendition for it, and
+        # only the distinct keyframes from the output rendition
+        scene_video = None
+        if isinstance(video, RemoteVideo):
+            scene_video = get_stream(url, frames.SCENE_WIDTH)
+        return frames.extract_keyframes(
+            video,
+            output_dir,
+            timestamps_ms,
+            chapter_timestamps_ms,
+            image_format,
+            width,
+            scene_video=scene_video,
+        )
 
 
 def extract_transcript(
     url: str, asr_model: ASRModel | None = None, lang: str | None = None
-) -> list[SpeechEvent]:
+) -> Sequence[SpeechEvent]:
     """
-    Slurps content from a given URL and returns a list of SpeechEvent objects.
+    Slurps content from a given URL and returns a sequence of SpeechEvent objects.
 
     This function can handle various types of content, including:
     - Audio/video content
@@ -220,7 +383,8 @@ def extract_transcript(
         url (str): The URL of the content to slurp.
 
     Returns:
-        list[SpeechEvent]: A list of SpeechEvent objects representing the slurped content.
+        Sequence[SpeechEvent]: SpeechEvent objects representing the slurped content. Waffly
+            imports return a columnar Transcript.
     """
     with TemporaryDirectory() as temp_dir:
         if url.lower().startswith("https://api.waffly"):
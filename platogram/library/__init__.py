@@ -1,6 +1,7 @@
 from pathlib import Path
-from typing import Protocol
+from typing import Protocol, Sequence
 
+from platogram.library.cache import ContentCache, content_cache  # noqa: F401
 from platogram.types import Content
 
 
@@ -21,22 +22,44 @@ class Library(Protocol):
         filter_keys: list[str],
     ) -> tuple[list[Content], list[float]]: ...
 
-    def get_content(self, id: str) -> Content: ...
+    def get_content(self, id: str, fields: Sequence[str] | None = None) -> Content:
+        """
+        Reads a document. If `fields` is given, only those Content fields are loaded up front
+        and the others, such as `transcript` and `passages`, are loaded on first access.
+        """
+        ...
 
 
-def get_semantic_local_chroma(home_dir: Path = Path("./my_library")) -> Library:
+def get_semantic_local_chroma(
+    home_dir: Path = Path("./my_library"),
+    binary: bool = False,
+    embedding_model: str = "openai/text-embedding-3-large",
+    batch_size: int = 64,
+) -> Library:
     from .semantic_local_chroma import LocalChromaLibrary
 
-    return LocalChromaLibrary(home_dir)
+    return LocalChromaLibrary(
+        home_dir, binary=binary, embedding_model=embedding_model, batch_size=batch_size
+    )
 
 
-def get_keyword_local_bm25(home_dir: Path = Path("./my_library")) -> Library:
+def get_keyword_local_bm25(
+    home_dir: Path = Path("./my_library"), binary: bool = False
+) -> Library:
     from .keyword_local_bm25 import LocalBM25Library
 
-    return LocalBM25Library(home_dir)
+    return LocalBM25Library(home_dir, binary=binary)
 
 
-def get_local_dumb(home_dir: Path = Path("./my_library")) -> Library:
+def get_local_dumb(
+    home_dir: Path = Path("./my_library"), binary: bool = False
+) -> Library:
     from .local_dumb import LocalDumbLibrary
 
-    return LocalDumbLibrary(home_dir)
\ No newline at end of file
+    return LocalDumbLibrary(home_dir, binary=binary)
+
+
+def get_local_sqlite(home_dir: Path = Path("./my_library")) -> Library:
+    from .local_sqlite import LocalSQLiteLibrary
+
+    return LocalSQLiteLibrary(home_dir)
@@ -0,0 +1,126 @@
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Sequence
+
+from platogram.types import Content, LazyContent, Transcript
+
+MAGIC = b"PLATOBIN"
+VERSION = 1
+PREAMBLE = struct.Struct("<8sII")  # magic, version, header length
+ALIGNMENT = 8
+
+
+def write_binary(file: Path, content: Content) -> None:
+    """
+    Writes content in the binary library format:
+
+        preamble | JSON header | padding | sections
+
+    The header holds the metadata fields, speaker names and the offset and length of each
+    section. Sections are the Transcript columns and the passages as offsets into one UTF-8
+    buffer, each aligned to 8 bytes so they can be cast in place from a memory map.
+
+    The file is written to a temporary path and renamed, so readers that still map the
+    previous version keep a valid mapping.
+    """
+    transcript = Transcript.from_events(content.transcript)
+    passage_offsets = array("q", [0])
+    passage_buffer = bytearray()
+    for passage in content.passages:
+        passage_buffer += passage.encode()
+        passage_offsets.append(len(passage_buffer))
+
+    blobs = {
+        "times": bytes(transcript.times),
+        "text_offsets": bytes(transcript.offsets),
+        "texts": bytes(transcript.buffer),
+        "speaker_ids": bytes(transcript.speaker_ids),
+        "passage_offsets": bytes(passage_offsets),
+        "passages": bytes(passage_buffer),
+    }
+
+    sections: dict[str, list[int]] = {}
+    offset = 0
+    for name, blob in blobs.items():
+        sections[name] = [offset, len(blob)]
+        offset += len(blob) + padding(len(blob))
+
+    header = json.dumps(
+        {
+            "title": content.title,
+            "summary": content.summary,
+            "chapters": content.chapters,
+            "images": content.images,
+            "origin": content.origin,
+            "byteorder": sys.byteorder,
+            "speakers": transcript.speakers,
+            "sections": sections,
+        }
+    ).encode()
+
+    temp_file = file.with_suffix(".tmp")
+    with open(temp_file, "wb") as f:
+        f.write(PREAMBLE.pack(MAGIC, VERSION, len(header)))
+        f.write(header)
+        f.write(b"\0" * padding(PREAMBLE.size + len(header)))
+        for blob in blobs.values():
+            f.write(blob)
+            f.write(b"\0" * padding(len(blob)))
+    os.replace(temp_file, file)
+
+
+def padding(size: int) -> int:
+    return -size % ALIGNMENT
+
+
+def read_binary(file: Path, fields: Sequence[str] | None = None) -> Content:
+    """
+    Reads content written by `write_binary` without validating it. Transcript columns are
+    zero-copy views of a read-only memory map; passages are decoded on first access if not
+    in `fields`.
+    """
+    with open(file, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        data = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)) if size else None
+
+    if data is None or len(data) < PREAMBLE.size:
+        raise ValueError(f"Not a platogram binary file: {file}")
+    magic, version, header_size = PREAMBLE.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Unsupported platogram binary file: {file}")
+
+    header = json.loads(bytes(data[PREAMBLE.size : PREAMBLE.size + header_size]))
+    if header["byteorder"] != sys.byteorder:
+        raise ValueError(f"Platogram binary file has {header['byteorder']}-endian columns: {file}")
+    base = PREAMBLE.size + header_size
+    base += padding(base)
+
+    def section(name: str) -> memoryview:
+        offset, length = header["sections"][name]
+        return data[base + offset : base + offset + length]
+
+    def load(name: str) -> Any:
+        if name == "transcript":
+            return Transcript(
+                section("times").cast("q"),
+                section("text_offsets").cast("q"),
+                section("texts"),
+                section("speaker_ids").cast("i"),
+                header["speakers"],
+            )
+        if name == "passages":
+            offsets = section("passage_offsets").cast("q")
+            buffer = section("passages")
+            return [str(buffer[start:end], "utf-8") for start, end in zip(offsets, offsets[1:])]
+        if name == "chapters":
+            return {int(marker): title for marker, title in header["chapters"].items()}
+        return header[name]
+
+    if fields is None:
+        return Content.model_construct(**{name: load(name) for name in Content.model_fields})
+    return LazyContent.partial(load, **{name: load(name) for name in fields})
@@ -0,0 +1,428 @@
+import fcntl
+import json
+import math
+import os
+import shutil
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import numpy as np
+except ImportError:
+    pass
+
+from platogram.library.cache import Stamp, file_stamp
+
+MANIFEST_FILE = "manifest.json"
+LOCK_FILE = "LOCK"
+MERGE_FACTOR = 4
+K1 = 1.5
+B = 0.75
+
+
+class Segment:
+    """
+    Immutable, memory-mapped BM25 postings for the passages of one or more documents.
+
+    Postings are stored in CSR layout by term: entries of `docs` and `tfs` between
+    `indptr[t]` and `indptr[t + 1]` belong to term `t` of `vocab`. Row `r` of the segment is
+    passage `passage_index[r]` of document `ids[id_index[r]]`.
+    """
+
+    def __init__(self, path: Path, seq: int) -> None:
+        self.path = path
+        self.seq = seq
+        with open(path / "vocab.json", "r") as f:
+            self.vocab: dict[str, int] = json.load(f)
+        with open(path / "ids.json", "r") as f:
+            self.ids: list[str] = json.load(f)
+        self.indptr = np.load(path / "indptr.npy", mmap_mode="r")
+        self.docs = np.load(path / "docs.npy", mmap_mode="r")
+        self.tfs = np.load(path / "tfs.npy", mmap_mode="r")
+        self.lengths = np.load(path / "lengths.npy", mmap_mode="r")
+        self.id_index = np.load(path / "id_index.npy", mmap_mode="r")
+        self.passage_index = np.load(path / "passage_index.npy", mmap_mode="r")
+        self.id_positions = {id: i for i, id in enumerate(self.ids)}
+        self.live = np.ones(len(self.lengths), dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    def apply_tombstones(self, tombstones: dict[str, int]) -> None:
+        dead = np.array([tombstones.get(id, -1) > self.seq for id in self.ids], dtype=bool)
+        self.live = ~dead[self.id_index] if len(dead) else np.ones(len(self), dtype=bool)
+
+    def delete(self, id: str) -> bool:
+        """Hides rows of `id`. Returns whether any of them were live."""
+        position = self.id_positions.get(id)
+        if position is None:
+            return False
+        rows = (np.asarray(self.id_index) == position) & self.live
+        self.live &= ~rows
+        return bool(rows.any())
+
+    def postings(self, term: str) -> tuple["np.ndarray", "np.ndarray"]:
+        t = self.vocab.get(term)
+        if t is None:
+            return np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.float32)
+        start, end = self.indptr[t], self.indptr[t + 1]
+        return self.docs[start:end], self.tfs[start:end]
+
+    @staticmethod
+    def write(
+        path: Path,
+        vocab: dict[str, int],
+        ids: list[str],
+        postings: tuple["np.ndarray", "np.ndarray", "np.ndarray"],
+        lengths: "np.ndarray",
+        id_index: "np.ndarray",
+        passage_index: "np.ndarray",
+    ) -> None:
+        indptr, docs, tfs = postings
+        temp_path = path.with_suffix(".tmp")
+        shutil.rmtree(temp_path, ignore_errors=True)
+        temp_path.mkdir(parents=True)
+        with open(temp_path / "vocab.json", "w") as f:
+            json.dump(vocab, f)
+        with open(temp_path / "ids.json", "w") as f:
+            json.dump(ids, f)
+        np.save(temp_path / "indptr.npy", indptr.astype(np.int64))
+        np.save(temp_path / "docs.npy", docs.astype(np.int32))
+        np.save(temp_path / "tfs.npy", tfs.astype(np.float32))
+        np.save(temp_path / "lengths.npy", lengths.astype(np.int32))
+        np.save(temp_path / "id_index.npy", id_index.astype(np.int32))
+        np.save(temp_path / "passage_index.npy", passage_index.astype(np.int32))
+        os.replace(temp_path, path)
+
+
+def build_postings(
+    terms: list["np.ndarray"],
+    docs: list["np.ndarray"],
+    tfs: list["np.ndarray"],
+    n_terms: int,
+) -> tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Sorts (term, row, term frequency) triples by term and row into CSR arrays."""
+    term_ids = np.concatenate(terms) if terms else np.zeros(0, dtype=np.int64)
+    rows = np.concatenate(docs) if docs else np.zeros(0, dtype=np.int64)
+    freqs = np.concatenate(tfs) if tfs else np.zeros(0, dtype=np.float32)
+    order = np.lexsort((rows, term_ids))
+    indptr = np.zeros(n_terms + 1, dtype=np.int64)
+    np.cumsum(np.bincount(term_ids, minlength=n_terms), out=indptr[1:])
+    return indptr, rows[order], freqs[order]
+
+
+class SegmentedBM25Index:
+    """
+    BM25 index over tokenized passages that supports adding and deleting documents
+    without rebuilding, in the style of a log-structured merge tree.
+
+    Every `add` writes a new immutable segment. Deletes and overwrites are recorded as
+    tombstones `{document id: seq}` that hide rows of that document in segments older than
+    `seq`. After each write, runs of `MERGE_FACTOR` segments of the same size tier are merged
+    and their dead rows dropped; `compact` merges everything into one segment.
+
+    Queries score live rows of all segments with corpus statistics (passage count, average
+    length and document frequencies) computed over live rows only, so results match an index
+    built from scratch over the same passages.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.next_seq = 0
+        self.tombstones: dict[str, int] = {}
+        self.segments: list[Segment] = []
+        self.manifest_stamp: Stamp | None = None
+        self.load()
+
+    def exists(self) -> bool:
+        return (self.path / MANIFEST_FILE).exists()
+
+    @contextmanager
+    def locked(self, operation: int) -> Iterator[None]:
+        """
+        Holds a lock on the index directory, shared between processes and instances.
+        Writers hold it exclusively from reading the manifest to saving it, so concurrent
+        writers never reuse a seq or segment name and never lose each other's segments.
+        """
+        with open(self.path / LOCK_FILE, "a") as lock_file:
+            fcntl.flock(lock_file, operation)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @contextmanager
+    def writing(self) -> Iterator[None]:
+        """Exclusive lock with the latest manifest loaded and leftovers of crashes removed."""
+        with self.locked(fcntl.LOCK_EX):
+            self.reload()
+            # No other writer runs while the lock is held, so any unreferenced directory
+            # was left behind by an interrupted write or merge
+            referenced = {segment.path.name for segment in self.segments}
+            for dir in self.path.iterdir():
+                if dir.is_dir() and dir.name not in referenced:
+                    shutil.rmtree(dir, ignore_errors=True)
+            yield
+
+    def load(self) -> None:
+        """Picks up changes saved by other writers."""
+        with self.locked(fcntl.LOCK_SH):
+            self.reload()
+
+    def reload(self) -> None:
+        stamp = file_stamp(self.path / MANIFEST_FILE)
+        if stamp == self.manifest_stamp:
+            return
+        self.manifest_stamp = stamp
+        if not self.exists():
+            self.next_seq, self.tombstones, self.segments = 0, {}, []
+            return
+
+        with open(self.path / MANIFEST_FILE, "r") as f:
+            manifest = json.load(f)
+        self.next_seq = manifest["next_seq"]
+        self.tombstones = manifest["tombstones"]
+        loaded = {segment.path.name: segment for segment in self.segments}
+        self.segments = [
+            loaded[name] if name in loaded else Segment(self.path / name, seq)
+            for name, seq in manifest["segments"]
+        ]
+        for segment in self.segments:
+            segment.apply_tombstones(self.tombstones)
+
+    def save(self) -> None:
+        temp_file = self.path / f"{MANIFEST_FILE}.tmp"
+        with open(temp_file, "w") as f:
+            json.dump(
+                {
+                    "next_seq": self.next_seq,
+                    "tombstones": self.tombstones,
+                    "segments": [
+                        [segment.path.name, segment.seq] for segment in self.segments
+                    ],
+                },
+                f,
+            )
+        os.replace(temp_file, self.path / MANIFEST_FILE)
+        self.manifest_stamp = file_stamp(self.path / MANIFEST_FILE)
+
+    def new_segment_path(self) -> Path:
+        # Segment names come from the same counter as seqs, so they never collide
+        name = f"{self.next_seq:08d}"
+        self.next_seq += 1
+        return self.path / name
+
+    def tombstone(self, id: str, seq: int) -> None:
+        """
+        Hides rows of `id` in current segments. Ids without live rows get no tombstone, so
+        tombstones are only kept for overwritten or deleted documents.
+        """
+        found = False
+        for segment in self.segments:
+            found |= segment.delete(id)
+        if found:
+            self.tombstones[id] = seq
+
+    def add(self, id: str, passages: list[list[str]]) -> None:
+        """Adds tokenized passages of a document, replacing any earlier version of it."""
+        vocab: dict[str, int] = {}
+        terms, docs, tfs = [], [], []
+        for row, tokens in enumerate(passages):
+            counts = Counter(tokens)
+            terms.append(
+                np.array([vocab.setdefault(term, len(vocab)) for term in counts], dtype=np.int64)
+            )
+            docs.append(np.full(len(counts), row, dtype=np.int64))
+            tfs.append(np.array(list(counts.values()), dtype=np.float32))
+
+        with self.writing():
+            seq = self.next_seq
+            path = self.new_segment_path()
+            Segment.write(
+                path,
+                vocab,
+                [id],
+                build_postings(terms, docs, tfs, len(vocab)),
+                np.array([len(tokens) for tokens in passages]),
+                np.zeros(len(passages)),
+                np.arange(len(passages)),
+            )
+
+            self.tombstone(id, seq)
+            self.segments.append(Segment(path, seq))
+            self.save()
+            self.maybe_merge()
+
+    def delete(self, id: str) -> None:
+        with self.writing():
+            self.tombstone(id, self.next_seq)
+            self.next_seq += 1
+            self.save()
+
+    def clear(self) -> None:
+        """Removes all documents. Segment directories are removed by the next writer."""
+        with self.writing():
+            self.segments, self.tombstones = [], {}
+            self.save()
+
+    def maybe_merge(self) -> None:
+        """Merges runs of `MERGE_FACTOR` adjacent segments in the same size tier."""
+        while True:
+            tiers = [
+                int(math.log(max(int(segment.live.sum()), 1), MERGE_FACTOR))
+                for segment in self.segments
+            ]
+            for start in range(len(tiers) - MERGE_FACTOR + 1):
+                if len(set(tiers[start : start + MERGE_FACTOR])) == 1:
+                    self.merge(start, start + MERGE_FACTOR)
+                    break
+            else:
+                return
+
+    def compact(self) -> None:
+        """Merges all segments into one, dropping deleted passages and all tombstones."""
+        with self.writing():
+            if self.segments:
+                self.merge(0, len(self.segments))
+            self.tombstones = {}
+            self.save()
+
+    def merge(self, start: int, end: int) -> None:
+        """
+        Replaces segments `start:end` with a single segment of their live rows.
+        The merged segment takes the newest seq of its sources: every row in it was live
+        at that seq, and tombstones written later are all newer than it.
+        """
+        sources = self.segments[start:end]
+        seq = max(segment.seq for segment in sources)
+
+        vocab: dict[str, int] = {}
+        id_lookup: dict[str, int] = {}
+        terms, docs, tfs, lengths, id_index, passage_index = [], [], [], [], [], []
+        offset = 0
+        for segment in sources:
+            rows = np.flatnonzero(segment.live)
+            row_map = np.full(len(segment), -1, dtype=np.int64)
+            row_map[rows] = np.arange(len(rows)) + offset
+            offset += len(rows)
+
+            segment_terms = sorted(segment.vocab, key=segment.vocab.__getitem__)
+            term_map = np.array(
+                [vocab.setdefault(term, len(vocab)) for term in segment_terms], dtype=np.int64
+            )
+            live_ids = set(np.unique(np.asarray(segment.id_index)[rows]).tolist())
+            id_map = np.array(
+                [
+                    id_lookup.setdefault(id, len(id_lookup)) if i in live_ids else -1
+                    for i, id in enumerate(segment.ids)
+                ],
+                dtype=np.int64,
+            )
+
+            term_of_posting = np.repeat(
+                np.arange(len(segment_terms), dtype=np.int64), np.diff(segment.indptr)
+            )
+            alive = segment.live[segment.docs]
+            terms.append(term_map[term_of_posting[alive]])
+            docs.append(row_map[segment.docs[alive]])
+            tfs.append(np.asarray(segment.tfs)[alive])
+            lengths.append(np.asarray(segment.lengths)[rows])
+            id_index.append(id_map[np.asarray(segment.id_index)[rows]])
+            passage_index.append(np.asarray(segment.passage_index)[rows])
+
+        merged = []
+        if offset > 0:
+            path = self.new_segment_path()
+            Segment.write(
+                path,
+                vocab,
+                sorted(id_lookup, key=id_lookup.__getitem__),
+                build_postings(terms, docs, tfs, len(vocab)),
+                np.concatenate(lengths),
+                np.concatenate(id_index),
+                np.concatenate(passage_index),
+            )
+            merged = [Segment(path, seq)]
+            merged[0].apply_tombstones(self.tombstones)
+
+        self.segments[start:end] = merged
+
+        # A tombstone is needed only while a segment older than it still holds the id
+        oldest: dict[str, int] = {}
+        for segment in self.segments:
+            for id in segment.ids:
+                oldest[id] = min(oldest.get(id, segment.seq), segment.seq)
+        self.tombstones = {
+            id: seq for id, seq in self.tombstones.items() if oldest.get(id, seq) < seq
+        }
+        self.save()
+        for segment in sources:
+            shutil.rmtree(segment.path, ignore_errors=True)
+
+    def search(
+        self, query: list[str], k: int, ids: set[str] | None = None
+    ) -> list[tuple[str, int, float]]:
+        """
+        Scores live passages against query tokens.
+        Returns:
+            Up to `k` tuples of (document id, passage index, score), best first. Like a
+            BM25 retriever over the whole corpus, passages without any query term are
+            returned with a zero score if fewer than `k` passages match. If `ids` is given,
+            only passages of those documents are returned.
+        """
+        self.load()
+        n_passages = sum(int(segment.live.sum()) for segment in self.segments)
+        if n_passages == 0 or k <= 0:
+            return []
+
+        total_length = sum(
+            float(np.asarray(segment.lengths)[segment.live].sum()) for segment in self.segments
+        )
+        avgdl = total_length / n_passages
+
+        postings = {
+            term: [segment.postings(term) for segment in self.segments] for term in set(query)
+        }
+        idf = {}
+        for term, segment_postings in postings.items():
+            df = sum(
+                int(segment.live[docs].sum())
+                for segment, (docs, _) in zip(self.segments, segment_postings)
+            )
+            if df > 0:
+                idf[term] = math.log(1 + (n_passages - df + 0.5) / (df + 0.5))
+
+        candidates: list[tuple[float, str, int]] = []
+        for s, segment in enumerate(self.segments):
+            mask = segment.live
+            if ids is not None:
+                allowed = np.array([id in ids for id in segment.ids], dtype=bool)
+                mask = mask & allowed[segment.id_index]
+            if not mask.any():
+                continue
+
+            scores = np.zeros(len(segment), dtype=np.float32)
+            for term in query:
+                if term not in idf:
+                    continue
+                docs, tfs = postings[term][s]
+                norm = K1 * (1 - B + B * np.asarray(segment.lengths)[docs] / avgdl)
+                np.add.at(scores, docs, idf[term] * tfs * (K1 + 1) / (tfs + norm))
+
+            top = np.flatnonzero(mask)
+            if len(top) > k:
+                top = top[np.argpartition(-scores[top], k - 1)[:k]]
+            candidates += [
+                (
+                    float(scores[row]),
+                    segment.ids[segment.id_index[row]],
+                    int(segment.passage_index[row]),
+                )
+                for row in top
+            ]
+
+        candidates.sort(key=lambda candidate: (-candidate[0], candidate[1], candidate[2]))
+        return [(id, i, score) for score, id, i in candidates[:k]]
@@ -0,0 +1,80 @@
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Hashable
+
+from platogram.types import Content
+
+Stamp = tuple[tuple[int, int, int] | None, ...]
+
+
+def file_stamp(*files: Path) -> Stamp:
+    """Inode, modification time and size of each file, or None for missing files."""
+    stamp = []
+    for file in files:
+        try:
+            stat = os.stat(file)
+        except FileNotFoundError:
+            stamp.append(None)
+        else:
+            stamp.append((stat.st_ino, stat.st_mtime_ns, stat.st_size))
+    return tuple(stamp)
+
+
+class ContentCache:
+    """
+    In-process LRU cache of deserialized Content shared by the library backends.
+
+    Entries are keyed by backend location and document id, and are valid only while the
+    stamp of the backing files is unchanged, so writes from other processes are picked up.
+    Reads return deep copies: callers may trim or mutate what they get without touching the
+    cached copy. Transcripts are immutable and shared between copies.
+    """
+
+    def __init__(self, maxsize: int = 64) -> None:
+        self.maxsize = maxsize
+        self.entries: OrderedDict[Hashable, tuple[Stamp, Content]] = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, stamp: Stamp) -> Content | None:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[0] != stamp:
+                if entry is not None:
+                    del self.entries[key]
+                self.misses += 1
+                return None
+
+            self.entries.move_to_end(key)
+            self.hits += 1
+            content = entry[1]
+        return content.model_copy(deep=True)
+
+    def put(self, key: Hashable, stamp: Stamp, content: Content) -> None:
+        if self.maxsize <= 0:
+            return
+
+        content = content.model_copy(deep=True)
+        with self.lock:
+            self.entries[key] = (stamp, content)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self.entries)}
+
+
+content_cache = ContentCache()
@@ -0,0 +1,165 @@
+import os
+import sqlite3
+import threading
+from array import array
+from pathlib import Path
+from typing import Protocol, Sequence
+
+try:
+    from chromadb.utils import embedding_functions
+except ImportError:
+    pass
+
+from platogram.utils import get_sha256_hash
+
+DEFAULT_EMBEDDING_MODEL = "openai/text-embedding-3-large"
+LOCAL_EMBEDDING_MODEL = "local/all-MiniLM-L6-v2"
+DEFAULT_BATCH_SIZE = 64
+
+
+class EmbeddingModel(Protocol):
+    name: str
+
+    def embed(self, texts: list[str]) -> list[list[float]]: ...
+
+
+class OpenAIEmbeddingModel:
+    def __init__(self, model: str, key: str | None = None) -> None:
+        self.name = f"openai/{model}"
+        self.function = embedding_functions.OpenAIEmbeddingFunction(
+            api_key=key or os.environ.get("OPENAI_API_KEY"), model_name=model
+        )
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        return [list(map(float, vector)) for vector in self.function(texts)]
+
+
+class LocalEmbeddingModel:
+    """
+    all-MiniLM-L6-v2 on CPU through ONNX Runtime, as bundled with chromadb.
+    The model is downloaded once to the chromadb cache; after that it runs without network.
+    """
+
+    def __init__(self) -> None:
+        self.name = LOCAL_EMBEDDING_MODEL
+        self.function = embedding_functions.ONNXMiniLM_L6_V2(
+            preferred_providers=["CPUExecutionProvider"]
+        )
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        return [list(map(float, vector)) for vector in self.function(texts)]
+
+
+class SentenceTransformerEmbeddingModel:
+    def __init__(self, model: str) -> None:
+        self.name = f"sentence-transformers/{model}"
+        self.function = embedding_functions.SentenceTransformerEmbeddingFunction(
+            model_name=model, device="cpu"
+        )
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        return [list(map(float, vector)) for vector in self.function(texts)]
+
+
+class EmbeddingCache:
+    """Persistent map from sha256(model, text) to an embedding, stored as float32 in SQLite."""
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(str(path), check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode = WAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        self.db.commit()
+
+    @staticmethod
+    def make_key(model: str, text: str) -> str:
+        return get_sha256_hash(f"{model}\0{text}")
+
+    def get_many(self, keys: Sequence[str]) -> dict[str, list[float]]:
+        found: dict[str, list[float]] = {}
+        with self.lock:
+            # Stay under SQLite's default limit on bound parameters
+            for start in range(0, len(keys), 500):
+                batch = keys[start : start + 500]
+                rows = self.db.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(batch))})",
+                    batch,
+                )
+                for key, vector in rows:
+                    values = array("f")
+                    values.frombytes(vector)
+                    found[key] = values.tolist()
+        return found
+
+    def put_many(self, items: dict[str, list[float]]) -> None:
+        with self.lock:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                ((key, array("f", vector).tobytes()) for key, vector in items.items()),
+            )
+            self.db.commit()
+
+
+class CachedEmbeddingFunction:
+    """
+    Chroma embedding function that looks texts up in `cache` first and embeds the rest with
+    `model` in batches of `batch_size`. Identical texts in one call are embedded once.
+    """
+
+    def __init__(
+        self,
+        model: EmbeddingModel,
+        cache: EmbeddingCache | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        self.model = model
+        self.cache = cache
+        self.batch_size = batch_size
+
+    def __call__(self, input: list[str]) -> list[list[float]]:
+        keys = [EmbeddingCache.make_key(self.model.name, text) for text in input]
+        embeddings = self.cache.get_many(list(set(keys))) if self.cache else {}
+
+        missing = {key: text for key, text in zip(keys, input) if key not in embeddings}
+        missing_keys = list(missing)
+        for start in range(0, len(missing_keys), self.batch_size):
+            batch = missing_keys[start : start + self.batch_size]
+            computed = dict(zip(batch, self.model.embed([missing[key] for key in batch])))
+            if self.cache:
+                self.cache.put_many(computed)
+            embeddings.update(computed)
+
+        return [embeddings[key] for key in keys]
+
+
+def get_embedding_model(full_model_name: str, key: str | None = None) -> EmbeddingModel:
+    """
+    Args:
+        full_model_name: "openai/<model>", "local/all-MiniLM-L6-v2" (CPU, no network after
+            the first download) or "sentence-transformers/<model>" (requires
+            sentence-transformers).
+    """
+    provider, _, model = full_model_name.partition("/")
+    if provider == "openai":
+        return OpenAIEmbeddingModel(model, key)
+    if full_model_name == LOCAL_EMBEDDING_MODEL:
+        return LocalEmbeddingModel()
+    if provider == "sentence-transformers":
+        return SentenceTransformerEmbeddingModel(model)
+    raise ValueError(f"Unknown embedding model: {full_model_name}")
+
+
+def get_embedding_function(
+    full_model_name: str = DEFAULT_EMBEDDING_MODEL,
+    cache_path: Path | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    key: str | None = None,
+) -> CachedEmbeddingFunction:
+    return CachedEmbeddingFunction(
+        get_embedding_model(full_model_name, key),
+        EmbeddingCache(cache_path) if cache_path else None,
+        batch_size,
+    )
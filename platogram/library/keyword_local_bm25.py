@@ -1,5 +1,5 @@
-import json
 from pathlib import Path
+from typing import Sequence
 
 try:
     import bm25s  # type: ignore
@@ -14,47 +14,89 @@ except ImportError:
 from platogram.types import Content
 from platogram.utils import make_filesystem_safe
 from platogram.ops import remove_markers
+from platogram.library.bm25_index import MANIFEST_FILE, SegmentedBM25Index
+from platogram.library.storage import ContentStore
+
+INDEX_DIR = "bm25.segments"
 
 
 class LocalBM25Library:
-    def __init__(self, home_dir: Path):
+    """
+    Keyword retrieval over passages of every document in the library.
+
+    Passages are indexed in a segmented BM25 index in `<home>/bm25.segments`: `put` and
+    `delete` write a small segment or a tombstone instead of rebuilding the whole index,
+    and segments are merged as they accumulate. Use `compact` to merge everything at once.
+    """
+
+    def __init__(self, home_dir: Path, binary: bool = False):
         if not home_dir.exists():
             home_dir.mkdir(parents=True)
         self.home_dir = home_dir
+        self.store = ContentStore(home_dir, binary=binary)
         self.stemmer = Stemmer.Stemmer("english")
+        self.passage_index: SegmentedBM25Index | None = None
 
     @property
     def home(self) -> Path:
         return self.home_dir
 
+    @property
+    def index_dir(self) -> Path:
+        return self.home / INDEX_DIR
+
     def ls(self) -> list[str]:
-        return [f.stem for f in self.home.glob("*.json")]
+        return self.store.ls()
 
     def exists(self, id: str) -> bool:
-        return (self.home / f"{make_filesystem_safe(id)}.json").exists()
+        return self.store.exists(id)
 
     def put(self, id: str, content: Content) -> None:
-        file = self.home / f"{make_filesystem_safe(id)}.json"
-        with open(file, "w") as f:
-            json.dump(content.model_dump(mode="json"), f)
+        # Load first: building a missing index after the store write would index `id` twice
+        index = self.load_index()
+        self.store.put(id, content)
+        index.add(make_filesystem_safe(id), self.tokenize(content.passages))
+
+    def get_content(self, id: str, fields: Sequence[str] | None = None) -> Content:
+        return self.store.get(id, fields)
+
+    def delete(self, id: str) -> None:
+        self.store.delete(id)
+        self.load_index().delete(make_filesystem_safe(id))
+
+    def tokenize(self, passages: list[str]) -> list[list[str]]:
+        if not passages:
+            return []
 
-        self.passage_retriever = bm25s.BM25()
-        passages_tokens = bm25s.tokenize(
-            [remove_markers(passage) for passage in content.passages],
+        return bm25s.tokenize(
+            [remove_markers(passage) for passage in passages],
             stopwords="en",
             stemmer=self.stemmer,
+            return_ids=False,
+            show_progress=False,
         )
-        self.passage_retriever.index(passages_tokens)
 
-    def get_content(self, id: str) -> Content:
-        file = self.home_dir / f"{make_filesystem_safe(id)}.json"
-        with open(file, "r") as f:
-            content = Content(**json.load(f))
-        return content
+    def build_index(self) -> None:
+        """Rebuilds the index from scratch from documents in the library."""
+        self.passage_index = SegmentedBM25Index(self.index_dir)
+        self.passage_index.clear()
+        for id in sorted(self.ls()):
+            self.passage_index.add(id, self.tokenize(self.get_content(id).passages))
+        self.passage_index.compact()
 
-    def delete(self, id: str) -> None:
-        file = self.home_dir / f"{make_filesystem_safe(id)}.json"
-        file.unlink()
+    def load_index(self) -> SegmentedBM25Index:
+        if self.passage_index is None:
+            if (self.index_dir / MANIFEST_FILE).exists():
+                self.passage_index = SegmentedBM25Index(self.index_dir)
+            else:
+                self.build_index()
+
+        assert self.passage_index is not None
+        return self.passage_index
+
+    def compact(self) -> None:
+        """Merges all index segments into one and drops deleted passages."""
+        self.load_index().compact()
 
     def retrieve(
         self,
@@ -62,20 +104,25 @@ class LocalBM25Library:
         n_results: int,
         filter_keys: list[str],
     ) -> tuple[list[Content], list[float]]:
-        if len(filter_keys) == 0:
-            return ([], [])
-
-        if len(filter_keys) > 1:
-            raise ValueError(
-                "Keyword local BM25 library cannot handle multiple documents"
-            )
-
-        content = self.get_content(filter_keys[0])
-        n_passages = min(len(content.passages), n_results)
-
-        query_tokens = bm25s.tokenize(query, stemmer=self.stemmer)
-        ids, distances = self.passage_retriever.retrieve(query_tokens, k=n_passages)  # type: ignore
-
-        content.passages = [content.passages[i] for i in ids[0]]
-
-        return ([content], distances[0])
+        """
+        Retrieves the best matching passages across documents in `filter_keys`, or across the
+        whole library if `filter_keys` is empty. Returns one Content per document with its
+        passages in rank order, and scores in the same order as the passages.
+        """
+        keys = set(make_filesystem_safe(key) for key in filter_keys) or None
+        (query_tokens,) = self.tokenize([query])
+        hits = self.load_index().search(query_tokens, n_results, keys)
+
+        ranked: dict[str, list[tuple[int, float]]] = {}
+        for id, i, score in hits:
+            ranked.setdefault(id, []).append((i, score))
+
+        context = []
+        distances = []
+        for id, passage_hits in ranked.items():
+            content = self.get_content(id)
+            content.passages = [content.passages[i] for i, _ in passage_hits]
+            context.append(content)
+            distances += [score for _, score in passage_hits]
+
+        return (context, distances)
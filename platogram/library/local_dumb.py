@@ -1,40 +1,35 @@
-import json
 from pathlib import Path
+from typing import Sequence
 
+from platogram.library.storage import ContentStore
 from platogram.types import Content
-from platogram.utils import make_filesystem_safe
 
 
 class LocalDumbLibrary:
-    def __init__(self, home_dir: Path):
+    def __init__(self, home_dir: Path, binary: bool = False):
         if not home_dir.exists():
             home_dir.mkdir(parents=True)
         self.home_dir = home_dir
+        self.store = ContentStore(home_dir, binary=binary)
 
     @property
     def home(self) -> Path:
         return self.home_dir
 
     def ls(self) -> list[str]:
-        return [f.stem for f in self.home.glob("*.json")]
+        return self.store.ls()
 
     def exists(self, id: str) -> bool:
-        return (self.home / f"{make_filesystem_safe(id)}.json").exists()
+        return self.store.exists(id)
 
     def put(self, id: str, content: Content) -> None:
-        file = self.home / f"{make_filesystem_safe(id)}.json"
-        with open(file, "w") as f:
-            json.dump(content.model_dump(mode="json"), f)
+        self.store.put(id, content)
 
-    def get_content(self, id: str) -> Content:
-        file = self.home_dir / f"{make_filesystem_safe(id)}.json"
-        with open(file, "r") as f:
-            content = Content(**json.load(f))
-        return content
+    def get_content(self, id: str, fields: Sequence[str] | None = None) -> Content:
+        return self.store.get(id, fields)
 
     def delete(self, id: str) -> None:
-        file = self.home_dir / f"{make_filesystem_safe(id)}.json"
-        file.unlink()
+        self.store.delete(id)
 
     def retrieve(
         self,
@@ -0,0 +1,228 @@
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Sequence
+
+from platogram.library.cache import content_cache, file_stamp
+from platogram.library.storage import check_fields
+from platogram.types import Content, LazyContent, Transcript
+from platogram.utils import make_filesystem_safe
+
+DATABASE_FILE = "library.sqlite"
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS content (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    images TEXT,
+    origin TEXT
+);
+CREATE TABLE IF NOT EXISTS passages (
+    id TEXT NOT NULL REFERENCES content (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    PRIMARY KEY (id, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS chapters (
+    id TEXT NOT NULL REFERENCES content (id) ON DELETE CASCADE,
+    marker INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    PRIMARY KEY (id, marker)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS transcript (
+    id TEXT NOT NULL REFERENCES content (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    time_ms INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    speaker TEXT,
+    PRIMARY KEY (id, position)
+) WITHOUT ROWID;
+"""
+
+
+class LocalSQLiteLibrary:
+    """
+    Library stored in a single SQLite database at `<home>/library.sqlite`.
+
+    Metadata, passages, chapters and transcript events live in separate tables keyed by
+    document id, so `ls` and `exists` are index lookups. The database runs in WAL mode:
+    `put` and `delete` are single transactions and readers never see a partial document,
+    including readers in other processes. Each thread uses its own connection. Full reads go
+    through the shared `content_cache`.
+    """
+
+    def __init__(self, home_dir: Path):
+        if not home_dir.exists():
+            home_dir.mkdir(parents=True)
+        self.home_dir = home_dir
+        self.path = home_dir / DATABASE_FILE
+        self.cache_home = str(self.path.resolve())
+        self.local = threading.local()
+
+        db = self.connect()
+        db.execute("PRAGMA journal_mode = WAL")
+        db.executescript(SCHEMA)
+
+    @property
+    def home(self) -> Path:
+        return self.home_dir
+
+    def connect(self) -> sqlite3.Connection:
+        db = getattr(self.local, "db", None)
+        if db is None:
+            # Autocommit mode: transactions are opened explicitly with BEGIN IMMEDIATE
+            db = sqlite3.connect(str(self.path), timeout=30.0, isolation_level=None)
+            db.execute("PRAGMA foreign_keys = ON")
+            db.execute("PRAGMA synchronous = NORMAL")
+            self.local.db = db
+        return db
+
+    def ls(self) -> list[str]:
+        return [id for (id,) in self.connect().execute("SELECT id FROM content ORDER BY id")]
+
+    def exists(self, id: str) -> bool:
+        row = self.connect().execute(
+            "SELECT 1 FROM content WHERE id = ?", (make_filesystem_safe(id),)
+        ).fetchone()
+        return row is not None
+
+    def put(self, id: str, content: Content) -> None:
+        id = make_filesystem_safe(id)
+        content_cache.invalidate((self.cache_home, id))
+        db = self.connect()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            db.execute("DELETE FROM content WHERE id = ?", (id,))
+            db.execute(
+                "INSERT INTO content (id, title, summary, images, origin) VALUES (?, ?, ?, ?, ?)",
+                (
+                    id,
+                    content.title,
+                    content.summary,
+                    json.dumps(content.images) if content.images is not None else None,
+                    content.origin,
+                ),
+            )
+            db.executemany(
+                "INSERT INTO passages (id, position, text) VALUES (?, ?, ?)",
+                ((id, i, passage) for i, passage in enumerate(content.passages)),
+            )
+            db.executemany(
+                "INSERT INTO chapters (id, marker, title) VALUES (?, ?, ?)",
+                ((id, marker, title) for marker, title in content.chapters.items()),
+            )
+            db.executemany(
+                "INSERT INTO transcript (id, position, time_ms, text, speaker) VALUES (?, ?, ?, ?, ?)",
+                (
+                    (id, i, event.time_ms, event.text, event.speaker)
+                    for i, event in enumerate(Transcript.from_events(content.transcript))
+                ),
+            )
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+
+    def get_content(self, id: str, fields: Sequence[str] | None = None) -> Content:
+        """
+        Reads a document. If `fields` is given, only those fields are read up front and the
+        rest are read on first access, which may observe a later `put` of the same id.
+        """
+        id = make_filesystem_safe(id)
+        if fields is not None:
+            check_fields(fields)
+        else:
+            # Every commit touches the WAL or, after a checkpoint, the database file
+            stamp = file_stamp(self.path, self.path.with_name(f"{self.path.name}-wal"))
+            cached = content_cache.get((self.cache_home, id), stamp)
+            if cached is not None:
+                return cached
+
+        db = self.connect()
+        # A read transaction gives a consistent snapshot across the tables
+        db.execute("BEGIN")
+        try:
+            if not self.exists(id):
+                raise FileNotFoundError(f"Content not found: {id}")
+            loaded = {
+                name: self.read_field(id, name)
+                for name in (Content.model_fields if fields is None else fields)
+            }
+        finally:
+            db.execute("COMMIT")
+
+        if fields is None:
+            content = Content(**loaded)
+            content_cache.put((self.cache_home, id), stamp, content)
+            return content
+        return LazyContent.partial(lambda name: self.read_field(id, name), **loaded)
+
+    def read_field(self, id: str, name: str) -> Any:
+        db = self.connect()
+        if name == "passages":
+            return [
+                text
+                for (text,) in db.execute(
+                    "SELECT text FROM passages WHERE id = ? ORDER BY position", (id,)
+                )
+            ]
+        if name == "chapters":
+            return {
+                marker: title
+                for marker, title in db.execute(
+                    "SELECT marker, title FROM chapters WHERE id = ? ORDER BY marker", (id,)
+                )
+            }
+        if name == "transcript":
+            rows = db.execute(
+                "SELECT time_ms, text, speaker FROM transcript WHERE id = ? ORDER BY position",
+                (id,),
+            ).fetchall()
+            return Transcript.from_columns(*zip(*rows)) if rows else Transcript.from_events([])
+
+        # Column names come from Content fields that were checked above
+        row = db.execute(f"SELECT {name} FROM content WHERE id = ?", (id,)).fetchone()
+        if row is None:
+            raise FileNotFoundError(f"Content not found: {id}")
+        if name == "images":
+            return json.loads(row[0]) if row[0] is not None else None
+        return row[0]
+
+    def delete(self, id: str) -> None:
+        content_cache.invalidate((self.cache_home, make_filesystem_safe(id)))
+        db = self.connect()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = db.execute("DELETE FROM content WHERE id = ?", (make_filesystem_safe(id),))
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+        if cursor.rowcount == 0:
+            raise FileNotFoundError(f"Content not found: {id}")
+
+    def retrieve(
+        self,
+        query: str,
+        n_results: int,
+        filter_keys: list[str],
+    ) -> tuple[list[Content], list[float]]:
+        raise NotImplementedError("SQLite local storage does not support retrieval. Use get_content().")
+
+
+def migrate_json_library(json_dir: Path, library: LocalSQLiteLibrary) -> list[str]:
+    """
+    Imports documents stored one JSON file per document, as written by the other local
+    libraries, into `library`. Existing documents with the same id are replaced, and the
+    JSON files are left in place.
+    Returns:
+        Ids of the imported documents.
+    """
+    ids = []
+    for file in sorted(json_dir.glob("*.json")):
+        with open(file, "r") as f:
+            content = Content(**json.load(f))
+        library.put(file.stem, content)
+        ids.append(file.stem)
+    return ids
@@ -1,41 +1,64 @@
-import json
-import os
+import re
 from pathlib import Path
+from typing import Sequence
 
 try:
     import chromadb
 except ImportError:
     pass
 
-try:
-    from chromadb.utils import embedding_functions
-except ImportError:
-    pass
-
+from platogram.library.embeddings import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_EMBEDDING_MODEL,
+    get_embedding_function,
+)
+from platogram.library.storage import ContentStore
 from platogram.ops import remove_markers
 from platogram.types import Content
-from platogram.utils import get_sha256_hash, make_filesystem_safe
+from platogram.utils import get_sha256_hash
 
-EMBEDDING_MODEL = "text-embedding-3-large"
+EMBEDDING_CACHE_FILE = "embeddings.sqlite"
 
 
 class LocalChromaLibrary:
-    def __init__(self, home_dir: Path):
+    """
+    Semantic retrieval over passages with Chroma.
+
+    Embeddings come from `embedding_model` (see `get_embedding_model`; "local/all-MiniLM-L6-v2"
+    runs on CPU without network) in batches of `batch_size`, and are cached persistently in
+    `<home>/embeddings.sqlite` by hash of model and text, so re-indexing unchanged passages
+    does not call the model. Each embedding model gets its own pair of collections.
+    """
+
+    def __init__(
+        self,
+        home_dir: Path,
+        binary: bool = False,
+        embedding_model: str = DEFAULT_EMBEDDING_MODEL,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
         if not home_dir.exists():
             home_dir.mkdir(parents=True)
         self.home_dir = home_dir
+        self.store = ContentStore(home_dir, binary=binary)
 
         self.client = chromadb.PersistentClient(path=str(home_dir / "chroma.index"))
 
-        embedding_function = embedding_functions.OpenAIEmbeddingFunction(
-            api_key=os.environ.get("OPENAI_API_KEY"), model_name=EMBEDDING_MODEL
+        embedding_function = get_embedding_function(
+            embedding_model, cache_path=home_dir / EMBEDDING_CACHE_FILE, batch_size=batch_size
+        )
+        # Collections of the default model keep their original names
+        suffix = (
+            ""
+            if embedding_model == DEFAULT_EMBEDDING_MODEL
+            else "-" + re.sub(r"[^a-z0-9]+", "-", embedding_model.lower()).strip("-")[:40]
         )
         self.content = self.client.get_or_create_collection(
-            name="content",
+            name=f"content{suffix}",
             embedding_function=embedding_function,  # type: ignore
         )
         self.segments = self.client.get_or_create_collection(
-            name="segments",
+            name=f"segments{suffix}",
             embedding_function=embedding_function,  # type: ignore
         )
 
@@ -44,37 +67,45 @@ class LocalChromaLibrary:
         return self.home_dir
 
     def ls(self) -> list[str]:
-        return [f.stem for f in self.home.glob("*.json")]
+        return self.store.ls()
 
     def exists(self, id: str) -> bool:
         return bool(self.content.get(ids=[id])["ids"])
 
     def put(self, id: str, content: Content) -> None:
-        file = self.home / f"{make_filesystem_safe(id)}.json"
-        with open(file, "w") as f:
-            json.dump(content.model_dump(mode="json"), f)
-
-        self.content.add(
+        if self.store.exists(id):
+            previous = self.get_content(id, fields=["passages"])
+            stale = set(previous.passages) - set(content.passages)
+            if stale:
+                self.segments.delete(ids=[get_sha256_hash(f"{id}-{p}") for p in stale])
+        self.store.put(id, content)
+        self.index(id, content)
+
+    def index(self, id: str, content: Content) -> None:
+        self.content.upsert(
             documents=[f"{content.title} {content.summary}"],
             ids=[id],
         )
 
-        self.segments.add(
-            documents=[remove_markers(p) for p in content.passages],
-            metadatas=[{"id": id, "passage": p} for p in content.passages],
-            ids=[get_sha256_hash(f"{id}-{p}") for p in content.passages],
-        )
+        if content.passages:
+            passages = list(dict.fromkeys(content.passages))
+            self.segments.upsert(
+                documents=[remove_markers(p) for p in passages],
+                metadatas=[{"id": id, "passage": p} for p in passages],
+                ids=[get_sha256_hash(f"{id}-{p}") for p in passages],
+            )
+
+    def reindex(self) -> None:
+        """Re-indexes every stored document, e.g. after switching embedding models."""
+        for id in self.ls():
+            self.index(id, self.get_content(id))
 
-    def get_content(self, id: str) -> Content:
-        file = self.home_dir / f"{make_filesystem_safe(id)}.json"
-        with open(file, "r") as f:
-            content = Content(**json.load(f))
-        return content
+    def get_content(self, id: str, fields: Sequence[str] | None = None) -> Content:
+        return self.store.get(id, fields)
 
     def delete(self, id: str) -> None:
-        content = self.get_content(id)
-        file = self.home_dir / f"{make_filesystem_safe(id)}.json"
-        file.unlink()
+        content = self.get_content(id, fields=["passages"])
+        self.store.delete(id)
         self.segments.delete(
             ids=[get_sha256_hash(f"{id}-{p}") for p in content.passages]
         )
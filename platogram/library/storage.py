@@ -0,0 +1,134 @@
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Sequence
+
+from pydantic import TypeAdapter
+
+from platogram.library.binary import read_binary, write_binary
+from platogram.library.cache import content_cache, file_stamp
+from platogram.types import Content, LazyContent
+from platogram.utils import make_filesystem_safe
+
+META_DIR = ".meta"
+METADATA_FIELDS = ("title", "summary", "chapters", "images", "origin")
+BINARY_SUFFIX = ".plato"
+
+
+def check_fields(fields: Sequence[str]) -> None:
+    unknown = set(fields) - set(Content.model_fields)
+    if unknown:
+        raise ValueError(f"Unknown Content fields: {sorted(unknown)}")
+
+
+@lru_cache(maxsize=None)
+def field_adapter(name: str) -> TypeAdapter:
+    return TypeAdapter(Content.model_fields[name].annotation)
+
+
+class ContentStore:
+    """
+    Stores each Content in its own file in the library home.
+
+    By default documents are written as `<home>/<id>.json`, plus a sidecar
+    `<home>/.meta/<id>.json` with the small metadata fields, so that projected reads do not
+    parse the transcript. With `binary=True` they are written as `<home>/<id>.plato` in the
+    memory-mappable format of `platogram.library.binary`, which is validated only on write.
+    Documents in either format are readable regardless of `binary`. Full reads go through
+    the shared `content_cache`.
+    """
+
+    def __init__(self, home_dir: Path, binary: bool = False):
+        self.home_dir = home_dir
+        self.binary = binary
+        self.cache_home = str(home_dir.resolve())
+
+    def file(self, id: str) -> Path:
+        return self.home_dir / f"{make_filesystem_safe(id)}.json"
+
+    def binary_file(self, id: str) -> Path:
+        return self.home_dir / f"{make_filesystem_safe(id)}{BINARY_SUFFIX}"
+
+    def meta_file(self, id: str) -> Path:
+        return self.home_dir / META_DIR / f"{make_filesystem_safe(id)}.json"
+
+    def ls(self) -> list[str]:
+        files = [*self.home_dir.glob("*.json"), *self.home_dir.glob(f"*{BINARY_SUFFIX}")]
+        return list(dict.fromkeys(f.stem for f in files))
+
+    def exists(self, id: str) -> bool:
+        return self.file(id).exists() or self.binary_file(id).exists()
+
+    def put(self, id: str, content: Content) -> None:
+        content_cache.invalidate(self.cache_key(id))
+        if self.binary:
+            write_binary(self.binary_file(id), content)
+            self.file(id).unlink(missing_ok=True)
+            self.meta_file(id).unlink(missing_ok=True)
+            return
+
+        data = content.model_dump(mode="json")
+        with open(self.file(id), "w") as f:
+            json.dump(data, f)
+
+        meta_file = self.meta_file(id)
+        meta_file.parent.mkdir(exist_ok=True)
+        temp_file = meta_file.with_suffix(".tmp")
+        with open(temp_file, "w") as f:
+            json.dump({name: data[name] for name in METADATA_FIELDS}, f)
+        os.replace(temp_file, meta_file)
+        self.binary_file(id).unlink(missing_ok=True)
+
+    def get(self, id: str, fields: Sequence[str] | None = None) -> Content:
+        binary_file = self.binary_file(id)
+        file = binary_file if binary_file.exists() else self.file(id)
+
+        if fields is not None:
+            check_fields(fields)
+            if file == binary_file:
+                return read_binary(binary_file, fields)
+            if set(fields) <= set(METADATA_FIELDS) and self.meta_file(id).exists():
+                return self.read_meta(id, fields)
+
+        key = self.cache_key(id)
+        stamp = file_stamp(file)
+        cached = content_cache.get(key, stamp)
+        if cached is not None:
+            return cached
+
+        content = read_binary(file) if file == binary_file else self.read(id)
+        content_cache.put(key, stamp, content)
+        return content
+
+    def read_meta(self, id: str, fields: Sequence[str]) -> Content:
+        with open(self.meta_file(id), "r") as f:
+            meta = json.load(f)
+
+        full: list[Content] = []
+
+        def load(name: str) -> Any:
+            if name in meta:
+                return field_adapter(name).validate_python(meta[name])
+            if not full:
+                full.append(self.read(id))
+            return getattr(full[0], name)
+
+        return LazyContent.partial(load, **{name: load(name) for name in fields})
+
+    def cache_key(self, id: str) -> tuple[str, str]:
+        return (self.cache_home, make_filesystem_safe(id))
+
+    def read(self, id: str) -> Content:
+        with open(self.file(id), "r") as f:
+            return Content(**json.load(f))
+
+    def delete(self, id: str) -> None:
+        content_cache.invalidate(self.cache_key(id))
+        binary_file = self.binary_file(id)
+        if binary_file.exists():
+            binary_file.unlink()
+        else:
+            self.file(id).unlink()
+        self.file(id).unlink(missing_ok=True)
+        self.meta_file(id).unlink(missing_ok=True)
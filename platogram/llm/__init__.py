@@ -1,9 +1,10 @@
 from typing import Protocol, Literal, Generator, Sequence
+from platogram.llm.cache import ResponseCache
 from platogram.types import Content, User, Assistant
 
 
 class LanguageModel(Protocol):
-    def count_tokens(self, text: str) -> int: ...
+    def count_tokens(self, text: str, estimate: bool = False, lang: str | None = None) -> int: ...
 
     def get_meta(
         self, paragraphs: list[str], max_tokens: int = 4096, temperature: float = 0.5, lang: str | None = None
@@ -30,6 +31,7 @@ class LanguageModel(Protocol):
         stream=False,
         system: str | None = None,
         tools: list[dict] | None = None,
+        cache_prefix: int = 0,
     ) -> str | dict[str, str] | Generator[str, None, None]: ...
 
     def prompt(
@@ -48,10 +50,12 @@ class LanguageModel(Protocol):
     ) -> str: ...
 
 
-def get_model(full_model_name: str, key: str | None = None) -> LanguageModel:
+def get_model(
+    full_model_name: str, key: str | None = None, cache: ResponseCache | None = None
+) -> LanguageModel:
     if full_model_name.startswith("anthropic/"):
         from platogram.llm.anthropic import Model
 
-        return Model(full_model_name.split("/")[-1], key)
+        return Model(full_model_name.split("/")[-1], key, cache=cache)
     else:
         raise ValueError(f"Unsupported language model: {full_model_name}")
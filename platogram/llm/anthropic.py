@@ -1,5 +1,6 @@
 import os
 import re
+import threading
 from typing import Any, Generator, Literal, Sequence
 
 import anthropic
@@ -11,9 +12,17 @@ from tenacity import (
     stop_after_delay,
 )
 
+from platogram.llm.cache import ResponseCache
+from platogram.llm.tokens import TokenCounter, get_token_counter
 from platogram.ops import render
 from platogram.types import Assistant, Content, User
 
+# Prompts shorter than this are not cached by the provider.
+MIN_CACHEABLE_TOKENS = {
+    "claude-3-haiku-20240307": 2048,
+}
+DEFAULT_MIN_CACHEABLE_TOKENS = 1024
+
 RETRY = retry(
     stop=(stop_after_delay(300) | stop_after_attempt(5)),
     retry=retry_if_exception_type(AnthropicError),
@@ -21,7 +30,9 @@ RETRY = retry(
 
 
 class Model:
-    def __init__(self, model: str, key: str | None = None) -> None:
+    def __init__(
+        self, model: str, key: str | None = None, cache: ResponseCache | None = None
+    ) -> None:
         if key is None:
             key = os.environ["ANTHROPIC_API_KEY"]
 
@@ -37,9 +48,28 @@ class Model:
             raise ValueError(f"Unknown model: {model}")
 
         self.client = anthropic.Client(api_key=key)
+        self.tokenizer = get_token_counter(
+            "tokenizer", load_tokenizer=self.client.get_tokenizer
+        )
+        self.estimators: dict[str | None, TokenCounter] = {}
+        self.cache = cache
+        self.usage = {
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "cache_creation_input_tokens": 0,
+            "cache_read_input_tokens": 0,
+        }
+        self.usage_lock = threading.Lock()
+
+    def count_tokens(
+        self, text: str, estimate: bool = False, lang: str | None = None
+    ) -> int:
+        if estimate:
+            if lang not in self.estimators:
+                self.estimators[lang] = get_token_counter("estimate", lang)
+            return self.estimators[lang].count_tokens(text)
 
-    def count_tokens(self, text: str) -> int:
-        return self.client.count_tokens(text)
+        return self.tokenizer.count_tokens(text)
 
     def prompt_model(
         self,
@@ -49,8 +79,62 @@ class Model:
         stream=False,
         system: str | None = None,
         tools: list[dict] | None = None,
+        cache_prefix: int = 0,
+    ) -> str | dict[str, str] | Generator[str, None, None]:
+        """
+        Args:
+            cache_prefix: Number of leading messages that, together with the system prompt, are
+                the same across calls. The prefix is marked for provider-side prompt caching.
+        """
+        if self.cache is None:
+            return self.call_model(messages, max_tokens, temperature, stream, system, tools, cache_prefix)
+
+        cache = self.cache
+        key = cache.make_key(
+            model=self.model,
+            system=system,
+            messages=[{"role": m.role, "content": m.content} for m in messages],
+            tools=tools,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=stream,
+        )
+        cached = cache.get(key)
+
+        if not stream:
+            if cached is None:
+                cached = self.call_model(messages, max_tokens, temperature, stream, system, tools, cache_prefix)
+                cache.put(key, cached)
+            return cached
+
+        def replay_stream():
+            if cached is not None:
+                yield from cached
+                return
+
+            chunks = []
+            for chunk in self.call_model(messages, max_tokens, temperature, stream, system, tools, cache_prefix):
+                chunks.append(chunk)
+                yield chunk
+            cache.put(key, chunks)
+
+        return replay_stream()
+
+    def call_model(
+        self,
+        messages: Sequence[User | Assistant],
+        max_tokens: int = 4096,
+        temperature=0.1,
+        stream=False,
+        system: str | None = None,
+        tools: list[dict] | None = None,
+        cache_prefix: int = 0,
     ) -> str | dict[str, str] | Generator[str, None, None]:
         kwargs: dict[str, Any] = {}
+        api = self.client.messages
+        request_messages: list[dict[str, Any]] = [
+            {"role": m.role, "content": m.content} for m in messages
+        ]
 
         if tools:
             kwargs["tools"] = tools
@@ -58,44 +142,62 @@ class Model:
         if system:
             kwargs["system"] = system
 
+        if cache_prefix and self.is_cacheable(system, messages[:cache_prefix]):
+            api = self.client.beta.prompt_caching.messages
+            cache_control = {"type": "ephemeral"}
+            if system:
+                kwargs["system"] = [
+                    {"type": "text", "text": system, "cache_control": cache_control}
+                ]
+            last = request_messages[cache_prefix - 1]
+            last["content"] = [
+                {"type": "text", "text": last["content"], "cache_control": cache_control}
+            ]
+
         if not stream:
 
             @RETRY
             def get_response(messages):
-                response = self.client.messages.create(
+                response = api.create(
                     model=self.model,
                     max_tokens=max_tokens,
                     temperature=temperature,
-                    messages=[{"role": m.role, "content": m.content} for m in messages],
+                    messages=messages,
                     **kwargs,
                 )
+                self.track_usage(response)
 
                 if response.stop_reason == "tool_use":
                     return response.content[-1].input
 
                 return response.content[0].text
 
-            return get_response(messages)
+            return get_response(request_messages)
 
         def stream_text():
-            with self.client.messages.stream(
+            with api.stream(
                 model=self.model,
                 max_tokens=max_tokens,
                 temperature=temperature,
-                messages=[{"role": m.role, "content": m.content} for m in messages],
+                messages=request_messages,
                 **kwargs,
             ) as stream:
+                yield from stream.text_stream
+                self.track_usage(stream.get_final_message())
 
-                @RETRY
-                def get_response():
-                    while True:
-                        for text in stream.text_stream:
-                            yield text
-                        break
+        return stream_text()
 
-                return get_response()
+    def is_cacheable(self, system: str | None, prefix: Sequence[User | Assistant]) -> bool:
+        tokens = sum(self.count_tokens(m.content) for m in prefix)
+        if system:
+            tokens += self.count_tokens(system)
+        return tokens >= MIN_CACHEABLE_TOKENS.get(self.model, DEFAULT_MIN_CACHEABLE_TOKENS)
 
-        return stream_text()
+    def track_usage(self, response: Any) -> None:
+        usage = getattr(response, "usage", None)
+        with self.usage_lock:
+            for name in self.usage:
+                self.usage[name] += getattr(usage, name, None) or 0
 
     def get_meta(
         self,
@@ -333,6 +435,7 @@ Siga estos pasos para reescribir el <transcript> y mantener cada <marker>:
             ],
             system=system_prompt[lang],
             temperature=temperature,
+            cache_prefix=len(example_messages),
         )
         assert isinstance(
             paragraphs, str
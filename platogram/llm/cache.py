@@ -0,0 +1,97 @@
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from platogram.utils import get_sha256_hash
+
+
+class ResponseCache:
+    """
+    Persistent content-addressed cache of LLM responses in a single SQLite file.
+
+    Entries are keyed by a hash of the full request. The least recently used entries are evicted
+    once the total size of stored responses exceeds `max_size_bytes`, and entries older than
+    `ttl_s` seconds are treated as missing. Streamed responses are stored as lists of chunks.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_size_bytes: int = 512 * 1024 * 1024,
+        ttl_s: float | None = 30 * 24 * 60 * 60,
+    ) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.max_size_bytes = max_size_bytes
+        self.ttl_s = ttl_s
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(str(path), check_same_thread=False)
+        self.db.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created REAL NOT NULL,
+                accessed REAL NOT NULL
+            )"""
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+        self.db.commit()
+
+    @staticmethod
+    def make_key(**request: Any) -> str:
+        return get_sha256_hash(json.dumps(request, sort_keys=True, ensure_ascii=False))
+
+    def get(self, key: str) -> Any | None:
+        now = time.time()
+        with self.lock:
+            row = self.db.execute(
+                "SELECT value, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or (self.ttl_s is not None and now - row[1] > self.ttl_s):
+                if row is not None:
+                    self.db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self.db.commit()
+                self.misses += 1
+                return None
+
+            self.db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            self.db.commit()
+            self.hits += 1
+            return json.loads(row[0])
+
+    def put(self, key: str, value: Any) -> None:
+        data = json.dumps(value, ensure_ascii=False)
+        now = time.time()
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                (key, data, len(data.encode()), now, now),
+            )
+            self.evict()
+            self.db.commit()
+
+    def evict(self) -> None:
+        (total,) = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= self.max_size_bytes:
+            return
+
+        for key, size in self.db.execute(
+            "SELECT key, size FROM responses ORDER BY accessed ASC"
+        ).fetchall():
+            if total <= self.max_size_bytes:
+                break
+            self.db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+
+    def stats(self) -> dict[str, int]:
+        with self.lock:
+            entries, size = self.db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {"hits": self.hits, "misses": self.misses, "entries": entries, "size_bytes": size}
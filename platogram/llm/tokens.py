@@ -0,0 +1,90 @@
+import hashlib
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Protocol
+
+# Characters per token measured with the Claude tokenizer on the rewrite examples.
+CHARS_PER_TOKEN = {
+    "en": 4.2,
+    "es": 3.2,
+}
+DEFAULT_CHARS_PER_TOKEN = 3.5
+
+
+class TokenCounter(Protocol):
+    def count_tokens(self, text: str) -> int: ...
+
+
+class EstimateTokenCounter:
+    """Approximates token count from string length. Good enough for budgeting."""
+
+    def __init__(self, lang: str | None = None) -> None:
+        self.chars_per_token = CHARS_PER_TOKEN.get(lang or "en", DEFAULT_CHARS_PER_TOKEN)
+
+    def count_tokens(self, text: str) -> int:
+        return math.ceil(len(text) / self.chars_per_token)
+
+
+class TokenizerTokenCounter:
+    """Exact token count using a local `tokenizers.Tokenizer`, loaded on first use."""
+
+    def __init__(self, load_tokenizer: Callable[[], Any]) -> None:
+        self.load_tokenizer = load_tokenizer
+        self.tokenizer = None
+        self.lock = threading.Lock()
+
+    def count_tokens(self, text: str) -> int:
+        if self.tokenizer is None:
+            with self.lock:
+                if self.tokenizer is None:
+                    self.tokenizer = self.load_tokenizer()
+        return len(self.tokenizer.encode(text).ids)  # type: ignore
+
+
+class CachedTokenCounter:
+    """Bounded LRU cache in front of another counter.
+
+    Keys are digests of the text, so the cache does not keep large strings alive.
+    """
+
+    def __init__(self, counter: TokenCounter, maxsize: int = 65_536) -> None:
+        self.counter = counter
+        self.maxsize = maxsize
+        self.cache: OrderedDict[bytes, int] = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def count_tokens(self, text: str) -> int:
+        key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        with self.lock:
+            if key in self.cache:
+                self.hits += 1
+                self.cache.move_to_end(key)
+                return self.cache[key]
+
+        count = self.counter.count_tokens(text)
+
+        with self.lock:
+            self.misses += 1
+            self.cache[key] = count
+            if len(self.cache) > self.maxsize:
+                self.cache.popitem(last=False)
+        return count
+
+
+def get_token_counter(
+    name: str,
+    lang: str | None = None,
+    load_tokenizer: Callable[[], Any] | None = None,
+    maxsize: int = 65_536,
+) -> TokenCounter:
+    if name == "estimate":
+        return EstimateTokenCounter(lang)
+    elif name == "tokenizer":
+        if load_tokenizer is None:
+            raise ValueError("Tokenizer token counter requires load_tokenizer")
+        return CachedTokenCounter(TokenizerTokenCounter(load_tokenizer), maxsize=maxsize)
+    else:
+        raise ValueError(f"Unsupported token counter: {name}")
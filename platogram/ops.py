@@ -1,21 +1,32 @@
 # platogram/ops.py
 
+import logging
 import re
-from typing import Callable, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from itertools import chain
+from typing import Any, Callable, Generator, Iterable, Optional, Sequence
 from tqdm import tqdm  # type: ignore
+from platogram.checkpoint import Checkpoint, get_checkpoint_key
+from platogram.examples import available_languages, get_rewrite_examples
 from platogram.llm import LanguageModel
-from platogram.types import Content, SpeechEvent
+from platogram.types import Content, SpeechEvent, Transcript
+
+
+logger = logging.getLogger(__name__)
+
 
 def remove_markers(text: str) -> str:
     # Correct escape sequence
-    return re.sub(r"(【\\d+】)", " ", text)
+    return re.sub(r"(【\d+】)", " ", text)
 
-def parse(text_with_markers: str, marker: str = r"(【\\d+】)") -> dict[int, str]:
+def parse(text_with_markers: str, marker: str = r"(【\d+】)") -> dict[int, str]:
     """
     Parses a string containing text segments separated by numeric markers.
     Args:
         text_with_markers: The input string containing text segments and markers.
-        marker: The regular expression pattern for the markers. Default is r'(【\\d+】)'.
+        marker: The regular expression pattern for the markers. Default is r'(【\d+】)'.
     Returns:
         A dictionary where the keys are the numeric markers and the values are the text segments associated with each marker.
     Raises:
@@ -62,7 +73,7 @@ def chunk_text(
         text_with_markers: str,
         chunk_size: int,
         token_count_fn: Callable[[str], int],
-        marker: str = r"(【\\d+】)"
+        marker: str = r"(【\d+】)"
     ) -> list[str]:
     """
     Splits a string containing text segments separated by numeric markers into chunks of a specified size.
@@ -70,241 +81,552 @@ def chunk_text(
         text_with_markers: The input string containing text segments and markers.
         chunk_size: The desired maximum size of each chunk, in terms of the number of tokens.
         token_count_fn: A function that takes a string and returns the number of tokens in it.
-        marker: The regular expression pattern for the markers. Default is r'(【\\d+】)'.
+        marker: The regular expression pattern for the markers. Default is r'(【\d+】)'.
     Returns:
         A list of strings, where each string represents a chunk of the input text.
+
+    Each rendered segment is counted exactly once and chunk sizes are derived from
+    prefix sums of those counts, so the number of `token_count_fn` calls is linear
+    in the number of segments.
     """
     segments = parse(text_with_markers, marker)
-    total_tokens = token_count_fn(render(segments))
-    num_chunks = (total_tokens + chunk_size - 1) // chunk_size
+    pieces = [render({key: text}) for key, text in segments.items()]
+
+    prefix_sums = [0]
+    for piece in pieces:
+        prefix_sums.append(prefix_sums[-1] + token_count_fn(piece))
+
+    total_tokens = prefix_sums[-1]
+    num_chunks = max((total_tokens + chunk_size - 1) // chunk_size, 1)
     target_chunk_size = (total_tokens + num_chunks - 1) // num_chunks
 
     chunks = []
-    chunk_segments: dict[int, str] = {}
-    for key, segment in segments.items():
-        updated_chunk_segments = {**chunk_segments, key: segment}
-        if token_count_fn(render(updated_chunk_segments)) > target_chunk_size and chunk_segments:
-            chunks.append(chunk_segments)
-            chunk_segments = {key: segment}
-        else:
-            chunk_segments = updated_chunk_segments
+    start = 0
+    for end in range(1, len(pieces)):
+        if prefix_sums[end + 1] - prefix_sums[start] > target_chunk_size:
+            chunks.append("".join(pieces[start:end]))
+            start = end
 
-    if chunk_segments:
-        chunks.append(chunk_segments)
+    chunks.append("".join(pieces[start:]))
+    return chunks
 
-    return [render(chunk) for chunk in chunks]
+def get_markers(paragraph: str) -> list[int]:
+    return [int(marker) for marker in re.findall(r"【(\d+)】", paragraph)]
 
-def get_paragraphs(
+
+def rewrite_chunk(
+    chunk: str,
+    llm: LanguageModel,
+    examples: dict[str, list[str]],
+    max_tokens: int,
+    temperature: float,
+    lang: str,
+) -> list[str]:
+    """
+    Rewrites a chunk of text with markers into paragraphs.
+    Markers are rebased to zero before calling the LLM and shifted back afterwards,
+    so the returned paragraphs carry absolute markers.
+    """
+    segments = parse(chunk)
+    base_marker = min(segments.keys())
+    content = render({marker - base_marker: text for marker, text in segments.items()})
+
+    return [
+        re.sub(r"【(\d+)】", lambda match: f"【{int(match.group(1)) + base_marker}】", paragraph)
+        for paragraph in llm.get_paragraphs(
+            content, examples, max_tokens=max_tokens, temperature=temperature, lang=lang
+        )
+    ]
+
+
+def stitch(windows: Iterable[list[str]], window_starts: list[int]) -> Generator[str, None, None]:
+    """
+    Stitches paragraphs of overlapping windows at marker boundaries.
+    Args:
+        windows: Paragraphs with absolute markers for each window, in transcript order.
+        window_starts: The first marker of each window.
+    Yields:
+        Paragraphs where every marker appears at most once, as soon as each window is consumed.
+        Paragraphs of a window that start inside the next window's overlap are dropped in favour
+        of the next window, which saw the text that follows them. Paragraphs of the next window
+        that repeat already emitted markers are dropped, or cut after the last emitted marker
+        if they straddle it.
+    """
+    last_marker = -1
+    for i, window in enumerate(windows):
+        next_start = window_starts[i + 1] if i + 1 < len(window_starts) else None
+        keep_unmarked = False
+        unmarked: list[str] = []
+        for paragraph in window:
+            markers = get_markers(paragraph)
+            if not markers:
+                if keep_unmarked:
+                    unmarked.append(paragraph)
+                continue
+
+            yield from unmarked
+            unmarked = []
+            keep_unmarked = False
+
+            if next_start is not None and min(markers) >= next_start:
+                continue
+
+            if max(markers) <= last_marker:
+                continue
+
+            if min(markers) <= last_marker:
+                cut = max(
+                    match.end()
+                    for match in re.finditer(r"【(\d+)】", paragraph)
+                    if int(match.group(1)) <= last_marker
+                )
+                paragraph = paragraph[cut:].lstrip()
+
+            yield paragraph
+            last_marker = max(markers)
+            keep_unmarked = True
+
+        if next_start is None:
+            yield from unmarked
+
+
+def get_paragraphs_iter(
     text: str,
     llm: LanguageModel,
     max_tokens: int,
     temperature: float,
     chunk_size: int,
-    lang: Optional[str] = None
-) -> list[str]:
+    lang: Optional[str] = None,
+    concurrency: int = 1,
+    overlap: int = 16,
+    checkpoint: Optional[Checkpoint] = None,
+) -> Generator[str, None, None]:
+    """
+    Rewrites text with markers into paragraphs, yielding finalized paragraphs with absolute
+    markers as soon as each chunk is done.
+    Args:
+        concurrency: Number of chunks rewritten in parallel. With 1, chunks are rewritten
+            sequentially and the unfinished last paragraph of each chunk is carried into the next.
+            With more, each chunk is extended with `overlap` segments of the previous chunk,
+            rewritten independently and the results are stitched at marker boundaries.
+        overlap: Number of segments shared between neighbouring chunks in parallel mode.
+        checkpoint: If provided, every finished chunk is persisted and chunks already present
+            in the checkpoint are not sent to the LLM again.
+    """
     if not lang:
         lang = "en"
 
-    examples = {
-        str(example["input"]): list(example["output"]) for example in rewrite_examples[lang]
-    }
+    saved = checkpoint.load() if checkpoint else {}
+
+    examples = get_rewrite_examples(lang)
+    chunks = chunk_text(
+        text, chunk_size, lambda text: llm.count_tokens(text, estimate=True, lang=lang)
+    )
+
+    if concurrency > 1:
+        chunk_segments = [parse(chunk) for chunk in chunks]
+        windows = [chunks[0]] + [
+            render({**dict(list(previous.items())[-overlap:]), **segments}) if overlap > 0 else render(segments)
+            for previous, segments in zip(chunk_segments[:-1], chunk_segments[1:])
+        ]
+        window_starts = [min(parse(window).keys()) for window in windows]
+
+        def rewrite_window(i: int, window: str) -> list[str]:
+            if i in saved:
+                return saved[i]["paragraphs"]
+
+            paragraphs = rewrite_chunk(window, llm, examples, max_tokens, temperature, lang)
+            if checkpoint:
+                checkpoint.save(i, paragraphs)
+            return paragraphs
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = executor.map(lambda item: rewrite_window(*item), enumerate(windows))
+            yield from stitch(tqdm(results, total=len(windows)), window_starts)
+        return
+
+    resumed = 0
+    while resumed in saved:
+        resumed += 1
+
     tail = ""
-    paragraphs = []
-    chunks = chunk_text(text, chunk_size, llm.count_tokens)
     with tqdm(total=len(chunks), initial=0) as pbar:
         pbar.update(0)
         for i, chunk in enumerate(chunks):
-            chunk = tail + chunk
+            if i < resumed:
+                tail = saved[i]["tail"]
+                yield from saved[i]["paragraphs"]
+                pbar.update(1)
+                continue
 
-            base_marker = sorted(parse(chunk).keys())[0]
-            content = render({marker - base_marker: text for marker, text in parse(chunk).items()})
+            chunk = tail + chunk
 
-            for paragraph in llm.get_paragraphs(
-                content, examples, max_tokens=max_tokens, temperature=temperature, lang=lang
-            ):
-                paragraphs.append(
-                    re.sub(r"【(\\d+)】", lambda match: f"【{int(match.group(1)) + base_marker}】", paragraph)
-                )
+            paragraphs = rewrite_chunk(chunk, llm, examples, max_tokens, temperature, lang)
 
-            if i < len(chunks) - 1 and paragraphs:
-                paragraphs.pop()
-                while paragraphs and not re.findall(r"【(\\d+)】", paragraphs[-1]):
+            if i < len(chunks) - 1:
+                if paragraphs:
+                    paragraphs.pop()
+                while paragraphs and not get_markers(paragraphs[-1]):
                     paragraphs.pop()
 
-            if len(paragraphs) > 1:
-                markers = sorted([int(marker) for marker in re.findall(r"【(\\d+)】", paragraphs[-1])])
-                if markers:
-                    last_marker = markers[-1]
-                    tail = render({marker: text for marker, text in parse(chunk).items() if marker >= last_marker})
+                if paragraphs:
+                    last_marker = max(get_markers(paragraphs[-1]))
+                    tail = render({marker: text for marker, text in parse(chunk).items() if marker > last_marker})
                 else:
                     tail = chunk
-            else:
-                tail = chunk
+
+            if checkpoint:
+                checkpoint.save(i, paragraphs, tail)
+
+            yield from paragraphs
             pbar.update(1)
 
-    return paragraphs
 
-def index(
-    transcript: list[SpeechEvent],
+def get_paragraphs(
+    text: str,
     llm: LanguageModel,
-    max_tokens: int = 4096,
-    temperature: float = 0.5,
-    chunk_size: int = 2048,
-    lang: Optional[str] = None
-) -> Content:
-    text = render({i: event.text for i, event in enumerate(transcript)})
-    paragraphs = get_paragraphs(text, llm, max_tokens, temperature, chunk_size, lang=lang)
+    max_tokens: int,
+    temperature: float,
+    chunk_size: int,
+    lang: Optional[str] = None,
+    concurrency: int = 1,
+    overlap: int = 16,
+) -> list[str]:
+    return list(
+        get_paragraphs_iter(
+            text, llm, max_tokens, temperature, chunk_size, lang=lang, concurrency=concurrency, overlap=overlap
+        )
+    )
+
+
+MAX_GROUP_TOKENS = 50_000
+
+MAX_POST_STAGE_WORKERS = 4
+
+
+def group_paragraphs(
+    paragraphs: list[str], llm: LanguageModel, group_tokens: int, lang: Optional[str] = None
+) -> list[list[str]]:
+    """Splits paragraphs into consecutive groups of at most `group_tokens` (estimated) tokens each."""
+    groups: list[list[str]] = [[]]
+    size = 0
+    for paragraph in paragraphs:
+        tokens = llm.count_tokens(paragraph, estimate=True, lang=lang)
+        if groups[-1] and size + tokens > group_tokens:
+            groups.append([])
+            size = 0
+        groups[-1].append(paragraph)
+        size += tokens
+    return groups
+
+
+def get_meta_hierarchical(
+    llm: LanguageModel,
+    paragraphs: list[str],
+    lang: Optional[str] = None,
+    group_tokens: int = MAX_GROUP_TOKENS,
+    concurrency: int = MAX_POST_STAGE_WORKERS,
+) -> tuple[str, str]:
+    """
+    Title and summary of paragraphs that may not fit into a single prompt.
+    Paragraphs are split into groups of bounded size, each group is summarized in parallel and
+    the partial summaries become the paragraphs of the next round, until they fit into one prompt.
+    If a round does not reduce the number of groups, only the first group is summarized.
+    """
+    groups = group_paragraphs(paragraphs, llm, group_tokens, lang=lang)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        while len(groups) > 1:
+            metas = executor.map(lambda group: llm.get_meta(group, lang=lang), groups)
+            reduced = group_paragraphs(
+                [f"{title}. {summary}" for title, summary in metas], llm, group_tokens, lang=lang
+            )
+            # Summaries as long as their groups never fit into one prompt: keep the first group
+            if len(reduced) >= len(groups):
+                groups = reduced[:1]
+                break
 
+            groups = reduced
+
+    return llm.get_meta(groups[0], lang=lang)
+
+
+def get_chapters_hierarchical(
+    llm: LanguageModel,
+    paragraphs: list[str],
+    lang: Optional[str] = None,
+    group_tokens: int = MAX_GROUP_TOKENS,
+    concurrency: int = MAX_POST_STAGE_WORKERS,
+) -> dict[int, str]:
+    """
+    Chapters of paragraphs that may not fit into a single prompt.
+    Groups of bounded size are chaptered in parallel. Paragraphs carry absolute markers, so do
+    the partial chapters. Partial chapters are then rendered as "title【marker】" passages and
+    chaptered again, which merges neighbouring chapters, until they fit into one prompt.
+    """
+    groups = group_paragraphs(paragraphs, llm, group_tokens, lang=lang)
+    if len(groups) == 1:
+        return llm.get_chapters(paragraphs, lang=lang)
+
+    chapters: dict[int, str] = {}
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        while len(groups) > 1:
+            previous = chapters
+            chapters = {}
+            for partial in executor.map(lambda group: llm.get_chapters(group, lang=lang), groups):
+                chapters.update(partial)
+            chapters = dict(sorted(chapters.items()))
+            if previous and len(chapters) >= len(previous):
+                return chapters
+
+            groups = group_paragraphs(
+                [f"{title}【{marker}】" for marker, title in chapters.items()], llm, group_tokens, lang=lang
+            )
+
+    reduced = llm.get_chapters(groups[0], lang=lang)
+
+    # Snap every reduced marker to the partial chapter it came from.
+    markers = list(chapters.keys())
+    snapped = {}
+    for marker, title in sorted(reduced.items()):
+        marker = max([m for m in markers if m <= marker], default=markers[0])
+        snapped.setdefault(marker, title)
+    return snapped
+
+
+PostStage = Callable[[LanguageModel, list[str], Optional[str]], dict[str, Any]]
+
+post_stages: dict[str, PostStage] = {}
+
+
+def register_post_stage(name: str) -> Callable[[PostStage], PostStage]:
+    """
+    Registers a stage that runs on finished paragraphs during `index`.
+    A stage takes (llm, paragraphs, lang) and returns Content fields. It must not raise:
+    on failure it should return fallback values. All stages run concurrently.
+    """
+
+    def decorator(stage: PostStage) -> PostStage:
+        post_stages[name] = stage
+        return stage
+
+    return decorator
+
+
+@register_post_stage("meta")
+def meta_stage(llm: LanguageModel, paragraphs: list[str], lang: Optional[str]) -> dict[str, Any]:
     try:
-        title, summary = llm.get_meta(paragraphs, lang=lang)
+        title, summary = get_meta_hierarchical(llm, paragraphs, lang=lang)
     except Exception:
         title, summary = "Missing Title", "Missing Summary"
-    
+    return {"title": title, "summary": summary}
+
+
+@register_post_stage("chapters")
+def chapters_stage(llm: LanguageModel, paragraphs: list[str], lang: Optional[str]) -> dict[str, Any]:
     try:
-        chapters = llm.get_chapters(paragraphs, lang=lang)
+        chapters = get_chapters_hierarchical(llm, paragraphs, lang=lang)
     except Exception:
         chapters = {0: "All Content"}
+    return {"chapters": chapters}
+
+
+def iter_post_stages(
+    llm: LanguageModel, paragraphs: list[str], lang: Optional[str] = None
+) -> Generator[tuple[str, dict[str, Any], float], None, None]:
+    """
+    Runs all registered post stages concurrently on a bounded executor.
+    Yields:
+        Stage name, its Content fields and its wall time in seconds, in order of completion.
+    """
+
+    def run(name: str, stage: PostStage) -> tuple[str, dict[str, Any], float]:
+        start = time.perf_counter()
+        fields = stage(llm, paragraphs, lang)
+        return name, fields, time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=min(len(post_stages), MAX_POST_STAGE_WORKERS) or 1) as executor:
+        futures = [executor.submit(run, name, stage) for name, stage in post_stages.items()]
+        for future in as_completed(futures):
+            name, fields, elapsed = future.result()
+            logger.info(f"Post stage {name} took {elapsed:.2f}s")
+            yield name, fields, elapsed
+
+
+def index_stream(
+    transcript: Sequence[SpeechEvent],
+    llm: LanguageModel,
+    max_tokens: int = 4096,
+    temperature: float = 0.5,
+    chunk_size: int = 2048,
+    lang: Optional[str] = None,
+    concurrency: int = 1,
+    timings: Optional[dict[str, float]] = None,
+    checkpoint_dir: Optional[Path] = None,
+) -> Generator[tuple[str, Any], None, None]:
+    """
+    Streaming version of `index`.
+    Yields:
+        ("paragraph", paragraph) for each finalized paragraph as soon as its chunk is done,
+        then (field, value) for each Content field produced by post stages
+        ("title", "summary", "chapters") as soon as its stage is done.
+    If `timings` is provided, it is filled with wall time in seconds of each stage.
+    If `checkpoint_dir` is provided, finished chunks are persisted there under a hash of the
+    transcript and model parameters, and a re-run after a failure resumes from them.
+    """
+    text = render({i: event.text for i, event in enumerate(transcript)})
+
+    checkpoint = None
+    if checkpoint_dir is not None:
+        key = get_checkpoint_key(
+            text,
+            model=getattr(llm, "model", type(llm).__name__),
+            max_tokens=max_tokens,
+            temperature=temperature,
+            chunk_size=chunk_size,
+            lang=lang or "en",
+            parallel=concurrency > 1,
+        )
+        checkpoint = Checkpoint(checkpoint_dir, key)
+
+    start = time.perf_counter()
+    paragraphs = []
+    for paragraph in get_paragraphs_iter(
+        text, llm, max_tokens, temperature, chunk_size, lang=lang, concurrency=concurrency, checkpoint=checkpoint
+    ):
+        paragraphs.append(paragraph)
+        yield "paragraph", paragraph
+    if checkpoint:
+        checkpoint.clear()
+    elapsed = time.perf_counter() - start
+    logger.info(f"Paragraphs took {elapsed:.2f}s")
+    if timings is not None:
+        timings["paragraphs"] = elapsed
+
+    for name, fields, elapsed in iter_post_stages(llm, paragraphs, lang=lang):
+        if timings is not None:
+            timings[name] = elapsed
+        yield from fields.items()
+
+
+def index(
+    transcript: Sequence[SpeechEvent],
+    llm: LanguageModel,
+    max_tokens: int = 4096,
+    temperature: float = 0.5,
+    chunk_size: int = 2048,
+    lang: Optional[str] = None,
+    concurrency: int = 1,
+    timings: Optional[dict[str, float]] = None,
+    checkpoint_dir: Optional[Path] = None,
+) -> Content:
+    """
+    Rewrites transcript into paragraphs and runs post stages (title, summary, chapters) on them.
+    If `timings` is provided, it is filled with wall time in seconds of each stage.
+    If `checkpoint_dir` is provided, a failed run can be resumed from the last finished chunk.
+    """
+    passages = []
+    fields: dict[str, Any] = {}
+    for field, value in index_stream(
+        transcript,
+        llm,
+        max_tokens,
+        temperature,
+        chunk_size,
+        lang=lang,
+        concurrency=concurrency,
+        timings=timings,
+        checkpoint_dir=checkpoint_dir,
+    ):
+        if field == "paragraph":
+            passages.append(value)
+        else:
+            fields[field] = value
 
     return Content(
-        title=title,
-        summary=summary,
-        passages=paragraphs,
+        passages=passages,
         transcript=transcript,
-        chapters=chapters,
+        **fields,
     )
 
-rewrite_examples = {
-    "en": [
-        {
-            "input": "For two years I'm gonna lecture you on physics.【0】 I'm gonna lecture from the point of view uh that you are all going to be physicists - it's not the case, of course, but that's what every professor in every subject does.【1】 So, assuming that you're going to be physicists, we're gonna have a lot to study.【2】 Theres two hundred years of the most rapidly developing batch of knowledge that there is.【3】 So much, in fact, that you might think that you can't learn all of it in four years - 【4】and you can't: you have to go to graduate school, too.【5】But the surprising thing is, that in spite of the tremendous amount of work that's been done for all this time, it is possible to summarize all this to a very large extent - and that is, to find some kind of laws which summarizes all our knowledge.【6】 Nevertheless, it's still very hard - and it's unfair for you to start exploring this subject without some kind of a map, or an outline, of the relationship of one part of the subject of science to another.【7】 Therefore the first three lectures here will be in the form of outlining the relation of physics to the rest of the sciences, and the sciences to each other, and the meaning of science.【8】 Incidentally, each lecture here will begin by some kind of a description of what the point of the lecture's going to be;【9】 then the lecture proper will start.【10】 uh Previous to that there'll be a summary of the previous lecture, the on- the bare minimum from the lecture before that uh is necessary to keep track of.【11】 In the first three lectures nothing is necessary to keep track of;【12】 no notes need be taken, because what we're trying to develop is a feel - a feel - for the subject.【13】 Of course you can take down anything that you find interesting that you'd like to remember, but that's about it.【14】 After two weeks or so, there will be the copy of these notes will be available - that we're gonna have some kind of a way of converting this, this, these words into print.【15】【16】Now you might ask, \"Why can't we teach physics by just giving the basic laws on page one, and then just showing how they work in all the various circumstances?【17】\" something like Euclidean geometry: here are the axioms, and you make all the deductions.【18】 Now you're not satisfied to learn it in four years;【19】 you wanna learn it in four minutes.【20】 Well, we can't do it that way for two reasons.【21】 First, we don't know all the basic laws - it's an ex- there's an expanding frontier of ignorance;【22】 that we still don't know the, the answer to everything.【23】 Second, the correct statement of the laws of physics requires some very unfamiliar ideas, and requires advanced mathematics in their description.【24】 Therefore you need a considerable amount of training - first, in order to learn that what the words mean - so it is not possible to do it that way.【25】 Therefore, we can only do it piece by piece, or...【26】Yet each piece, or part of the whole of nature, is only some kind of an approximation to the complete truth or the complete truth as far as we know it;【27】 in fact, even everything that we know is only some kind of an approximation, because uh we know that we don't know all the laws yet.【28】 Therefore a great deal must be learned only to be unlearned again - or, more accurately, to be corrected.【29】【30】Now, the principle of science - the definition, almost - is the following: the test of all knowledge is experiment.【31】 Experiment is the sole judge of \"truth\" with quotation marks -  the quotation marks mean \"scientific truth\" or what we accept to be scientific.【32】 Anything is judged always by an experimental test.【33】 But what is the source of the knowledge?【34】 Where did the laws come from that are going to be tested?【35】 Experiment, too, in a sense, produces these laws - in the sense that it gives hints.【36】 But you also need imagination to create from these hints the great generalizations - to guess at the wonderful, simple, yet very strange patterns beneath it all - and then to return to experiment to check again whether you got the right guess in your imagination.【37】 This imagining process is so difficult, that there is today a partial division of labor in physics: there are theoretical physicists - who imagine, deduce, and guess at new laws, but don't experiment;【38】 and then there are experimenters - who experiment, imagine, deduce, and guess.【39】【40】Now, I said that the nature the laws of nature are approximate - and we first find the wrong ones, and then we find the right ones.【41】 Now, how can an experiment be \"wrong\"?【42】 First, in a trivial way - that something was the matter with the apparatus that you didn't notice - but these things are easily fixed, and uh checked back and forth.【43】 So, gra granting that the minor things are taken out, how can the law deduced from experiment be wrong?【44】 Only by being inaccurate.【45】 For example, the mass of an object never seemed to change - a spinning top, for example, has the same weight as a still one.【46】 So a law was ju- was invented: mass is constant, independent of speed.【47】 That is now found to be incorrect: the mass does increase with velocity, but appreciable increases require velocities nearly that of light.【48】 A true law is: if an object moves less than a hundred miles a second, the mass is constant to within one part in a million.【49】 And, you see, in some approximate form is the correct law.【50】 So in practice, you see, you'd think that the new law made very little difference.【51】 Well, yes and uh no: for ordinary speeds, we can certainly forget it, and use the simple constant law as a good approximation.【52】 Yet for high speeds we are wrong, and the higher the speed, the more completely wrong.【53】【54】Finally, in a most interesting way, philosophically we are completely wrong with the approximate law: our entire picture of the world has to be altered when the mass is changed only by a little bit, if it isn't constant.【55】 That is the very peculiar thing about the philosophy, or the basic ideas, behind the laws: very small effects require profound changes in our ideas.【56】【57】Well, what should we teach first, if we're going to teach?【58】 Shall we teach the correct, more exact law, with its strange and different, difficult conceptual ideas - for example, in this particular case, the theory of relativity, four-dimensional space-time, and so on - or shall we first teach the simpler constant-mass law, which is only approximate, but does not involve such difficult ideas?【59】 The first is more exciting and more wonderful, more fun - but the second is easier to get at at first, and is a first step to a real understanding of the first idea.【60】 Now, this problem arises again and again in teaching physics, and at different times we'll have to resolve it in different ways.【61】 But in any case it's worth knowing at each stage what we are learning, how accurate it is, how it fits in to everything else, how it may be changed when we learn more.【62】",
-            "output": [
-                "This two-year course in physics is presented from the point of view that you, the reader, are going to be a physicist.【0】 This is not necessarily the case of course, but that is what every professor in every subject assumes!【1】 If you are going to be a physicist, you will have a lot to study:【2】 two hundred years of the most rapidly developing field of knowledge that there is.【3】 So much knowledge, in fact, that you might think that you cannot learn all of it in four years,【4】 and truly you cannot; you will have to go to graduate school too!【5】",
-                'Surprisingly enough, in spite of the tremendous amount of work that has been done for all this time it is possible to condense the enormous mass of results to a large extent - that is, to find _laws_ which summarize all our knowledge.【6】 Even so, the laws are so hard to grasp that it is unfair to you to start exploring this tremendous subject without some kind of map or outline of the relationship of one part of the subject of science to another.【7】 Following these preliminary remarks, the first three chapters will therefore outline the relation of physics to the rest of the sciences, the relations of the sciences to each other, and the meaning of science,【8】 to help us develop a "feel" for the subject.【8】【9】【10】【11】【12】【13】',
-                "You might ask why we cannot teach physics by just giving the basic laws on page one and then showing how they work in all possible circumstances,【17】 as we do in Euclidean geometry, where we state the axioms and then make all sorts of deductions.【18】 (So, not satisfied to learn physics in four years,【19】 you want to learn it in four minutes?【20】) We cannot do it in this way for two reasons.【21】 First, we do not yet _know_ all the basic laws: there is an expanding frontier of ignorance.【22】【23】 Second, the correct statement of the laws of physics involves some very unfamiliar ideas which require advanced mathematics for their description.【24】 Therefore, one needs a considerable amount of preparatory training even to learn what the _words_ mean.【25】 No, it is not possible to do it that way.【26】",
-                "Each piece, or part, of the whole of nature is always merely an _approximation_ to the complete truth, or the complete truth so far as we know it.【27】 In fact, everything we know is only some kind of approximation, because _we know that we do not know all the laws as yet_.【28】 Therefore, things must be learned only to be unlearned again or, more likely, to be corrected.【29】【30】",
-                'The principle of science, the definition, almost, is the following: _The test of all knowledge is experiment_.【31】 Experiment is the _sole judge_ of scientific "truth."【32】 But what is the source of knowledge?【34】 Where do the laws that are to be tested come from?【35】 Experiment, itself, helps to produce these laws, in the sense that it gives us hints.【36】 But also needed is _imagination_ to create from these hints the great generalizations - to guess at the wonderful, simple, but very strange patterns beneath them all, and then to experiment to check again whether we have made the right guess.【37】 This imagining process is so difficult that there is a division of labor in physics: there are _theoretical_ physicists who imagine, deduce, and guess at new laws, but do not experiment;【38】 and then there are _experimental_ physicists who experiment, imagine, deduce, and guess.【39】【40】',
-                'We said that the laws of nature are approximate: that we first find the "wrong" ones, and then we find the "right" ones.【41】 Now, how can an experiment be "wrong"?【42】 First, in a trivial way: if something is wrong with the apparatus that you did not notice. But these things are easily fixed, and checked back and forth.【43】 So without snatching at such minor things, how _can_ the results of an experiment be wrong?【44】 Only by being inaccurate.【45】 For example, the mass of an object never seems to change: a spinning top has the same weight as a still one.【46】 So a "law" was invented: mass is constant, independent of speed.【47】 That "law" is now found to be incorrect. Mass is found to increase with velocity, but appreciable increases require velocities near that of light.【48】 A _true_ law is: if an object moves with a speed of less than one hundred miles a second the mass is constant to within one part in a million.【49】 In some such approximate form this is a correct law.【50】 So in practice one might think that the new law makes no significant difference.【51】 Well, yes and no. For ordinary speeds we can certainly forget it and use the simple constant-mass law as a good approximation.【52】 But for high speeds we are wrong, and the higher the speed, the more wrong we are.【53】【54】',
-                "Finally, and most interesting, _philosophically we are completely wrong_ with the approximate law.【55】 Our entire picture of the world has to be altered even though the mass changes only by a little bit.【56】 This is a very peculiar thing about the philosophy, or the ideas, behind the laws. Even a very small effect sometimes requires profound changes in our ideas. 【57】",
-                'Now, what should we teach first?【58】 Should we teach the _correct_ but unfamiliar law with its strange and difficult conceptual ideas, for example the theory of relativity, four-dimensional space-time, and so on?【59】 Or should we first teach the simple "constant-mass" law, which is only approximate, but does not involve such difficult ideas? The first is more exciting, more wonderful, and more fun, but the second is easier to get at first, and is a first step to a real understanding of the first idea.【60】 This point arises again and again in teaching physics.【61】 At different times we shall have to resolve it in different ways, but at each stage it is worth learning what is now known, how accurate it is, how it fits into everything else, and how it may be changed when we learn more.【62】',
-            ],
-        },
-        {
-            "input": "And therefore, in the first three lectures here, we're going to try to give an outline or a general map of our understanding of science today so that you can - in particular, physics, but other sciences at the periphery, uh from the point of view that we're taking here.【0】 The purpose of this these first three lectures, then, is to get a feel for the whole thing, so that when we do concentrate and look very closely at a particular point, we have some idea of what the background is, and why that particular point is interesting, and how it fits into the big structure - so that's the purpose of the first three lectures.【1】 In other words, the first three lectures are the main point \"what is our overall picture of the world?【2】\"【3】Now, I'm a-going to begin this p- the first lecture - which is on atoms in motion.【4】 If, in some cataclysm, all of the scientific knowledge is to be destroyed, but only one sentence is to be passed on to the next generations of creatures, what would be the best thing, the thing that contains the most information in the least number of words?【5】 I believe it is the hyp- atomic hypothesis or the atomic fact, or whatever you want to call it that all things are made out of atoms - little particles that move around, are in perpetual motion, attract each other when they are some distance apart, but repel being squeezed into one another.【6】 In that one sentence you'll see there's an enormous amount of information about the world if just a little imagination and thinking is applied.【7】【8】In order to... It's the purpose of this lecture to illustrate that idea, and uh I do it this way.【9】 Suppose that we have a drop of water, say a quarter of an inch on a side, and if we look at it very closely, we see nothing but water - smooth, continuous water.【10】 Now, if we magnify it with the best microscope, light microscope, I mean, that's available, roughly two thousand times, then the water would drop would be forty feet across - about as big as a room, or so - and if we look uh at it closely, we would see that it is again a relatively smooth water, but here and there are small football-shaped things swimming back and forth - very interesting!【11】 - those are paramecia.【12】 And you may stop off at this level and get so curious about the paramecia with their wiggling cilia and twisting bodies, that you don't go any further in this particular line except to hope that you could make the paramecium still larger, and see what's inside.【13】 This of course is a subject of biology, but for the present lecture I must pass that and go down still further.【14】 Magnif.【15】 Looking at the water material itself, and magnifying it uh two thousand times again, now the drop of water extends from here to Los Angeles, about fifteen miles across.【16】 And if you look very closely at it you'll see a kind of teeming - something that look, appears it's no longer smooth;【17】 that it's something like a crowd would appear at a football game, as seen from a very great distance.【18】 In order to see what this \"teeming\" is about, we'll magnify it another two hundred and fifty times so we get a better look at this thing, and we'll see something like what's shown on the first slide.【19】 This picture of water magnified a billion times is idealized in several ways.【20】 In the first place, the particles are drawn in a simple manner, with sharp edges - which is inaccurate.【21】 Secondly, for simplicity I've sketched it almost schematically in a two-dimensional arrangement, but as you must appreciate, these things are moving around in three dimensions, and it's very much harder to draw - so this is not a real picture, but a kinda idealization.【22】 I would like you to notice that there's two kinds of blobs, or circles, here - those are the atoms: there's a atom of oxygen, which is made in black, and an atom of hydrogen is pictured as a white circle - and you'll notice that each one that each white one has two hydrogens tied on to it.【23】 There's another way in which this thing is idealized, and that is that the particles in this picture are really in fact  're always in motion: they're in a continuous jiggling and bouncing, turning and twisting around one another - so you'll have to imagine this in a dynamic way, rather than a static way.【24】 Another thing that cannot be illustrated in a drawing is the fact that they are stuck together, that they attract each other - that this one is pulled toward this one, and b- and so forth, so that the whole bunch of them are glued sort of together, roughly, uh in a big clump.【25】 On the opposite hand, they do not pass through each other: if you try to squeeze two of them too close together, they do repel.【26】  So we have this picture of jiggling balls bouncing around in the water.【27】 As a consequence, of course our drop of water fifteen miles across is now two hundred and fifty times fifteen, or from here to Chicago, approximately, or bigger.【28】【29】And, uh you can remember the size of these atoms roughly this way: you can either remember that the atoms are from between one and two times ten to the minus eight centimeters in diameter -  ten to the minus eight centimeters is also called an angstrom, so we say just as another name, so we say they're about one or two angstroms in diameter.【30】 Another way to remember the size is this: if you take an apple and magnify it to the size of the earth, then the atoms in the apple are approximately the size of an apple - so that's another way - it's either way;【31】 you can remember it either way.【32】【33】Now, you could imagine, then, this great drop of water, with all these things stuck together and tumbling over each other.【34】 The water keeps its volume: it doesn't pu- fall apart, because of the attraction of the ato- of the molecules or the atoms for each other.【35】 Supposing if you had a slope, for example, that in the tumbling they can move the whole drop of water from one place to another - the water can flow - but it doesn't just disappear;【36】 the things don't just fly apart, on account of the attraction.【37】 Now, the motion is what we represent - or what we notice, rather, as heat - and when we increase the temperature, we increase the motion.【38】 If we heat the water up, the jiggling increases, increases - the banging between the atoms or molecules increases all the time - until there comes a time when, in a collision, there's not en- there's so much speed that it's this pull between them is not enough to hold them together, and they fly apart and become separated from one another.【39】 Of course what I'm describing is the manufacture of steam out of water by increasing the temperature - the things flying apart because of the increased motions.【40】【41】So in the next picture, we have a - next slide - , we have a picture of steam.【42】 Now it is much more clear how the molecules are formed.【43】 This picture of steam fails in one respect: the in ordinary pressures, this atmospheric pressure of steam, there might be only a few molier- not very many molecules in this whole room;【44】 there certainly wouldn't be as many as three - most squares of this size would contain nothing, and I accidentally have two and a half or three in the picture, but that's just so it isn't completely boring: you have three things to look at!【45】 You see the characteristic molecules are much clearer in the case of steam than they are in the case of water.【46】 In this molecule I've drawn them on the slide so there's a hundred and twenty degree angle here, for simplicity.【47】 In actual fact the angle is a hundred and five degrees, three minutes - and the distance between the center of the hydrogen and the center of the oxygen is point nine five seven angstroms - so we know this molecule very well.【48】 In fact, we probably know it better, but I couldn't get more accurate figures in the short time available.【49】【50】Now let's see what some of the properties are of steam vapor, or any other gas, because these things, having being separated from one another, will bounce against the walls: imagine this room with a number of tennis balls - or not very many;【51】 a hundred tennis balls, or something - bouncing around in all directions because of the heat that they have, in perpetual motion.【52】 Then they'll of course bounce against the walls and bombard it, and this rep- pushes the wall away.【53】 Of course you hold the wall back;【54】 that requires that means that the gas exerts a pressure, which our coarse senses not having ourselves magnified a billion times, we feel it only as an average push.【55】 So in order to confine a gas, we have a pressure.【56】 So here is a picture, for example, of a standard vessel for holding gases - in all textbooks - which consists of a cylinder with a piston head on it.【57】 Or I don't know why all gases are always contained in cylinders with piston heads, but that's what we'll will represent here.【58】 Now, it doesn't make any difference what the shape of the water molecules are, so for simplicity I'll draw them as tennis balls or little dots, and these things are in perpetual motion in all directions.【59】 So, many of them are hitting all the time the top piston, and in order to keep it from from being patiently knocked out of the tank - slowly knocked out of the tank - by the continuous banging, I have to hold the piston down by a certain force which I call the pressure or really the pressure times the area is the force, but never mind, it's -  Clearly the force... Clearly the force is proportional to the area if, when I increase the area, I keep the number of molecules per cc the same.【60】【61】Now, if I put twice as many molecules in this tank at the same speed, that represents then the same temperature, but twice as number of atoms - that's twice the density - then, within an excellent approximation, the number of collisions will be twice as much, and they will be as energetic as before, and the pressure will be increased by a factor two.【62】 So the pressure is proportional to the density.【63】",
-            "output": [
-                "Let us now proceed with our outline, or general map, of our understanding of science today (in particular, physics, but also of other sciences on the periphery), so that when we later concentrate on some particular point we will have some idea of the background, why that particular point is interesting, and how it fits into the big structure.【0】【1】 So, what _is_ our overall picture of the world?【2】【3】",
-                "If, in some cataclysm, all of scientific knowledge were to be destroyed,【4】 and only one sentence passed on to the next generations of creatures, what statement would contain the most information in the fewest words?【5】 I believe it is the _atomic hypothesis_ (or the atomic _fact_, or whatever you wish to call it) that _all things are made of atoms - little particles that move around in perpetual motion, attracting each other when they are a little distance apart, but repelling upon being squeezed into one another_.【6】 In that one sentence, you will see, there is an _enormous_ amount of information about the world,【7】 if just a little imagination and thinking are applied.【8】",
-                'To illustrate the power of the atomic idea, suppose that we have a drop of water a quarter of an inch on the side.【9】 If we look at it very closely we see nothing but water - smooth, continuous water.【10】 Even if we magnify it with the best optical microscope available - roughly two thousand times - then the water drop will be roughly forty feet across, about as big as a large room, and if we looked rather closely, we would _still_ see relatively smooth water - but here and there small football-shaped things swimming back and forth.【11】 Very interesting.【12】 These are paramecia.【13】 You may stop at this point and get so curious about the paramecia with their wiggling cilia and twisting bodies that you go no further, except perhaps to magnify the paramecia still more and see inside.【14】 This, of course, is a subject for biology, but for the present we pass on and look still more closely at the water material itself, magnifying it two thousand times again.【15】 Now the drop of water extends about fifteen miles across,【16】 and if we look very closely at it we see a kind of teeming, something which no longer has a smooth appearance【17】 - it looks something like a crowd at a football game as seen from a very great distance.【18】 In order to see what this teeming is about, we will magnify it another two hundred and fifty times and we will see something similar to what is shown in Fig. 1-1.【19】 This is a picture of water magnified a billion times, but idealized in several ways.【20】 In the first place, the particles are drawn in a simple manner with sharp edges, which is inaccurate.【21】 Secondly, for simplicity, they are sketched almost schematically in a two-dimensional arrangement, but of course they are moving around in three dimensions.【22】 Notice that there are two kinds of "blobs" or circles to represent the atoms of oxygen (black) and hydrogen (white), and that each oxygen has two hydrogens tied to it.【23】 (Each little group of an oxygen with its two hydrogens is called a molecule.) The picture is idealized further in that the real particles in nature are continually jiggling and bouncing, turning and twisting around one another.【24】 You will have to imagine this as a dynamic rather than a static picture.【25】 Another thing that cannot be illustrated in a drawing is the fact that the particles are "stuck together" - that they attract each other, this one pulled by that one, etc.【26】 The whole group is "glued together," so to speak. On the other hand, the particles do not squeeze through each other. If you try to squeeze two of them too close together, they repel.【27】【28】【29】',
-                "The atoms are 11 or 2x10^8 cm in radius.【30】 Now 10^8 cm is called an _angstrom_ (just as another name), so we say they are 1 or 2 angstroms (Å) in radius. Another way to remember their size is this:【31】 if an apple is magnified to the size of the earth, then the atoms in the apple are approximately the size of the original apple.【32】【33】",
-                "Now imagine this great drop of water with all of these jiggling particles stuck together and tagging along with each other.【34】 The water keeps its volume; it does not fall apart, because of the attraction of the molecules for each other.【35】 If the drop is on a slope, where it can move from one place to another, the water will flow, but it does not just disappear - things do not just fly apart - because of the molecular attraction.【36】【37】 Now the jiggling motion is what we represent as _heat_: when we increase the temperature, we increase the motion.【38】 If we heat the water, the jiggling increases and the volume between the atoms increases, and if the heating continues there comes a time when the pull between the molecules is not enough to hold them together and they _do_ fly apart and become separated from one another.【39】 Of course, this is how we manufacture steam out of water - by increasing the temperature; the particles fly apart because of the increased motion.【40】【41】",
-                "In Fig. 1-2 we have a picture of steam.【42】 This picture of steam fails in one respect: at ordinary atmospheric pressure there certainly would not be as many as three water molecules in this figure.【44】 Most squares this size would contain none - but we accidentally have two and a half or three in the picture (just so it would not be completely blank).【45】 Now in the case of steam we see the characteristic molecules more clearly than in the case of water.【46】 For simplicity, the molecules are drawn so that there is a 120∘120∘ angle between the hydrogen atoms.【47】 In actual fact the angle is 105∘3′105∘3′, and the distance between the center of a hydrogen and the center of the oxygen is 0.957 Å, so we know this molecule very well.【48】",
-                "Let us see what some of the properties of steam vapor or any other gas are. The molecules, being separated from one another, will bounce against the walls.【51】 Imagine a room with a number of tennis balls (a hundred or so) bouncing around in perpetual motion.【52】 When they bombard the wall, this pushes the wall away.【53】 (Of course we would have to push the wall back.)【54】 This means that the gas exerts a jittery force which our coarse senses (not being ourselves magnified a billion times) feel only as an _average push_.【55】 In order to confine a gas we must apply a pressure.【56】 Figure 1-3 shows a standard vessel for holding gases (used in all textbooks), a cylinder with a piston in it.【57】 Now, it makes no difference what the shapes of water molecules are, so for simplicity we shall draw them as tennis balls or little dots, and these things are in perpetual motion in all directions.【58】【59】 So many of them are hitting the top piston all the time that to keep it from being patiently knocked out of the tank by this continuous banging, we shall have to hold the piston down by a certain force, which we call the _pressure_ (really, the pressure times the area is the force).【60】 Clearly, the force is proportional to the area, for if we increase the area but keep the number of molecules per cubic centimeter the same, we increase the number of collisions with the piston in the same proportion as the area was increased.【61】",
-                'Now let us put twice as many molecules in this tank, so as to double the density, and let them have the same speed, i.e., the same temperature.【62】 Then, to a close approximation, the number of collisions will be doubled, and since each will be just as "energetic" as before, the pressure is proportional to the density.【63】 ',
-            ],
-        },
-        {
-            "input": "Now you can see something else: if I increase the temperature without changing the density of the gas, that means if I increase the speed of the atoms, what's gonna happen to the pressure?【0】 Well, they hit harder because they're moving faster, so the pressure increases - you see how simple the ideas of atomic theory are.【1】【2】Let me take another example that's still more... that's another...Well, let's consider another thing: suppose that the piston is moving down.【3】 Well, the atoms are being compressed into a smaller space.【4】 What happens when an atom hits a moving piston?【5】 If it's moving around like this, and it hits a moving mirror, or bounces off a moving wall, evidently it picks up speed from the collision - you can try it by bouncing a ping pong ball off a moving bowling ball, for example - and you'll find that it comes off with more speed than it went in.【6】 Special example: if it happens to be standing still, and the piston hits it, it'll certainly go down.【7】 So it's clear that it comes off on, in average, with more speed than it comes in.【8】 Therefore, after a while the atoms which are in here will have picked up speed.【9】 That means that when we compress a gas slowly, the temperature of the gas increases.【10】 So under com- slow compression a gas will increase its temperature.【11】 And then the slow expansion, what?【12】 In the case of expansion, if the piston is moving up, then each atom which hits this piston, which is moving out, goes in - if I may crudely speak of it - into a yielding material a place thing that's going back, and the energy that the atoms have is decreased.【13】 Therefore gases cool on expansion.【14】 Now that's the di- direction of increasing the temperature of the water.【15】【16】Let's look in the other direction.【17】 Suppose that we decrease the temperature.【18】 Suppose that the jiggling of the atoms - of the molecules, or the atoms in the water - is slowing down, slowing down all the time.【19】 Now, you know that the forces - there are forces of attraction between the atoms - and after a while they can't be able to jiggle so well - and d- what'll happen at very low temperatures is indicated in the next slide.【20】 What happens is, that they lock in to a new pattern, what'sk a pattern of ss - will you turn out the lights so we can see the ice better?【21】 - to a... to a pattern which is solid.【22】 In this particular schematic diagram of ice - which is wrong because it's in two dimensions, but is right qualitatively I have a three-dimensional model here too I'll explain perhaps later - we have the oxygen atoms and the hydrogens, with two hydrogens on each oxygen as before, but they all are s- the hydrogens are touching each other, and the whole thing is stuck together in a certain array.【23】 This is not the exact array;【24】 of course it's a two-dimensional thing;【25】 the exact array of course is a three-dimensional thing that's hard to portray.【26】 However, the point is is that's interesting is that the material has a definite place for every atom, and you can easily appreciate that if somehow or other I were to hold all these atoms in a certain arrangement, in a certain place, then because of the structure of interconnections, which is rigid, the other end - \"miles\" away - would have a definite location.【27】 So if I hold a piece of ice, or a needle of ice, at one end, the other end resists my pushing it down - unlike the case of water, in which this structure, because of the increased jiggling, is broken down so that the atoms all move around in all different ways.【28】 Then the organization of the atoms in this thing, even if they're held in place, will not pass itself from atom to atom in all directions to the other end, and our little crystal will just sag and drip down as we increase the temperature.【29】 So the difference between solids and liquids is, tha- is that in a solid the atoms are arranged in some kind of an array and, uh, an array of what's is called a crystalline array - a crystalline array - and they do not have a random position at long distances, but the position of some of the atoms at a long distance away is lo- is determined by where the atoms are, some \"millions of miles\" on the other side of the crystal.【30】 Of course I mean \"millions of miles\" at this scale, of course - a small distance in nature.【31】 This particular slide is an an invented arrangement for ice, and it contains several of the correct features of ice but is not the true arrangement.【32】 One of the correct features is that there's a pattern of symmetry that's hexagonal.【33】 You can see it if you turn this whole picture I don't mean the out- the border, but the atoms themselves around an axis, say here, by thirty, by s- uh hundred and twenty degrees for example, then the picture returns to itself - so that there's a symmetry in the ice, a six-sided symmetry, which accounts for the six-sided appearance of snowflakes, for example.【34】 So in there is the form of snowflakes, hidden.【35】 Another thing that's illustrated by this particular artificial model is the fact that, particularly, that ice shrinks when it melts.【36】 You'll note this particular pattern that's arranged here had lots of holes in it.【37】 Now, the true ice structure has a lotta holes in it, and when the organization breaks down, these holes can be occupied by the molecules - and so the volume of the water is less than that of ice.【38】 Most substances, with the exceptions of - common substances that are exceptions are are water, and type metal... Usually things contract expand when they melt, because usually the packing is tighter than this when it's cold, and when it melts it needs more room to jiggle around - so that usually it expands.【39】 But sometimes, when it's an open structure, it collapses when it melts, as it does in the case of water.【40】【41】Finally, I may say that although this is how I keep talking about this as a rigid arrangement, ice temperature can change;【42】 ice has \"heat\" if you wish, and you can change the amount of heat.【43】 What is the \"heat\" in the case of ice?【44】 Well, these things aren't really just standing still there;【45】 they're jiggling in place, vibrating, trying to get out of there - all jiggling, like a - wiggling, all the time, like a - oh, I don't know, you take a mattress springs, or something, and imagine them all wiggling all the time.【46】 So there's a definite order to the thing;【47】 it's got a structure, but they're all the things are jiggling in place.【48】 As you increase the temperature they jiggle in place with a wider and wider shaking until the shaking is so wide, so big, that they pull themselves out of place, and we get the melting.【49】 As you decrease the temperature the jiggling decreases and decreases, until at the absolute zero there's a minimum amount of jiggling that matter can have - not zero, but there's a certain minimum amount of jiggling that matter can have.【50】 As a matter of fact, this minimum amount of jiggling that a- things can have in all cases is not enough to melt the thing, so everything is solid at absolute zero with one exception, and that's helium.【51】 Helium never solidifies;【52】 the minimal jiggling at absolute zero is still enough to keep it meltin'.【53】 So helium, at zero temperature even, never freezes - unless the pressure is made so high as to help the things;【54】 they get squashed together - if you increase the pressure, then you can make it solidify.【55】【56】Now, that's so much for the description of solids, liquids, and gases from the atomic point of view - but the atomic point of view also describes processes.【57】 And so I'd like to go and diss- look at a number of processes uh to see how they look from an atomic standpoint.【58】 The first u- process that I would like to look at is associated with the surface of the water.【59】 What happens at the surface of the water?【60】 And this time I'll make the pictures more complicated and realistic by imagining that the surface is in air.【61】 And this is illustrated in the next picture.【62】 Here is a surface of water in air.【63】 You may rec- notice the water molecules as before, and down here, and below, is the liquid water - and this is the surface of it.【64】 Above you'll find a number of funny things.【65】 First of all, there's some water molecules, like the steam - that's water vapor that's always there above water.【66】 There's a mixt- there's a equilibrium between the vapor - or steam vapor - and the liquid water, which I'll explain in a minute.【67】 But in addition, you'll find some other thing.【68】 Here's two black ones stuck together;【69】 the black ones are called oxygen atoms, and two oxygen atoms stick together also by themself, forming another kinda molecule - or oxygen molecule.【70】 In addition there's these cross ha- cross-hatched things, which are nitrogen atoms, and they stick together in pairs, too, to make a molecule.【71】 Air consists almost entirely with a fl- few uh impurities of different things of... of, uh... nitrogen, oxygen, some water vapor, and few other things - carbon dioxide, argon, and traces of other thing .【72】 So here's the air, a gas containing some water vapor.【73】 Now, what's happening in this picture?【74】 The molecules of the water are always jiggling around.【75】 From time to time in the jiggling, one near the surface happens to be hit a little harder on the accident just an accident a little harder than usual, and gets pushed away - say.【76】 I mean, it's hard to say,  'cause it's a still picture, just what's happening here.【77】 But this one has just been hit, for example, and it's flying out - or perhaps this one is the one is the one that's just been hit and flying out - so that, molecule by molecule, the water disappears.【78】 It evaporates.【79】 But if we close the vessel above, after a while we have a large number of molecules of water amongst the air -  because they have nowhere else to go.【80】 In other words, if we have a closed uh vessel, the wa- then what happens?【81】 Then - let me take this one - from time to time, one of them that's out here comes flying down into the water and gets stuck again.【82】 So that i- what looks like a dead, uninteresting thing - a glass of water with a cover that's been sitting there for twenty years - is a dynamic, ex- an interesting phenomenon going on all the time.【83】 To our dumb eyes, our crude eyes, nothing's changing, but if you could see it a billion times magnified, you'd see that from its own point of view it's always changing: molecules are leaving the surface;【84】 molecules are coming back, back and forth.【85】【86】Why doesn't it change?【87】 Because just as many are leaving as are coming back, so in the long run, nothing happens.【88】 If I then take the top of a vessel off, take the glass off, and blow the air away - if I make a stream that sweeps across here, and takes away these molecules of water, replacing  'em just by air - then the number that are leaving is still the same as it was before because it depends on the jiggling of the water, but the number that are coming back is reduced very much, because there are so much fewer molecules above the water.【89】 Therefore there's more out than in, and it evaporates - hence, you want it to evaporate, turn on the fan.【90】【91】Now there's something else: which molecules leave?【92】 When a molecule leaves, it's because of an accidental extra accumulation of a little bit more-than-ordinary knocking, or fo- banging.【93】 Therefore those that leave have, on the average, more energy than the average molecule that's in here.【94】 So the ones that are leaving take away energy, and leave the ones behind with a less average motion than they had before - the more uh mo- moving ones are the ones that leave.【95】 So the liquid gradually cools, if it evaporates.【96】 Of course when one comes back, because of the attraction to the water below, when it comes in there's a sudden great attraction, and there's a snapping - in other words, a generation of heat.【97】 So when they're coming back they generate heat;【98】 when they leave they take away heat - and the result, of course, in the when there's no net evaporation, is nothing - there no change in temperature.【99】 But if I blow, so as to maintain a continuous increase in the number - there 're more going out than coming in - then the water is cooled.【100】 Hence blow on soup, if you wanna cool it off.【101】【102】I also want you to notice that the processes are more complicated.【103】 Not only does the water go into the air, but you can imagine among the collisions that from time to time, one of these molecules may come in here, get lost in the mer- in the mess, and work its way into the water, so that the air dissolves in the water - both oxygen, which is not illustrated, and nitrogen molecules will work their way into the water, and the water will contain nitrogen.【104】 Of course if we suddenly take the air away, then these nitrogen molecules will leave more rapidly than they come in, and uh in doing so will make bubbles.【105】 This is uh very bad for divers, as you well know: when you have a high-pressure air, which you're breathing, then in the blood more nitrogen is dissolved than ordinarily, because high pressure just means a large density of the nitrogen - so that more of them are going in, when it's high.【106】 When you decrease the pressure, they try to come out, and make bubbles.【107】 So that's what happens, and the bubbles are not good for the heart.【108】",
-            "output": [
-                "We can also see something else: If we increase the temperature without changing the density of the gas,【0】 i.e., if we increase the speed of the atoms, what is going to happen to the pressure? Well, the atoms hit harder because they are moving faster,【1】 and in addition they hit more often, so the pressure increases. You see how simple the ideas of atomic theory are.【2】",
-                'Let us consider another situation. Suppose that the piston moves inward, so that the atoms are slowly compressed into a smaller space.【3】【4】 What happens when an atom hits the moving piston?【5】 Evidently it picks up speed from the collision. You can try it by bouncing a ping-pong ball from a forward-moving paddle, for example, and you will find that it comes off with more speed than that with which it struck.【6】 (Special example: if an atom happens to be standing still and the piston hits it, it will certainly move.)【7】 So the atoms are "hotter" when they come away from the piston than they were before they struck it.【8】 Therefore all the atoms which are in the vessel will have picked up speed.【9】 This means that _when we compress a gas slowly, the temperature of the gas increases_.【10】【11】 So, under slow _compression_, a gas will _increase_ in temperature, and under slow _expansion_ it will _decrease_ in temperature.【12】【13】【14】',
-                'We now return to our drop of water and look in another direction.【17】 Suppose that we decrease the temperature of our drop of water.【18】 Suppose that the jiggling of the molecules of the atoms in the water is steadily decreasing.【19】 We know that there are forces of attraction between the atoms, so that after a while they will not be able to jiggle so well.【20】 What will happen at very low temperatures is indicated in Fig. 1-4:【21】 the molecules lock into a new pattern which is _ice_.【22】 This particular schematic diagram of ice is wrong because it is in two dimensions, but it is right qualitatively.【23】【24】【25】 The interesting point is that the material has a _definite place for every atom_,【26】 and you can easily appreciate that if somehow or other we were to hold all the atoms at one end of the drop in a certain arrangement, each atom in a certain place, then because of the structure of interconnections, which is rigid, the other end miles away (at our magnified scale) will have a definite location.【27】 So if we hold a needle of ice at one end, the other end resists our pushing it aside, unlike the case of water, in which the structure is broken down because of the increased jiggling so that the atoms all move around in different ways.【28】 The difference between solids and liquids is, then, that in a solid the atoms are arranged in some kind of an array, called a _crystalline array_,【29】 and they do not have a random position at long distances;【30】 the position of the atoms on one side of the crystal is determined by that of other atoms millions of atoms away on the other side of the crystal.【31】 Figure 1-4 is an invented arrangement for ice, and although it contains many of the correct features of ice, it is not the true arrangement.【32】 One of the correct features is that there is a part of the symmetry that is hexagonal.【33】 You can see that if we turn the picture around an axis by 60∘60∘, the picture returns to itself. So there is a _symmetry_ in the ice which accounts for the six-sided appearance of snowflakes.【34】【35】 Another thing we can see from Fig. 1-4 is why ice shrinks when it melts.【36】 The particular crystal pattern of ice shown here has many "holes" in it,【37】 as does the true ice structure.【38】 When the organization breaks down, these holes can be occupied by molecules. Most simple substances, with the exception of water and type metal, _expand_ upon melting,【39】 because the atoms are closely packed in the solid crystal and upon melting need more room to jiggle around, but an open structure collapses, as in the case of water.【40】【41】',
-                'Now although ice has a "rigid" crystalline form, its temperature can change - ice has heat.【42】 If we wish, we can change the amount of heat.【43】 What is the heat in the case of ice?【44】 The atoms are not standing still.【45】 They are jiggling and vibrating. So even though there is a definite order to the crystal - a definite structure - all of the atoms are vibrating "in place."【46】【47】 As we increase the temperature, they vibrate with greater and greater amplitude, until they shake themselves out of place.【48】【49】 We call this _melting_. As we decrease the temperature, the vibration decreases and decreases until, at absolute zero, there is a minimum amount of vibration that the atoms can have, but _not zero_.【50】 This minimum amount of motion that atoms can have is not enough to melt a substance, with one exception: helium.【51】 Helium merely decreases the atomic motions as much as it can, but even at absolute zero there is still enough motion to keep it from freezing.【52】【53】 Helium, even at absolute zero, does not freeze, unless the pressure is made so great as to make the atoms squash together.【54】 If we increase the pressure, we _can_ make it solidify.【55】【56】',
-                "So much for the description of solids, liquids, and gases from the atomic point of view.【57】 However, the atomic hypothesis also describes _processes_,【58】 and so we shall now look at a number of processes from an atomic standpoint. The first process that we shall look at is associated with the surface of the water.【59】 What happens at the surface of the water?【60】 We shall now make the picture more complicated - and more realistic - by imagining that the surface is in air.【61】 Figure 1-5 shows the surface of water in air.【62】【63】 We see the water molecules as before, forming a body of liquid water, but now we also see the surface of the water.【64】 Above the surface we find a number of things:【65】 First of all there are water molecules, as in steam.【66】 This is _water vapor_, which is always found above liquid water. (There is an equilibrium between the steam vapor and the water which will be described later.)【67】 In addition we find some other molecules - 【68】【69】here two oxygen atoms stuck together by themselves, forming an _oxygen molecule_,【70】 there two nitrogen atoms also stuck together to make a nitrogen molecule.【71】 Air consists almost entirely of nitrogen, oxygen, some water vapor, and lesser amounts of carbon dioxide, argon, and other things.【72】 So above the water surface is the air, a gas, containing some water vapor.【73】 Now what is happening in this picture?【74】 The molecules in the water are always jiggling around.【75】 From time to time, one on the surface happens to be hit a little harder than usual, and gets knocked away.【76】 It is hard to see that happening in the picture because it is a _still_ picture.【77】 But we can imagine that one molecule near the surface has just been hit and is flying out, or perhaps another one has been hit and is flying out.【78】 Thus, molecule by molecule, the water disappears - it evaporates.【79】 But if we _close_ the vessel above, after a while we shall find a large number of molecules of water amongst the air molecules.【80】【81】 From time to time, one of these vapor molecules comes flying down to the water and gets stuck again.【82】 So we see that what looks like a dead, uninteresting thing - a glass of water with a cover, that has been sitting there for perhaps twenty years - is a dynamic and interesting phenomenon which is going on all the time.【83】 To our eyes, our crude eyes, nothing is changing,【84】 but if we could see it a billion times magnified, we would see that from its own point of view it is always changing: molecules are leaving the surface;【85】 molecules are coming back.【86】",
-                'Why do _we_ see _no change_?【87】 Because just as many molecules are leaving as are coming back!【88】 In the long run "nothing happens." If we then take the top of the vessel off and blow the moist air away, replacing it with dry air, then the number of molecules leaving is just the same as it was before, because this depends on the jiggling of the water, but the number coming back is greatly reduced because there are so many fewer water molecules above the water.【89】 Therefore there are more going out than coming in, and the water evaporates.【90】 Hence, if you wish to evaporate water turn on the fan!【91】',
-                "Here is something else: Which molecules leave?【92】 When a molecule leaves it is due to an accidental, extra accumulation of a little bit more than ordinary energy, which it needs if it is to break away from the attractions of its neighbors.【93】 Therefore, since those that leave have more energy than the average, the ones that are left have _less_ average motion than they had before.【94】 So the liquid gradually _cools_ if it evaporates.【96】 Of course, when a molecule of vapor comes from the air to the water below there is a sudden great attraction as the molecule approaches the surface.【97】 This speeds up the incoming molecule and results in generation of heat. So when they leave they take away heat; when they come back they generate heat.【98】 Of course when there is no net evaporation the result is nothing - the water is not changing temperature.【99】 If we blow on the water so as to maintain a continuous preponderance in the number evaporating, then the water is cooled.【100】 Hence, blow on soup to cool it!【101】【102】",
-                'Of course you should realize that the processes just described are more complicated than we have indicated.【103】 Not only does the water go into the air, but also, from time to time, one of the oxygen or nitrogen molecules will come in and "get lost" in the mass of water molecules, and work its way into the water. Thus the air dissolves in the water; oxygen and nitrogen molecules will work their way into the water and the water will contain air.【104】 If we suddenly take the air away from the vessel, then the air molecules will leave more rapidly than they come in, and in doing so will make bubbles.【105】 This is very bad for divers, as you may know.【106】【107】【108】',
-            ],
-        },
-        {
-            "input": "Now let me turn to another process.【0】 On the next slide we see another process from an atomic point of view - a solid dissolving in water.【1】 Suppose that we put a crystal of salt in the water.【2】 What happens?【3】 Salt is a solid;【4】 it's a crystal, and so there's an organized array, which is cubic arrangement here, of salt atoms.【5】 Here is an illustration, in three dimensions, of the salt - uh sodium and chlorine.【6】 These are strictly speaking not atoms, but what we call ions.【7】 These uh... An ion is an atom which has either got an extra, or has lost a few, electrons - it has the wrong number of electrons.【8】 And uh this is a chlorine ion - it's a chlorine atom with an extra electron - and this is a sodium ion - that is to say, a sodium atom with one electron short.【9】 Now, they all stick together by electrical attraction in the solid salt, but when you put it in the water, you'll find that because of the attractions of the negative oxygen and the positive hydrogens for the ions, there will be, gradually in the jiggling, some of these atoms will get loose.【10】 Here's a picture of one, the chlorine atom, getting loose - and uh there they are, floating in the water, in the form of ions.【11】 You'll notice some very - these pictures are made with a great deal of care, heh - you notice some delicate features.【12】 For example, around the chlorine the hydrogen ends of the water are more likely to be there - while around the sodium, the oxygen end - because the sodium is positive, and the oxygen end of the water molecule is negative, and they electrically attract - so that there's that's the way it'll be, and it this more or less realistic.【13】 And uh we Of course I han't think of everything, so I can only point out those things which are realistic in the slide;【14】 those things which aren't, I haven't thought of.【15】 Now, in this particular case, though, ion, or ion by ion, the sodium is dis- dis-ehsolved in the water.【16】 How can you tell from this picture whether this is salt dissolving in water, or salt crystallizing out of water, say, which is evaporating - an increase in the concentration of salt?【17】 You cannot - because for while the atoms are leaving, other atoms are coming down;【18】 we still have this dynamic business, just as we had in the case of evaporation - and it depends upon whether there's more salt in the water, or less salt in the water, than the amount needed for equilibrium.【19】 By \"equilibrium\" I mean the rate at which they're leaving shall match the rate at which they're coming back.【20】 So, if there's hardly any salt in the water - if it's nearly pure water - more leave than come back, and the stuff dissolves.【21】 If, on the other hand, you've made it so there's too many atoms or too much in the water -  then more come down, and the thing is crystallizing.【22】【23】Notice that, by the way if you're interested in molecules, that the concept of molecules is only approximate, and only exists for an certain number of substances.【24】 Although it's pretty clear in the case of water that those three atoms are stuck together, it's impossible to say, in the case of the sodium chloride, where the \"molecule\" is: there is no molecule of sodium chloride in the solid;【25】 there's just an arrangement of sodium and chlorine atoms in a pattern - uh the cubic pattern given here.【26】【27】The... uh... If we increase the temperature, we increase the jiggling.【28】 Then the rate at which the things are taken away is increased - but so is the rate at which the things are brought back increased - and it turns out to be quite difficult in general to predict the general law as to which way it's going to go - when ya increase the temperature, whether you're gonna dissolve more, or dissolve less.【29】 Most substances dissolve more, but some substances dissolve less.【30】 So we can't tell, but we can guess that it'll change one way or the other, because it will be an accident of the greatest form if, when ya' increase the rate of jiggling, the rate at which they jiggle loose, and the rate at which they work their way back, happened to be uncha-n- balanced - changed both the same amount.【31】 Both rates are of course increased, but the question is, which increases the most.【32】【33】Now, in all the processes which I've described so far, the atoms or the ions have not \"changed partners.【34】\" That is, we have here a molecule of water with two oxygens and a hydrogen;【35】 we pointed out there was something like oxygen, which was two molec- two atoms of oxygen alone.【36】 But there are circumstances in which the atoms take up new combinations, forming new molecules.【37】【38】This is illustrated in the next slide - a situation in which the realignment of the pai- of the \"partners\" occurs.【39】 This is what we call a chemical reaction;【40】 the others we call a physical process, but there's no sharp distinction between these things - nature doesn't care what we call her;【41】 she just keeps on doing it whatever way she want.【42】 Now, this is supposed to represent carbon.【43】 I didn't bring a crystal of carbon;【44】 it's diamond, for example.【45】 If you wanna burn a diamond in air, you can - but you're kinda dopey.【46】 Now, here is uh burning in oxygen.【47】 I've simplified: I haven't got air - this is the oxygen.【48】 Now, in the case of oxygen these two oxygen atoms stick together very strongly.【49】 Why not three?【50】 Why not four stick together?【51】 That's one of the very peculiar characteristics of uh interatomic forces: they're very special, and they like certain particular partners in certain particular directions, and so on - and it's the job of physics to analyze why each one \"wants what it wants.【52】\" But at any rate, it forms - saturated, or \"happy\" - a pair.【53】【54】The carbon atoms in the crystal, which would be - the graphite, or... or diamond - looks like this.【55】 Now, for example, one of these can come down to the carbon, and put and each one pick up a carbon atom, and go flying off in a new combination, carbon-oxygen - which is called the gas carbon monoxide one oxygen for each carbon, and is given the chemical name CO - it's very simple.【56】 This is practically a picture of that molecule.【57】 The carbon attracts the oxygen much more than either the oxygen attracts the oxygen, or the carbon attracts the carbon.【58】 Therefore when this happens, this may come down with a small energy, but it may be able to pick up these things, and they will snap together with a tremendous vengeance, and jiggle - and anything else near them will pick up the energy away, because they hit if you hit something that's jiggling hard, you pick up an energy.【59】 So there's a trem-a-a a large amount of motion energy - kinetic energy in the gas is generated here.【60】 This, of course, is burning - we're getting heat out from the combination of oxygen and carbon - the heat is in the form ordinarily of the high motion of the gas hot gas, but of course in certain circumstance it can be so enormous that it generates light - and so you get flames out of this.【61】【62】In addition, the carbon monoxide is not quite \"satisfied\" - it is possible for it to attach another oxygen - so we might have a much more complicated reaction illustrated here, in which the oxygen is combining with the carbon - but we're not sure, and at the same time there's it happens to be a collision of a carbon monoxide, here - and we're not sure whether this oxygen is gonna end up attached to this, on this one to that, or how - but this could attach itself to this and form this molecule, which is one carbon and two oxygens, which is made in the form - CO2 - and is carbon dioxide.【63】 If you've got enough oxygen present, and you burn it continuously - you keep the reaction going - it'll form all carbon dioxide, ultimately.【64】 But if you burn the thing with very little oxygen, and uh do a very rapid reaction - like in a gas- for instance in an automobile engine, where the colli- where the explosion is so fast there isn't time for it to make mu- all the carbon dioxide -  and a considerable amount of carbon monoxide comes out.【65】 The main difference between this and other processes is the fact that new partners are formed to form new molecules, and this rearrangement is a called a chemical reaction -  and, most interesting, in such rearrangements a very large amount of energy is released, forming explosions, and flames, and so forth, depending on the reactions.【66】 Now, the chemists have studied these arrangements of the atoms, and find that everything can be understood - everything is some kind of an arrangement of atoms - and to illustrate this, I would like to just ex- take an example of something else.【67】【68】If we go in a field and smell violets, for example, what that smell is, is some kind of a molecule or arrangement of atoms that's worked its way into our nose.【69】 So, uh first of all, how does it work its way?【70】 Well, that's pret- pretty easy: if there's some kind of a molecule or arrangement of atoms with that come off of a violet - since the gas has all the atoms pretty far apart it can - jiggling around and batting all over, wor-  - accidentally work its way into the nose.【71】 There's no particular desire to get into the nose;【72】 it's merely - it's merely that they're a jostling crowd of atoms in molec- in the ga- in the air, and this particular chunk of stuff, working its way, gradually up into, uh happened to work its way into the nose.【73】",
-            "output": [
-                'Now we go on to another process.【0】 In Fig. 1-6 we see, from an atomic point of view, a solid dissolving in water.【1】 If we put a crystal of salt in the water, what will happen?【2】 Salt is a solid;【3】 a crystal, an organized arrangement of "salt atoms."【4】 Figure 1-7 is an illustration of the three-dimensional structure of common salt, sodium chloride.【5】 Strictly speaking, the crystal is not made of atoms, but of what we call _ions_.【6】 An ion is an atom which either has a few extra electrons or has lost a few electrons.【7】 In a salt crystal we find chlorine ions (chlorine atoms with an extra electron) and sodium ions (sodium atoms with one electron missing).【8】 The ions all stick together by electrical attraction in the solid salt, but when we put them in the water we find, because of the attractions of the negative oxygen and positive hydrogen for the ions, there will be, gradually in the jiggling, some of the ions jiggle loose.【9】【10】 In Fig. 1-6 we see a chlorine ion getting loose, and other atoms floating in the water in the form of ions.【11】 This picture was made with some care.【12】 Notice, for example, that the hydrogen ends of the water molecules are more likely to be near the chlorine ion, while near the sodium ion we are more likely to find the oxygen end, because the sodium is positive and the oxygen end of the water is negative, and they attract electrically.【13】【14】【15】 Can we tell from this picture whether the salt is _dissolving in_ water or _crystallizing out_ of water?【16】 Of course we _cannot_ tell,【17】 because while some of the atoms are leaving the crystal other atoms are rejoining it.【18】 The process is a _dynamic_ one, just as in the case of evaporation,【19】 and it depends on whether there is more or less salt in the water than the amount needed for equilibrium.【20】 By equilibrium we mean that situation in which the rate at which atoms are leaving just matches the rate at which they are coming back.【21】 If there is almost no salt in the water, more atoms leave than return, and the salt dissolves.【22】 If, on the other hand, there are too many "salt atoms," more return than leave, and the salt is crystallizing.【23】',
-                'In passing, we mention that the concept of a _molecule_ of a substance is only approximate and exists only for a certain class of substances.【24】 It is clear in the case of water that the three atoms are actually stuck together. It is not so clear in the case of sodium chloride in the solid.【25】 There is just an arrangement of sodium and chlorine ions in a cubic pattern.【26】 There is no natural way to group them as "molecules of salt."【27】',
-                "Returning to our discussion of solution and precipitation, if we increase the temperature of the salt solution, then the rate at which atoms are taken away is increased, and so is the rate at which atoms are brought back.【28】 It turns out to be very difficult, in general, to predict which way it is going to go, whether more or less of the solid will dissolve.【29】 Most substances dissolve more, but some substances dissolve less,【30】 as the temperature increases. We can guess that it will change one way or the other, because it would be an accident of the greatest form if, when we increase the rate of jiggling, the rate at which they jiggle loose and the rate at which they work their way back happened to be changed both the same amount.【31】 Both rates are of course increased, but the question is, which increases the most.【32】【33】",
-                "In all of the processes which have been described so far, the atoms and the ions have not changed partners,【34】 but of course there are circumstances in which the atoms do change combinations,【37】 forming new molecules.【38】",
-                "This is illustrated in Fig. 1-8.【39】 A process in which the rearrangement of the atomic partners occurs is what we call a _chemical reaction_.【40】 The other processes so far described are called physical processes, but there is no sharp distinction between the two.【41】 (Nature does not care what we call it, she just keeps on doing it.)【42】 This figure is supposed to represent carbon burning in oxygen.【43】【44】【45】【46】【47】 In the case of oxygen, _two_ oxygen atoms stick together very strongly.【48】【49】 (Why do not _three_ or even _four_ stick together?【50】【51】 That is one of the very peculiar characteristics of such atomic processes. Atoms are very special: they like certain particular partners, certain particular directions, and so on. It is the job of physics to analyze why each one wants what it wants.【52】 At any rate, two oxygen atoms form, saturated and happy, a molecule.)【53】【54】",
-                'The carbon atoms are supposed to be in a solid crystal (which could be graphite or diamond).【55】 Now, for example, one of the oxygen molecules can come over to the carbon, and each atom can pick up a carbon atom and go flying off in a new combination - "carbon-oxygen" - which is a molecule of the gas called carbon monoxide.【56】 It is given the chemical name CO.【57】 It is very simple: the letters "CO" are practically a picture of that molecule.【58】 But carbon attracts oxygen much more than oxygen attracts oxygen or carbon attracts carbon. Therefore in this process the oxygen may arrive with only a little energy, but the oxygen and carbon will snap together with a tremendous vengeance and commotion, and everything near them will pick up the energy.【59】 A large amount of motion energy, kinetic energy, is thus generated.【60】 This of course is _burning_; we are getting _heat_ from the combination of oxygen and carbon.【61】 The heat is ordinarily in the form of the molecular motion of the hot gas, but in certain circumstances it can be so enormous that it generates _light_. That is how one gets _flames_.【62】',
-                "In addition, the carbon monoxide is not quite satisfied. It is possible for it to attach another oxygen, so that we might have a much more complicated reaction in which the oxygen is combining with the carbon, while at the same time there happens to be a collision with a carbon monoxide molecule.【63】 One oxygen atom could attach itself to the CO and ultimately form a molecule, composed of one carbon and two oxygens, which is designated CO22 and called carbon dioxide. If you've got enough oxygen present, and you burn it continuously - you keep the reaction going - it'll form all carbon dioxide, ultimately.【64】 If we burn the carbon with very little oxygen in a very rapid reaction (for example, in an automobile engine, where the explosion is so fast that there is not time for it to make carbon dioxide) a considerable amount of carbon monoxide is formed.【65】 In many such rearrangements, a very large amount of energy is released, forming explosions, flames, etc., depending on the reactions.【66】 Chemists have studied these arrangements of the atoms, and found that every substance is some type of _arrangement of atoms_.【67】【68】",
-                'To illustrate this idea, let us consider another example. If we go into a field of small violets, we know what "that smell" is. It is some kind of _molecule_【69】, or arrangement of atoms, that has worked its way into our noses. First of all, _how_ did it work its way in?【70】 That is rather easy. If the smell is some kind of molecule in the air, jiggling around and being knocked every which way, it might have _accidentally_ worked its way into the nose.【71】【73】 Certainly it has no particular desire to get into our nose.【72】 It is merely one helpless part of a jostling crowd of molecules, and in its aimless wanderings this particular chunk of matter happens to find itself in the nose.【73】',
-            ],
-        },
-        {
-            "input": "Now, the chemists can take special molecules like the odor of violets, and analyze it, and tell you the exact arrangement in space of the atoms - just like we know that the carbon dioxide is a straight line from here to here;【0】 that can be determined easily physic- by physical methods, too.【1】 But in the very much more complicated arrangements of atoms that there are in chemistry, by a very remarkable process of detective work you can find the arrangements of the atoms.【2】 First, let me deal wi- illustrate the picture of how what it looks like over a violet - what the air looks like in the neighborhood of a violet.【3】 That's illustrated in the next slide.【4】 Here is uh nitrogen and oxygen of the air.【5】 What's that?【6】 Well, water vapor.【7】 What's it doing?【8】 Well, a violet is wet!【9】 I mean uh you know, all plants transpire, and uh so there's some water vapor in the air.【10】 And then there's this monster!【11】 Thee white circles are carbon atoms, the little circles are hydrogen atoms, and the black circle is an oxygen atom.【12】 And these, gentlemen, have pic- a certain particular pattern for them to arrange: it's much more complicated than carbon dioxide;【13】 it's an enormously complicated arrangement.【14】 Unfortunately, I cannot really picture all that is known about it chemically, because it is actually known, in three dimensions, the precise arrangement of those molec- those atoms - that is, whether, for examp-, you see I draw it in two dimensions, but this carbon and that one may be turned this way, relative to this carbon and that one, and so on.【15】 And these six carbons - which form a ring here - do not form a flat ring but a kind of puckered ring, and all the angles and distances are known to uh say, a percent in this particular case.【16】 However, for the excitement of the thing, I unfortunately made this slide some almost nine years ago, and it turns out that my in- my, uh respect for chemistry was a little bit exaggerated, because they since found that they had made a slight error in the arrangement of the odor of violets.【17】 However, I'll tell you what the error is;【18】 it's not very great.【19】 But I want to point out that what a chemical formula is, is merely a spicture of such a molecule.【20】 When the chemist writes this thing on the blackboard, he is trying to draw, roughly speaking, this: he's not drawing it exactly in three dimensions, but tells you which atoms are touching which.【21】 So I have, for example, a ring of six carbons, and a chain of carbons hanging out the end - and so you see a ring of six carbons, and a chain of carbons hanging out the end, with an oxygen second from the end - oxygen second from the end - three hydrogens tied to that carbon, two carbons and three hydrogens sticking up here, and so on.【22】 So the chemist, in writing this formula, has discovered the arrangement of the atoms in the shape of the molecule.【23】【24】How does he do it?【25】 He mixes bottles full of stuff together, and if it turns red it tells him there's a group of one carbon and three hydrogens tied on here;【26】 if it turns blue, on the other hand, that's not the way it is at all.【27】 This is one of the most fantastic pieces of detective work that has ever been done - organic chemistry: to discover the arrangement of the atoms in these enormously complicated arrays by looking at what happens when you mix the different substances together.【28】 The physicist never quite believed that the chemist knew what he was talking about, when he told the arrangement of the atom.【29】 And in more or less recent years - in twenty years, thirty years - it's been possible, through electron diffraction, to kind of look at such molecules - not quite as complicated as this, but ones which contain parts of this.【30】 And it's been possible to loo-  - sometimes, nowadays, yes, even as complicated as this, and it's been possible to locate every k- atom by a physical method that has nothing to do with mixing and looking at the colors, but by measuring where they are.【31】 And, lo and behold, the chemists are almost always correct.【32】【33】Incidentally, I must apologize for this particular one, the odor of violets being unknown then - it turned out that they had an error in analysis, and I picked the wrong molecule;【34】 I should have picked one nine years ago that they knew better.【35】 At any rate the correct picture of the odor of violets is given here.【36】 It's the same ring as before, same chain as before;【37】 if you look closely you'll see one difference: there's an extra CH3 tied on here - there's a rearrangement of the hydrogens - there's none here, and there's an extra one here, and so on - but it's very close to the way it was before, and I'm sorry I could have made a new slide and not embarrassed the chemists.【38】 The substance that I've drawn here is alpha iron.【39】 It turns out that there are, from the violet, three different molecules which have a slight difference in the arrangement of the hydrogen atoms - that's all;【40】 minor shifts - two hydrogen atoms - to the other form.【41】【42】Now, an important problem in chemistry is to name the substance so you know what it is.【43】 uh Find a name for this shape - and ya appreciate the problem of finding a name for a shape - more than a shape, even: not only must you get the shape, but you haveta tell which is - \"this is an oxygen, not a nitrogen\" - exactly what they are.【44】 You need a name for the shape and the particular location of the atom.【45】 And so you can appreciate that, uh that the chemical names must be complex if they're complete.【46】 And so you see that the kname of this thing in a more complete form that'll tell you the form of it is four dash comma two two three six dash tetramethyl dash one dash cyclohexenyl close parentheses dash three dash butene dash two -one  - and that tells you that this is the arrangement.【47】 But you can appreciate the difficulties that the chemists have, and also appreciate why the names are so long: it's not because they wanna be obstinate, but because they have an extremely difficult problem: to describe this thing, in words.【48】 Why they don't just draw the pictures all the time, I don't know - it seems to me easier.【49】【50】Now, how do we know that there are atoms?【51】 By all of the effects that I talked about, we made a hypothesis that there are atoms -  and one after the other, things come out the way we say.【52】 They ought to, if they're made out of atoms - and that's the most of the evidence for atoms.【53】 There is somewhat more direct evidence;【54】 a good example of that is the following.【55】 The atoms are so small that you can't see them with a light microscope - an ordinary microscope - in fact even with today, with an electron microscope, you can't still see individual atom.【56】 But with a light microscope you can see something that's much bigger.【57】 Now, if the atoms are always in motion, say in water, and I put a big ball of something in the water - much bigger than the atom - that ball will jiggle around, much like a push ball in that big game: you have a great big ball, a whole lot of people under it, all pushing in various directions, and the ball moves around the field in an irregular fashion.【58】 So in an irregular fashion a very large ball will move because of the accidental inequalities of the collisions on one side or the other.【59】 A few more hit on one side than the other at a given moment and the ball starts moving this way;【60】 then it's quickly \"change its mind,\"  'nd so on.【61】 Therefore, by putting... if you look at very tiny particles of dirt well, of stuff, of different things - colloids, or something in water through an excellent microscope, you can see a perpetual jiggling of the particles, which is a result of the bombardment of the atoms.【62】 That's the most direct evidence for the atoms, and I hope that they will it will be possible to arrange in a laboratory to set up a microscope so that you can take a look at these vibrating atoms.【63】【64】I have uh here arrangements of the various, o- of some of the different kinds of solids.【65】 Here is a solid that's a little more complicated, which is calcite, and the actual crystal of true calcite sits here, and you can see the relation between the shape of the crystal, and the shape of the of the arrangement.【66】 Here is another arrangement that the chemists are using to study the arrangement of the atoms in various molecules: this is about as complicated as irone;【67】 it happens to be an amino acid important in eh living p- things, called tyrosine - but it's merely illustrative of what we know about the atom.【68】【69】Now, everything is made out of atoms - that's the key hypothesis.【70】 The most impressive hypothesis in all of biology, for example - the most important hypothesis - is, that everything that animals do, atoms do.【71】 In other words, that there's nothing that the living things do that cannot be understood from the point of view that they're made out of atoms jiggling according to the laws of physics.【72】 This has not been self-evident from the beginning;【73】 it took some experimenting to suggest this hypothesis, and now it is accepted and is the most useful for producing new ideas in the field of biology.【74】【75】If a piece of steel or a piece of salt, consisting of atoms one next to the other, one next these little blobs - mile upon mile of the same thing, repeated on an on - forms waves and foam, and makes rushing noises, and makes the funny patterns as it runs over cement;【76】 if all this all the life of a stream of water can be nothing but a pile of atoms, how much more is possible?【77】 If, instead of arranging the atoms in some definite pattern again and  again repeated, on and on - or even in little lumps of complexity, like the odor of violets - we make an arrangement of atoms which is always different from place to place, with different kinds, and k- so on, in other words enormous arrays continuously changing, not repeating, how much more marvelous is it possible that these things behave?【78】 And is it possible that this thing that walking back and forth in front of you, talking to you, is a great glob of these things in a very complex arrangement - and that the sheer complexity of it staggers the imagination as to what it can do - so that when we say \"I am a pile of atoms,\" I do not say I am merely a pile of atoms, because: a pile of atoms which is not repeated from one to the other might well have the possibilities which you see before you.【79】",
-            "output": [
-                'Now chemists can take special molecules like the odor of violets, and analyze them and tell us the _exact arrangement_ of the atoms in space.【0】 We know that the carbon dioxide molecule is straight and symmetrical: O - C - O.【1】 (That can be determined easily, too, by physical methods.) However, even for the vastly more complicated arrangements of atoms that there are in chemistry, one can, by a long, remarkable process of detective work, find the arrangements of the atoms.【2】 Figure 1-9 is a picture of the air in the neighborhood of a violet;【3】【4】 again we find nitrogen and oxygen in the air,【5】【6】 and water vapor.【7】【8】 (Why is there water vapor?【9】 Because the violet is _wet_.【10】 All plants transpire.) However, we also see a "monster"【11】 composed of carbon atoms, hydrogen atoms, and oxygen atoms,【12】 which have picked a certain particular pattern in which to be arranged.【13】 It is a much more complicated arrangement than that of carbon dioxide;【14】 in fact, it is an enormously complicated arrangement. Unfortunately, we cannot picture all that is really known about it chemically, because the precise arrangement of all the atoms is actually known in three dimensions,【15】 while our picture is in only two dimensions. The six carbons which form a ring do not form a flat ring, but a kind of "puckered" ring.【16】 All of the angles and distances are known.【17】【18】【19】 So a chemical _formula_ is merely a picture of such a molecule.【20】 When the chemist writes such a thing on the blackboard, he is trying to "draw," roughly speaking, in two dimensions.【21】 For example, we see a "ring" of six carbons, and a "chain" of carbons hanging on the end, with an oxygen second from the end, three hydrogens tied to that carbon, two carbons and three hydrogens sticking up here, etc.【22】【23】【24】',
-                "How does the chemist find what the arrangement is?【25】 He mixes bottles full of stuff together, and if it turns red, it tells him that it consists of one hydrogen and two carbons tied on here;【26】 if it turns blue, on the other hand, that is not the way it is at all.【27】 This is one of the most fantastic pieces of detective work that has ever been done - organic chemistry.【28】 To discover the arrangement of the atoms in these enormously complicated arrays the chemist looks at what happens when he mixes two different substances together.【29】 The physicist could never quite believe that the chemist knew what he was talking about when he described the arrangement of the atoms.【30】 For about twenty years it has been possible, in some cases, to look at such molecules (not quite as complicated as this one, but some which contain parts of it) by a physical method, and it has been possible to locate every atom, not by looking at colors, but by _measuring where they are_.【31】 And lo and behold!, the chemists are almost always correct.【32】【33】",
-                "It turns out, in fact, that in the odor of violets there are three slightly different molecules,【40】 which differ only in the arrangement of the hydrogen atoms.【41】【42】",
-                "One problem of chemistry is to name a substance, so that we will know what it is.【43】 Find a name for this shape! Not only must the name tell the shape, but it must also tell that here is an oxygen atom, there a hydrogen - exactly what and where each atom is.【44】【45】 So we can appreciate that the chemical names must be complex in order to be complete.【46】 You see that the name of this thing in the more complete form that will tell you the structure of it is 4-(2, 2, 3, 6 tetramethyl-5-cyclohexenyl)-3-buten-2-one,【47】 and that tells you that this is the arrangement. We can appreciate the difficulties that the chemists have, and also appreciate the reason for such long names.【48】 It is not that they wish to be obscure, but they have an extremely difficult problem in trying to describe the molecules in words!【49】【50】",
-                'How do we _know_ that there are atoms?【51】 By one of the tricks mentioned earlier: we make the _hypothesis_ that there are atoms, and one after the other results come out the way we predict, as they ought to if things _are_ made of atoms.【52】 There is also somewhat more direct evidence,【53】【54】 a good example of which is the following:【55】 The atoms are so small that you cannot see them with a light microscope - in fact, not even with an _electron_ microscope.【56】 (With a light microscope you can only see things which are much bigger.)【57】 Now if the atoms are always in motion, say in water, and we put a big ball of something in the water, a ball much bigger than the atoms, the ball will jiggle around - much as in a push ball game, where a great big ball is pushed around by a lot of people.【58】 The people are pushing in various directions, and the ball moves around the field in an irregular fashion.【59】 So, in the same way, the "large ball" will move because of the inequalities of the collisions on one side to the other, from one moment to the next.【60】【61】 Therefore, if we look at very tiny particles (colloids) in water through an excellent microscope, we see a perpetual jiggling of the particles, which is the result of the bombardment of the atoms.【62】 This is called the _Brownian motion_.【63】【64】',
-                'We can see further evidence for atoms in the structure of crystals.【65】 In many cases the structures deduced by x-ray analysis agree in their spatial "shapes" with the forms actually exhibited by crystals as they occur in nature.【66】 The angles between the various "faces" of a crystal agree, within seconds of arc, with angles deduced on the assumption that a crystal is made of many "layers" of atoms.【67】【68】【69】',
-                "_Everything is made of atoms_.【70】 That is the key hypothesis. The most important hypothesis in all of biology, for example, is that _everything that animals do, atoms do_.【71】 In other words, _there is nothing that living things do that cannot be understood from the point of view that they are made of atoms acting according to the laws of physics_.【72】 This was not known from the beginning:【73】 it took some experimenting and theorizing to suggest this hypothesis, but now it is accepted, and it is the most useful theory for producing new ideas in the field of biology.【74】【75】",
-                'If a piece of steel or a piece of salt, consisting of atoms one next to the other, can have such interesting properties; if water - which is nothing but these little blobs, mile upon mile of the same thing over the earth - can form waves and foam, and make rushing noises and strange patterns as it runs over cement;【76】 if all of this, all the life of a stream of water, can be nothing but a pile of atoms, _how much more is possible_?【77】 If instead of arranging the atoms in some definite pattern, again and again repeated, on and on, or even forming little lumps of complexity like the odor of violets, we make an arrangement which is _always different_ from place to place, with different kinds of atoms arranged in many ways, continually changing, not repeating, how much more marvelously is it possible that this thing might behave?【78】 Is it possible that that "thing" walking back and forth in front of you, talking to you, is a great glob of these atoms in a very complex arrangement, such that the sheer complexity of it staggers the imagination as to what it can do? When we say we are a pile of atoms, we do not mean we are _merely_ a pile of atoms, because a pile of atoms which is not repeated from one to the other might well have the possibilities which you see before you in the mirror.【79】',
-            ],
-        },
-    ],
-    "es": [
-        {
-            "input": "Durante dos años voy a darles clases sobre física.【0】 Voy a dar las clases desde el punto de vista de que todos ustedes van a ser físicos - por supuesto, no es el caso, pero eso es lo que hace cada profesor en cada materia.【1】 Entonces, asumiendo que van a ser físicos, tendremos mucho que estudiar.【2】 Son doscientos años del conjunto de conocimientos que se ha desarrollado más rápidamente que existe.【3】 Tanto, de hecho, que podrían pensar que no pueden aprenderlo todo en cuatro años -【4】y no pueden: tienen que ir a la escuela de posgrado también.【5】Pero lo sorprendente es que, a pesar de la enorme cantidad de trabajo que se ha hecho durante todo este tiempo, es posible resumir todo esto en gran medida - es decir, encontrar algún tipo de leyes que resuman todo nuestro conocimiento.【6】 Sin embargo, sigue siendo muy difícil - y es injusto que empiecen a explorar este tema sin algún tipo de mapa, o esquema, de la relación de una parte del tema de la ciencia con otra.【7】 Por lo tanto, las primeras tres clases aquí serán en forma de esquema de la relación de la física con el resto de las ciencias, y las ciencias entre sí, y el significado de la ciencia.【8】 Por cierto, cada clase aquí comenzará con algún tipo de descripción de cuál será el punto de la clase;【9】 luego comenzará la clase propiamente dicha.【10】 Previo a eso habrá un resumen de la clase anterior, lo mínimo indispensable de la clase anterior que es necesario para seguir el hilo.【11】 En las primeras tres clases no es necesario seguir el hilo de nada;【12】 no es necesario tomar notas, porque lo que estamos tratando de desarrollar es una sensación - una sensación - por el tema.【13】 Por supuesto, pueden anotar cualquier cosa que les parezca interesante que les gustaría recordar, pero eso es todo.【14】 Después de unas dos semanas, estará disponible una copia de estas notas - vamos a tener algún tipo de manera de convertir esto, esto, estas palabras en texto impreso.【15】【16】Ahora podrían preguntar, ¿Por qué no podemos enseñar física simplemente dando las leyes básicas en la página uno, y luego mostrando cómo funcionan en todas las diversas circunstancias?【17】algo así como la geometría euclidiana: aquí están los axiomas, y haces todas las deducciones.【18】 Ahora no están satisfechos con aprenderlo en cuatro años;【19】 quieren aprenderlo en cuatro minutos.【20】 Bueno, no podemos hacerlo de esa manera por dos razones.【21】 Primero, no conocemos todas las leyes básicas - es una frontera en expansión de la ignorancia;【22】 que todavía no sabemos la, la respuesta a todo.【23】 Segundo, la declaración correcta de las leyes de la física requiere algunas ideas muy poco familiares, y requiere matemáticas avanzadas en su descripción.【24】 Por lo tanto, necesitan una cantidad considerable de entrenamiento - primero, para aprender lo que significan las palabras - así que no es posible hacerlo de esa manera.【25】 Por lo tanto, solo podemos hacerlo pieza por pieza, o...【26】Sin embargo, cada pieza, o parte del todo de la naturaleza, es solo una especie de aproximación a la verdad completa o la verdad completa hasta donde la conocemos;【27】 de hecho, incluso todo lo que sabemos es solo una especie de aproximación, porque uh sabemos que aún no conocemos todas las leyes.【28】 Por lo tanto, se debe aprender mucho solo para ser desaprendido de nuevo - o, más precisamente, para ser corregido.【29】【30】Ahora, el principio de la ciencia - la definición, casi - es el siguiente: la prueba de todo conocimiento es el experimento.【31】 El experimento es el único juez de la verdad entre comillas - las comillas significan verdad científica o lo que aceptamos como científico.【32】 Todo se juzga siempre por una prueba experimental.【33】 Pero ¿cuál es la fuente del conocimiento?【34】 ¿De dónde vienen las leyes que van a ser probadas?【35】 El experimento, también, en cierto sentido, produce estas leyes - en el sentido de que da pistas.【36】 Pero también se necesita imaginación para crear a partir de estas pistas las grandes generalizaciones - para adivinar los maravillosos, simples, pero muy extraños patrones que subyacen a todo ello - y luego volver al experimento para comprobar de nuevo si se obtuvo la conjetura correcta en tu imaginación.【37】 Este proceso de imaginar es tan difícil, que hoy en día hay una división parcial del trabajo en física: hay físicos teóricos - que imaginan, deducen y conjeturan nuevas leyes, pero no experimentan;【38】 y luego están los experimentadores - que experimentan, imaginan, deducen y conjeturan.【39】【40】Ahora, dije que la naturaleza las leyes de la naturaleza son aproximadas - y primero encontramos las equivocadas, y luego encontramos las correctas.【41】 Ahora, ¿cómo puede un experimento estar equivocado?【42】 Primero, de una manera trivial - que algo estaba mal con el aparato que no notaste - pero estas cosas se arreglan fácilmente, y se comprueban de ida y vuelta.【43】 Entonces, suponiendo que las cosas menores se eliminan, ¿cómo puede estar equivocada la ley deducida del experimento?【44】 Solo siendo inexacta.【45】 Por ejemplo, la masa de un objeto nunca parecía cambiar - una peonza girando, por ejemplo, tiene el mismo peso que una quieta.【46】 Así que se inventó una ley: la masa es constante, independiente de la velocidad.【47】 Ahora se ha descubierto que eso es incorrecto: la masa sí aumenta con la velocidad, pero los aumentos apreciables requieren velocidades cercanas a la de la luz.【48】 Una ley verdadera es: si un objeto se mueve a menos de cien millas por segundo, la masa es constante dentro de una parte en un millón.【49】 Y, ya ves, en alguna forma aproximada es la ley correcta.【50】 Así que en la práctica, verás, pensarías que la nueva ley hizo muy poca diferencia.【51】 Bueno, sí y uh no: para velocidades ordinarias, ciertamente podemos olvidarlo y usar la ley simple de masa constante como una buena aproximación.【52】 Sin embargo, para altas velocidades estamos equivocados, y cuanto mayor sea la velocidad, más completamente equivocados estamos.【53】【54】Finalmente, de una manera más interesante, filosóficamente estamos completamente equivocados con la ley aproximada: toda nuestra imagen del mundo tiene que ser alterada cuando la masa cambia solo un poco, si no es constante.【55】 Esa es la cosa muy peculiar sobre la filosofía, o las ideas básicas, detrás de las leyes: efectos muy pequeños requieren cambios profundos en nuestras ideas.【56】【57】Bueno, ¿qué deberíamos enseñar primero, si vamos a enseñar?【58】 ¿Deberíamos enseñar la ley correcta, más exacta, con sus ideas conceptuales extrañas y diferentes, difíciles - por ejemplo, en este caso particular, la teoría de la relatividad, el espacio-tiempo cuatridimensional, y así sucesivamente - o deberíamos enseñar primero la ley más simple de masa constante, que es solo aproximada, pero no implica ideas tan difíciles?【59】 La primera es más emocionante y más maravillosa, más divertida - pero la segunda es más fácil de entender al principio, y es un primer paso para una comprensión real de la primera idea.【60】 Ahora, este problema surge una y otra vez en la enseñanza de la física, y en diferentes momentos tendremos que resolverlo de diferentes maneras.【61】 Pero en cualquier caso vale la pena saber en cada etapa lo que estamos aprendiendo, cuán preciso es, cómo encaja en todo lo demás, cómo puede cambiar cuando aprendamos más.【62】",
-            "output": [
-                "Este curso de dos años de física se presenta desde el punto de vista de que tú, el lector, vas a ser un físico.【0】 Por supuesto, esto no es necesariamente el caso, ¡pero es lo que asume cada profesor en cada materia!【1】 Si vas a ser físico, tendrás mucho que estudiar:【2】 doscientos años del campo de conocimiento que se ha desarrollado más rápidamente que existe.【3】 De hecho, tanto conocimiento que podrías pensar que no puedes aprenderlo todo en cuatro años,【4】 y verdaderamente no puedes; ¡tendrás que ir también a la escuela de posgrado!【5】",
-                'Sorprendentemente, a pesar de la enorme cantidad de trabajo que se ha realizado durante todo este tiempo, es posible condensar la enorme masa de resultados en gran medida - es decir, encontrar _leyes_ que resuman todo nuestro conocimiento.【6】 Aun así, las leyes son tan difíciles de entender que es injusto para ti empezar a explorar este enorme tema sin algún tipo de mapa o esquema de la relación de una parte del tema de la ciencia con otra.【7】 Siguiendo estas observaciones preliminares, los primeros tres capítulos, por lo tanto, trazarán el esquema de la relación de la física con el resto de las ciencias, las relaciones de las ciencias entre sí y el significado de la ciencia,【8】 para ayudarnos a desarrollar una "sensación" por el tema.【8】【9】【10】【11】【12】【13】',
-                "Podrías preguntar por qué no podemos enseñar física simplemente dando las leyes básicas en la página uno y luego mostrando cómo funcionan en todas las circunstancias posibles,【17】 como hacemos en la geometría euclidiana, donde enunciamos los axiomas y luego hacemos todo tipo de deducciones.【18】 (Así que, no satisfecho con aprender física en cuatro años,【19】 ¿quieres aprenderla en cuatro minutos?【20】) No podemos hacerlo de esta manera por dos razones.【21】 Primero, aún no _conocemos_ todas las leyes básicas: hay una frontera en expansión de la ignorancia.【22】【23】 Segundo, la declaración correcta de las leyes de la física implica algunas ideas muy poco familiares que requieren matemáticas avanzadas para su descripción.【24】 Por lo tanto, se necesita una cantidad considerable de entrenamiento preparatorio incluso para aprender lo que significan las _palabras_.【25】 No, no es posible hacerlo de esa manera.【26】",
-                "Cada pieza, o parte, del todo de la naturaleza es siempre meramente una _aproximación_ a la verdad completa, o la verdad completa hasta donde la conocemos.【27】 De hecho, todo lo que sabemos es solo algún tipo de aproximación, porque _sabemos que aún no conocemos todas las leyes_.【28】 Por lo tanto, las cosas deben aprenderse solo para ser desaprendidas de nuevo o, más probablemente, para ser corregidas.【29】【30】",
-                'El principio de la ciencia, la definición, casi, es el siguiente: _La prueba de todo conocimiento es el experimento_.【31】 El experimento es el _único juez_ de la "verdad" científica.【32】 Pero ¿cuál es la fuente del conocimiento?【34】 ¿De dónde vienen las leyes que van a ser probadas?【35】 El experimento, en sí mismo, ayuda a producir estas leyes, en el sentido de que nos da pistas.【36】 Pero también se necesita _imaginación_ para crear a partir de estas pistas las grandes generalizaciones - para adivinar los patrones maravillosos, simples, pero muy extraños que subyacen a todo ello, y luego experimentar para comprobar de nuevo si hemos hecho la conjetura correcta.【37】 Este proceso de imaginar es tan difícil que hay una división del trabajo en física: hay físicos _teóricos_ que imaginan, deducen y conjeturan nuevas leyes, pero no experimentan;【38】 y luego están los físicos _experimentales_ que experimentan, imaginan, deducen y conjeturan.【39】【40】',
-                'Dijimos que las leyes de la naturaleza son aproximadas: que primero encontramos las "equivocadas", y luego encontramos las "correctas".【41】 Ahora, ¿cómo puede un experimento estar "equivocado"?【42】 Primero, de una manera trivial: si algo está mal con el aparato que no notaste. Pero estas cosas se arreglan fácilmente y se comprueban de ida y vuelta.【43】 Entonces, sin aferrarnos a esas cosas menores, ¿_cómo_ pueden estar equivocados los resultados de un experimento?【44】 Solo siendo inexactos.【45】 Por ejemplo, la masa de un objeto nunca parece cambiar: una peonza girando tiene el mismo peso que una quieta.【46】 Así que se inventó una "ley": la masa es constante, independiente de la velocidad.【47】 Ahora se ha descubierto que esa "ley" es incorrecta. Se ha descubierto que la masa aumenta con la velocidad, pero los aumentos apreciables requieren velocidades cercanas a la de la luz.【48】 Una ley _verdadera_ es: si un objeto se mueve a una velocidad menor a cien millas por segundo, la masa es constante dentro de una parte en un millón.【49】 En alguna forma aproximada así, esta es una ley correcta.【50】 Así que en la práctica uno podría pensar que la nueva ley no hace una diferencia significativa.【51】 Bueno, sí y no. Para velocidades ordinarias ciertamente podemos olvidarlo y usar la simple ley de masa constante como una buena aproximación.【52】 Pero para altas velocidades estamos equivocados, y cuanto mayor sea la velocidad, más equivocados estamos.【53】【54】',
-                "Finalmente, y lo más interesante, _filosóficamente estamos completamente equivocados_ con la ley aproximada.【55】 Toda nuestra imagen del mundo tiene que ser alterada aunque la masa cambie solo un poco.【56】 Esta es una cosa muy peculiar sobre la filosofía, o las ideas, detrás de las leyes. Incluso un efecto muy pequeño a veces requiere cambios profundos en nuestras ideas.【57】",
-                '¿Ahora, qué deberíamos enseñar primero?【58】 ¿Deberíamos enseñar la ley _correcta_ pero poco familiar con sus ideas conceptuales extrañas y difíciles, por ejemplo, la teoría de la relatividad, el espacio-tiempo cuatridimensional, y así sucesivamente?【59】 ¿O deberíamos enseñar primero la simple ley de "masa constante", que es solo aproximada, pero no implica ideas tan difíciles? La primera es más emocionante, más maravillosa y más divertida, pero la segunda es más fácil de entender al principio, y es un primer paso para una comprensión real de la primera idea.【60】 Este punto surge una y otra vez en la enseñanza de la física.【61】 En diferentes momentos tendremos que resolverlo de diferentes maneras, pero en cada etapa vale la pena aprender lo que se conoce ahora, cuán preciso es, cómo encaja en todo lo demás, y cómo puede cambiar cuando aprendamos más.【62】',
-            ],
-        },
-        {
-            "input": 'Y por lo tanto, en las primeras tres conferencias aquí, vamos a tratar de dar un esquema o un mapa general de nuestra comprensión de la ciencia hoy en día para que puedan - en particular, la física, pero otras ciencias en la periferia, uh desde el punto de vista que estamos tomando aquí.【0】 El propósito de estas primeras tres conferencias, entonces, es obtener una sensación del conjunto, para que cuando nos concentremos y miremos muy de cerca un punto particular, tengamos alguna idea de cuál es el trasfondo, y por qué ese punto particular es interesante, y cómo encaja en la gran estructura - así que ese es el propósito de las primeras tres conferencias.【1】 En otras palabras, las primeras tres conferencias son el punto principal "¿cuál es nuestra imagen general del mundo?【2】"【3】Ahora, voy a comenzar esta p- la primera conferencia - que es sobre átomos en movimiento.【4】 Si, en algún cataclismo, todo el conocimiento científico fuera a ser destruido, pero solo una frase pudiera ser transmitida a las próximas generaciones de criaturas, ¿cuál sería la mejor cosa, la cosa que contiene la mayor información en el menor número de palabras?【5】 Creo que es la hip- hipótesis atómica o el hecho atómico, o como quieras llamarlo, que todas las cosas están hechas de átomos - pequeñas partículas que se mueven alrededor, están en movimiento perpetuo, se atraen entre sí cuando están a cierta distancia, pero se repelen al ser apretadas una contra otra.【6】 En esa única frase verás que hay una enorme cantidad de información sobre el mundo si se aplica un poco de imaginación y pensamiento.【7】【8】Para... Es el propósito de esta conferencia ilustrar esa idea, y uh lo hago de esta manera.【9】 Supongamos que tenemos una gota de agua, digamos de un cuarto de pulgada de lado, y si la miramos muy de cerca, no vemos nada más que agua - agua lisa, continua.【10】 Ahora, si la magnificamos con el mejor microscopio, microscopio de luz, quiero decir, que está disponible, aproximadamente dos mil veces, entonces la gota de agua tendría cuarenta pies de ancho - aproximadamente del tamaño de una habitación, más o menos - y si la miramos uh de cerca, veríamos que es de nuevo agua relativamente lisa, pero aquí y allá hay pequeñas cosas en forma de balón de fútbol nadando de un lado a otro - ¡muy interesante!【11】 - esos son paramecium.【12】 Y puedes detenerte en este nivel y sentir tanta curiosidad por los paramecium con sus cilios ondulantes y cuerpos retorcidos, que no vas más allá en esta línea particular excepto para esperar que pudieras hacer el paramecium aún más grande, y ver qué hay dentro.【13】 Esto, por supuesto, es un tema de biología, pero para la presente conferencia debo pasar eso e ir aún más abajo.【14】 Magnif.【15】 Mirando el material del agua en sí, y magnificándolo uh dos mil veces más, ahora la gota de agua se extiende desde aquí hasta Los Ángeles, aproximadamente quince millas de ancho.【16】 Y si la miras muy de cerca verás una especie de hormigueo - algo que parece, ya no parece lisa;【17】 que es algo como una multitud aparecería en un juego de fútbol, visto desde una gran distancia.【18】 Para ver de qué se trata este "hormigueo", lo magnificaremos otras doscientas cincuenta veces para obtener una mejor visión de esta cosa, y veremos algo como lo que se muestra en la primera diapositiva.【19】 Esta imagen del agua magnificada mil millones de veces está idealizada en varios aspectos.【20】 En primer lugar, las partículas están dibujadas de una manera simple, con bordes afilados - lo cual es inexacto.【21】 En segundo lugar, por simplicidad lo he esbozado casi esquemáticamente en una disposición bidimensional, pero como deben apreciar, estas cosas se están moviendo en tres dimensiones, y es mucho más difícil de dibujar - así que esta no es una imagen real, sino una especie de idealización.【22】 Me gustaría que notaran que hay dos tipos de manchas, o círculos, aquí - esos son los átomos: hay un átomo de oxígeno, que está hecho en negro, y un átomo de hidrógeno está representado como un círculo blanco - y notarán que cada uno que cada blanco tiene dos hidrógenos unidos a él.【23】 Hay otra manera en la que esta cosa está idealizada, y es que las partículas en esta imagen están realmente de hecho \'están siempre en movimiento: están en un continuo temblor y rebote, girando y retorciéndose una alrededor de la otra - así que tendrán que imaginar esto de una manera dinámica, en lugar de una manera estática.【24】 Otra cosa que no se puede ilustrar en un dibujo es el hecho de que están pegadas juntas, que se atraen entre sí - que esta es atraída hacia esta, y b- y así sucesivamente, de modo que todo el grupo de ellas está pegado de alguna manera juntas, más o menos, uh en un gran cúmulo.【25】 Por otro lado, no pasan una a través de la otra: si tratas de apretar dos de ellas demasiado juntas, se repelen.【26】 Así que tenemos esta imagen de bolas temblorosas rebotando por el agua.【27】 Como consecuencia, por supuesto, nuestra gota de agua de quince millas de ancho es ahora doscientas cincuenta veces quince, o desde aquí hasta Chicago, aproximadamente, o más grande.【28】【29】Y, uh puedes recordar el tamaño de estos átomos más o menos de esta manera: puedes recordar que los átomos tienen entre uno y dos veces diez a la menos ocho centímetros de diámetro - diez a la menos ocho centímetros también se llama un angstrom, así que decimos solo como otro nombre, así que decimos que tienen aproximadamente uno o dos angstroms de diámetro.【30】 Otra manera de recordar el tamaño es esta: si tomas una manzana y la magnificas al tamaño de la tierra, entonces los átomos en la manzana son aproximadamente del tamaño de una manzana - así que esa es otra manera - es de cualquier manera;【31】 puedes recordarlo de cualquier manera.【32】【33】Ahora, podrías imaginar, entonces, esta gran gota de agua, con todas estas cosas pegadas juntas y revolcándose unas sobre otras.【34】 El agua mantiene su volumen: no se pu- desmorona, debido a la atracción de los ato- de las moléculas o los átomos entre sí.【35】 Suponiendo que tuvieras una pendiente, por ejemplo, que en el revolcón pueden mover toda la gota de agua de un lugar a otro - el agua puede fluir - pero no simplemente desaparece;【36】 las cosas no simplemente se separan volando, debido a la atracción.【37】 Ahora, el movimiento es lo que representamos - o lo que notamos, más bien, como calor - y cuando aumentamos la temperatura, aumentamos el movimiento.【38】 Si calentamos el agua, el temblor aumenta, aumenta - el choque entre los átomos o moléculas aumenta todo el tiempo - hasta que llega un momento en que, en una colisión, no hay en- hay tanta velocidad que esta atracción entre ellos no es suficiente para mantenerlos juntos, y se separan volando y se separan unos de otros.【39】 Por supuesto, lo que estoy describiendo es la fabricación de vapor a partir del agua al aumentar la temperatura - las cosas separándose debido a los movimientos aumentados.【40】【41】Así que en la siguiente imagen, tenemos un - siguiente diapositiva - , tenemos una imagen de vapor.【42】 Ahora está mucho más claro cómo se forman las moléculas.【43】 Esta imagen del vapor falla en un aspecto: en presiones ordinarias, esta presión atmosférica de vapor, podría haber solo unas pocas molier- no muchas moléculas en toda esta habitación;【44】 ciertamente no habría tantas como tres - la mayoría de los cuadrados de este tamaño no contendrían nada, y accidentalmente tengo dos y medio o tres en la imagen, ¡pero eso es solo para que no sea completamente aburrido: tienes tres cosas para mirar!【45】 Ves que las moléculas características son mucho más claras en el caso del vapor que en el caso del agua.【46】 En esta molécula las he dibujado en la diapositiva de modo que hay un ángulo de ciento veinte grados aquí, por simplicidad.【47】 De hecho, el ángulo es de ciento cinco grados, tres minutos - y la distancia entre el centro del hidrógeno y el centro del oxígeno es de punto novecientos cincuenta y siete angstroms - así que conocemos esta molécula muy bien.【48】 De hecho, probablemente la conocemos mejor, pero no pude obtener cifras más precisas en el corto tiempo disponible.【49】【50】Ahora veamos cuáles son algunas de las propiedades del vapor de agua, o cualquier otro gas, porque estas cosas, al estar separadas unas de otras, rebotarán contra las paredes: imagina esta habitación con un número de pelotas de tenis - o no muchas;【51】 cien pelotas de tenis, o algo así - rebotando en todas direcciones debido al calor que tienen, en movimiento perpetuo.【52】 Entonces, por supuesto, rebotarán contra las paredes y las bombardearán, y esto rep- empuja la pared hacia afuera.【53】 Por supuesto, tú mantienes la pared en su lugar;【54】 eso requiere eso significa que el gas ejerce una presión, que nuestros sentidos toscos al no estar nosotros mismos magnificados mil millones de veces, sentimos solo como un empuje promedio.【55】 Así que para confinar un gas, tenemos una presión.【56】 Así que aquí hay una imagen, por ejemplo, de un recipiente estándar para contener gases - en todos los libros de texto - que consiste en un cilindro con un pistón en él.【57】 O no sé por qué todos los gases siempre están contenidos en cilindros con pistones, pero eso es lo que representaremos aquí.【58】 Ahora, no importa cuál sea la forma de las moléculas de agua, así que por simplicidad las dibujaré como pelotas de tenis o pequeños puntos, y estas cosas están en movimiento perpetuo en todas las direcciones.【59】 Así que, muchas de ellas están golpeando todo el tiempo el pistón superior, y para evitar que sea pacientemente expulsado del tanque - lentamente expulsado del tanque - por el golpeteo continuo, tengo que mantener el pistón abajo con una cierta fuerza que llamo la presión o realmente la presión por el área es la fuerza, pero no importa, es - Claramente la fuerza... Claramente la fuerza es proporcional al área si, cuando aumento el área, mantengo el mismo número de moléculas por cc.【60】【61】Ahora, si pongo el doble de moléculas en este tanque a la misma velocidad, eso representa entonces la misma temperatura, pero el doble del número de átomos - eso es el doble de la densidad - entonces, dentro de una excelente aproximación, el número de colisiones será el doble, y serán tan enérgicas como antes, y la presión se incrementará por un factor de dos.【62】 Así que la presión es proporcional a la densidad.【63】',
-            "output": [
-                "Procedamos ahora con nuestro esquema, o mapa general, de nuestra comprensión de la ciencia hoy en día (en particular, la física, pero también de otras ciencias en la periferia), para que cuando más tarde nos concentremos en algún punto particular, tengamos alguna idea del trasfondo, por qué ese punto particular es interesante, y cómo encaja en la gran estructura.【0】【1】 Entonces, ¿cuál es nuestra imagen general del mundo?【2】【3】Si, en algún cataclismo, todo el conocimiento científico fuera a ser destruido,【4】 y solo una frase pudiera ser transmitida a las próximas generaciones de criaturas, ¿qué declaración contendría la mayor información en el menor número de palabras?【5】 Creo que es la hipótesis atómica (o el hecho atómico, o como quieras llamarlo) de que todas las cosas están hechas de átomos - pequeñas partículas que se mueven alrededor en movimiento perpetuo, atrayéndose entre sí cuando están a una pequeña distancia, pero repeliéndose al ser apretadas una contra otra.【6】 En esa única frase, verás, hay una enorme cantidad de información sobre el mundo,【7】 si se aplica solo un poco de imaginación y pensamiento.【8】",
-                'Para ilustrar el poder de la idea atómica, supongamos que tenemos una gota de agua de un cuarto de pulgada de lado.【9】 Si la miramos muy de cerca no vemos nada más que agua - agua lisa y continua.【10】 Incluso si la magnificamos con el mejor microscopio óptico disponible - aproximadamente dos mil veces - entonces la gota de agua tendrá aproximadamente cuarenta pies de ancho, casi tan grande como una habitación grande, y si miráramos bastante de cerca, _aún_ veríamos agua relativamente lisa - pero aquí y allá pequeñas cosas en forma de balón de fútbol nadando de un lado a otro.【11】 Muy interesante.【12】 Estos son paramecium.【13】 Puedes detenerte en este punto y sentir tanta curiosidad por los paramecium con sus cilios ondulantes y cuerpos retorcidos que no vayas más allá, excepto quizás para magnificar aún más los paramecium y ver su interior.【14】 Esto, por supuesto, es un tema para la biología, pero por ahora seguimos adelante y miramos aún más de cerca el material del agua en sí, magnificándolo dos mil veces más.【15】 Ahora la gota de agua se extiende unos quince kilómetros de ancho,【16】 y si la miramos muy de cerca vemos una especie de hormigueo, algo que ya no tiene una apariencia lisa【17】 - se parece algo a una multitud en un partido de fútbol vista desde una gran distancia.【18】 Para ver de qué se trata este hormigueo, lo magnificaremos otras doscientas cincuenta veces y veremos algo similar a lo que se muestra en la Fig. 1-1.【19】 Esta es una imagen del agua magnificada mil millones de veces, pero idealizada en varios aspectos.【20】 En primer lugar, las partículas están dibujadas de una manera simple con bordes afilados, lo cual es inexacto.【21】 En segundo lugar, por simplicidad, están esbozadas casi esquemáticamente en una disposición bidimensional, pero por supuesto se están moviendo en tres dimensiones.【22】 Observa que hay dos tipos de "manchas" o círculos para representar los átomos de oxígeno (negro) e hidrógeno (blanco), y que cada oxígeno tiene dos hidrógenos unidos a él.【23】 (Cada pequeño grupo de un oxígeno con sus dos hidrógenos se llama una molécula.) La imagen está idealizada aún más en el sentido de que las partículas reales en la naturaleza están continuamente temblando y rebotando, girando y retorciéndose unas alrededor de otras.【24】 Tendrás que imaginar esto como una imagen dinámica en lugar de estática.【25】 Otra cosa que no se puede ilustrar en un dibujo es el hecho de que las partículas están "pegadas juntas" - que se atraen entre sí, esta atraída por aquella, etc.【26】 Todo el grupo está "pegado", por así decirlo. Por otro lado, las partículas no se atraviesan entre sí. Si intentas apretar dos de ellas demasiado juntas, se repelen.【27】【28】【29】',
-                "Los átomos tienen un radio de 1 o 2x10^-8 cm.【30】 Ahora, 10^-8 cm se llama un _angstrom_ (solo como otro nombre), así que decimos que tienen un radio de 1 o 2 angstroms (Å). Otra manera de recordar su tamaño es esta:【31】 si una manzana se magnifica al tamaño de la Tierra, entonces los átomos en la manzana son aproximadamente del tamaño de la manzana original.【32】【33】",
-                "Ahora imagina esta gran gota de agua con todas estas partículas temblando pegadas juntas y siguiéndose unas a otras.【34】 El agua mantiene su volumen; no se desmorona, debido a la atracción de las moléculas entre sí.【35】 Si la gota está en una pendiente, donde puede moverse de un lugar a otro, el agua fluirá, pero no desaparece simplemente - las cosas no se separan volando - debido a la atracción molecular.【36】【37】 Ahora, el movimiento de temblor es lo que representamos como _calor_: cuando aumentamos la temperatura, aumentamos el movimiento.【38】 Si calentamos el agua, el temblor aumenta y el volumen entre los átomos aumenta, y si el calentamiento continúa llega un momento en que la atracción entre las moléculas no es suficiente para mantenerlas juntas y _sí_ se separan volando y se alejan unas de otras.【39】 Por supuesto, así es como fabricamos vapor a partir del agua - aumentando la temperatura; las partículas se separan volando debido al aumento del movimiento.【40】【41】",
-                "En la Fig. 1-2 tenemos una imagen del vapor.【42】 Esta imagen del vapor falla en un aspecto: a la presión atmosférica normal ciertamente no habría tantas como tres moléculas de agua en esta figura.【44】 La mayoría de los cuadrados de este tamaño no contendrían ninguna - pero accidentalmente tenemos dos y media o tres en la imagen (solo para que no estuviera completamente en blanco).【45】 Ahora en el caso del vapor vemos las moléculas características más claramente que en el caso del agua.【46】 Por simplicidad, las moléculas están dibujadas de manera que hay un ángulo de 120∘ entre los átomos de hidrógeno.【47】 En realidad, el ángulo es de 105∘3′, y la distancia entre el centro de un hidrógeno y el centro del oxígeno es de 0.957 Å, así que conocemos esta molécula muy bien.【48】",
-                "Veamos cuáles son algunas de las propiedades del vapor de agua o de cualquier otro gas. Las moléculas, al estar separadas unas de otras, rebotarán contra las paredes.【51】 Imagina una habitación con un número de pelotas de tenis (unas cien más o menos) rebotando en movimiento perpetuo.【52】 Cuando bombardean la pared, esto empuja la pared hacia afuera.【53】 (Por supuesto, tendríamos que empujar la pared hacia atrás.)【54】 Esto significa que el gas ejerce una fuerza inestable que nuestros sentidos toscos (al no estar nosotros mismos magnificados mil millones de veces) sienten solo como un _empuje promedio_.【55】 Para confinar un gas debemos aplicar una presión.【56】 La Figura 1-3 muestra un recipiente estándar para contener gases (usado en todos los libros de texto), un cilindro con un pistón en su interior.【57】 Ahora, no importa cuáles sean las formas de las moléculas de agua, así que por simplicidad las dibujaremos como pelotas de tenis o pequeños puntos, y estas cosas están en movimiento perpetuo en todas direcciones.【58】【59】 Tantas de ellas están golpeando el pistón superior todo el tiempo que para evitar que sea pacientemente expulsado del tanque por este golpeteo continuo, tendremos que mantener el pistón abajo con una cierta fuerza, que llamamos la _presión_ (en realidad, la presión por el área es la fuerza).【60】 Claramente, la fuerza es proporcional al área, porque si aumentamos el área pero mantenemos el mismo número de moléculas por centímetro cúbico, aumentamos el número de colisiones con el pistón en la misma proporción en que se aumentó el área.【61】",
-                'Ahora pongamos el doble de moléculas en este tanque, para duplicar la densidad, y dejemos que tengan la misma velocidad, es decir, la misma temperatura.【62】 Entonces, en una aproximación cercana, el número de colisiones se duplicará, y dado que cada una será tan "enérgica" como antes, la presión es proporcional a la densidad.【63】 Si consideramos la verdadera naturaleza de las fuerzas entre los átomos, esperaríamos una ligera disminución en la presión debido a la atracción entre los átomos, y un ligero aumento debido al volumen finito que ocupan. Sin embargo, en una excelente aproximación, si la densidad es lo suficientemente baja como para que no haya muchos átomos, _la presión es proporcional a la densidad_.【64】',
-            ],
-        },
-        {
-            "input": 'Ahora puedes ver algo más: si aumento la temperatura sin cambiar la densidad del gas, es decir, si aumento la velocidad de los átomos, ¿qué va a pasar con la presión?【0】 Bueno, golpean más fuerte porque se mueven más rápido, así que la presión aumenta - ves cuán simples son las ideas de la teoría atómica.【1】【2】Déjame tomar otro ejemplo que es aún más... que es otro... Bueno, consideremos otra cosa: supongamos que el pistón se está moviendo hacia abajo.【3】 Bueno, los átomos están siendo comprimidos en un espacio más pequeño.【4】 ¿Qué sucede cuando un átomo golpea un pistón en movimiento?【5】 Si se está moviendo así, y golpea un espejo en movimiento, o rebota en una pared en movimiento, evidentemente gana velocidad por la colisión - puedes probarlo haciendo rebotar una pelota de ping pong en una bola de boliche en movimiento, por ejemplo - y encontrarás que sale con más velocidad de la que entró.【6】 Ejemplo especial: si resulta que está quieto, y el pistón lo golpea, ciertamente se moverá hacia abajo.【7】 Así que está claro que sale, en promedio, con más velocidad de la que entra.【8】 Por lo tanto, después de un tiempo los átomos que están aquí habrán ganado velocidad.【9】 Eso significa que cuando comprimimos un gas lentamente, la temperatura del gas aumenta.【10】 Así que bajo una compresión lenta, un gas aumentará su temperatura.【11】 Y entonces en la expansión lenta, ¿qué?【12】 En el caso de la expansión, si el pistón se está moviendo hacia arriba, entonces cada átomo que golpea este pistón, que se está moviendo hacia afuera, entra - si puedo hablar crudamente - en un material que cede, un lugar que está retrocediendo, y la energía que tienen los átomos disminuye.【13】 Por lo tanto, los gases se enfrían al expandirse.【14】 Ahora esa es la dirección de aumentar la temperatura del agua.【15】【16】Miremos en la otra dirección.【17】 Supongamos que disminuimos la temperatura.【18】 Supongamos que el movimiento de los átomos - de las moléculas, o los átomos en el agua - se está ralentizando, ralentizando todo el tiempo.【19】 Ahora, sabes que las fuerzas - hay fuerzas de atracción entre los átomos - y después de un tiempo no podrán moverse tan bien - y lo que sucederá a temperaturas muy bajas se indica en la siguiente diapositiva.【20】 Lo que sucede es que se bloquean en un nuevo patrón, qué es un patrón de ss - ¿puedes apagar las luces para que podamos ver mejor el hielo?【21】 - a un... a un patrón que es sólido.【22】 En este diagrama esquemático particular del hielo - que está mal porque está en dos dimensiones, pero es cualitativamente correcto, tengo un modelo tridimensional aquí también que explicaré quizás más tarde - tenemos los átomos de oxígeno y los hidrógenos, con dos hidrógenos en cada oxígeno como antes, pero todos están s- los hidrógenos se están tocando entre sí, y toda la cosa está unida en una cierta disposición.【23】 Esta no es la disposición exacta;【24】 por supuesto es una cosa bidimensional;【25】 la disposición exacta por supuesto es una cosa tridimensional que es difícil de representar.【26】 Sin embargo, el punto que es interesante es que el material tiene un lugar definido para cada átomo, y puedes apreciar fácilmente que si de alguna manera u otra yo mantuviera todos estos átomos en una cierta disposición, en un cierto lugar, entonces debido a la estructura de interconexiones, que es rígida, el otro extremo - "millas" de distancia - tendría una ubicación definida.【27】 Así que si sostengo un trozo de hielo, o una aguja de hielo, en un extremo, el otro extremo resiste cuando lo empujo hacia abajo - a diferencia del caso del agua, en el que esta estructura, debido al aumento del movimiento, se descompone de modo que los átomos se mueven en todas las direcciones diferentes.【28】 Entonces la organización de los átomos en esta cosa, incluso si se mantienen en su lugar, no se transmitirá de átomo a átomo en todas las direcciones hasta el otro extremo, y nuestro pequeño cristal simplemente se hundirá y goteará a medida que aumentemos la temperatura.【29】 Así que la diferencia entre sólidos y líquidos es que en un sólido los átomos están dispuestos en algún tipo de arreglo y, uh, un arreglo de lo que se llama un arreglo cristalino - un arreglo cristalino - y no tienen una posición aleatoria a largas distancias, sino que la posición de algunos de los átomos a una larga distancia está determinada por dónde están los átomos, algunos "millones de millas" en el otro lado del cristal.【30】 Por supuesto, me refiero a "millones de millas" a esta escala, por supuesto - una pequeña distancia en la naturaleza.【31】 Esta diapositiva en particular es una disposición inventada para el hielo, y contiene varias de las características correctas del hielo pero no es la disposición verdadera.【32】 Una de las características correctas es que hay un patrón de simetría que es hexagonal.【33】 Puedes verlo si giras toda esta imagen, no me refiero al borde exterior, sino los átomos mismos alrededor de un eje, digamos aquí, treinta, ciento veinte grados por ejemplo, entonces la imagen vuelve a sí misma - así que hay una simetría en el hielo, una simetría de seis lados, que explica la apariencia de seis lados de los copos de nieve, por ejemplo.【34】 Así que ahí está la forma de los copos de nieve, oculta.【35】 Otra cosa que se ilustra con este modelo artificial particular es el hecho de que, en particular, el hielo se encoge cuando se derrite.【36】 Notarás que este patrón particular que está dispuesto aquí tenía muchos agujeros.【37】 Ahora, la verdadera estructura del hielo tiene muchos agujeros, y cuando la organización se descompone, estos agujeros pueden ser ocupados por las moléculas - y así el volumen del agua es menor que el del hielo.【38】 La mayoría de las sustancias, con las excepciones de - las sustancias comunes que son excepciones son el agua y el metal de imprenta... Usualmente las cosas se contraen expanden cuando se derriten, porque usualmente el empaquetamiento es más apretado que esto cuando está frío, y cuando se derrite necesita más espacio para moverse - así que usualmente se expande.【39】 Pero a veces, cuando es una estructura abierta, colapsa cuando se derrite, como lo hace en el caso del agua.【40】【41】Finalmente, puedo decir que aunque sigo hablando de esto como una disposición rígida, la temperatura del hielo puede cambiar;【42】 el hielo tiene "calor" si quieres, y puedes cambiar la cantidad de calor.【43】 ¿Qué es el "calor" en el caso del hielo?【44】 Bueno, estas cosas no están realmente quietas allí;【45】 están moviéndose en su lugar, vibrando, tratando de salir de allí - todas moviéndose, como un - agitándose, todo el tiempo, como un - oh, no sé, tomas un colchón de resortes, o algo así, e imaginas que todos se están moviendo todo el tiempo.【46】 Así que hay un orden definido en la cosa;【47】 tiene una estructura, pero todas las cosas se están moviendo en su lugar.【48】 A medida que aumentas la temperatura, se mueven en su lugar con una sacudida cada vez más amplia hasta que la sacudida es tan amplia, tan grande, que se sacan de su lugar, y obtenemos la fusión.【49】 A medida que disminuyes la temperatura, el movimiento disminuye y disminuye, hasta que en el cero absoluto hay una cantidad mínima de movimiento que la materia puede tener - no cero, pero hay una cierta cantidad mínima de movimiento que la materia puede tener.【50】 De hecho, esta cantidad mínima de movimiento que las cosas pueden tener en todos los casos no es suficiente para derretir la cosa, así que todo es sólido en el cero absoluto con una excepción, y esa es el helio.【51】 El helio nunca se solidifica;【52】 el movimiento mínimo en el cero absoluto todavía es suficiente para mantenerlo derretido.【53】 Así que el helio, incluso a temperatura cero, nunca se congela - a menos que la presión se haga tan alta como para ayudar a las cosas;【54】 se aprietan juntas - si aumentas la presión, entonces puedes hacer que se solidifique.【55】【56】Ahora, eso es suficiente para la descripción de sólidos, líquidos y gases desde el punto de vista atómico - pero el punto de vista atómico también describe procesos.【57】 Y así me gustaría ir y mirar una serie de procesos uh para ver cómo se ven desde un punto de vista atómico.【58】 El primer proceso que me gustaría mirar está asociado con la superficie del agua.【59】 ¿Qué sucede en la superficie del agua?【60】 Y esta vez haré las imágenes más complicadas y realistas imaginando que la superficie está en el aire.【61】 Y esto se ilustra en la siguiente imagen.【62】 Aquí está una superficie de agua en el aire.【63】 Puedes reconocer las moléculas de agua como antes, y aquí abajo, y debajo, está el agua líquida - y esta es la superficie de ella.【64】 Arriba encontrarás una serie de cosas curiosas.【65】 En primer lugar, hay algunas moléculas de agua, como el vapor - ese es el vapor de agua que siempre está ahí sobre el agua.【66】 Hay una mezcla- hay un equilibrio entre el vapor - o vapor de vapor - y el agua líquida, que explicaré en un minuto.【67】 Pero además, encontrarás alguna otra cosa.【68】 Aquí hay dos negras pegadas juntas;【69】 las negras se llaman átomos de oxígeno, y dos átomos de oxígeno se pegan juntos también por sí mismos, formando otro tipo de molécula - o molécula de oxígeno.【70】 Además están estas cosas con rayas cruzadas, que son átomos de nitrógeno, y también se pegan en pares, para hacer una molécula.【71】 El aire consiste casi enteramente con algunas impurezas de diferentes cosas de... de, uh... nitrógeno, oxígeno, algo de vapor de agua, y algunas otras cosas - dióxido de carbono, argón, y trazas de otras cosas.【72】 Así que aquí está el aire, un gas que contiene algo de vapor de agua.【73】 Ahora, ¿qué está pasando en esta imagen?【74】 Las moléculas del agua siempre se están moviendo.【75】 De vez en cuando en el movimiento, una cerca de la superficie resulta ser golpeada un poco más fuerte por accidente, solo un accidente un poco más fuerte de lo habitual, y es empujada - digamos.【76】 Quiero decir, es difícil decir, porque es una imagen fija, exactamente qué está pasando aquí.【77】 Pero esta acaba de ser golpeada, por ejemplo, y está volando hacia afuera - o tal vez esta es la que acaba de ser golpeada y está volando hacia afuera - así que, molécula por molécula, el agua desaparece.【78】 Se evapora.【79】 Pero si cerramos el recipiente arriba, después de un tiempo tenemos un gran número de moléculas de agua entre el aire - porque no tienen ningún otro lugar adonde ir.【80】 En otras palabras, si tenemos un recipiente cerrado uh, el agua- entonces ¿qué pasa?【81】 Entonces - déjame tomar esta - de vez en cuando, una de ellas que está aquí afuera viene volando hacia el agua y se queda atrapada de nuevo.【82】 Así que lo que parece una cosa muerta y sin interés - un vaso de agua con una tapa que ha estado ahí durante veinte años - es un fenómeno dinámico, ex- un fenómeno interesante que ocurre todo el tiempo.【83】 Para nuestros ojos tontos, nuestros ojos crudos, nada está cambiando, pero si pudieras verlo mil millones de veces ampliado, verías que desde su propio punto de vista siempre está cambiando: las moléculas están dejando la superficie;【84】 las moléculas están volviendo, de ida y vuelta.【85】【86】¿Por qué no cambia?【87】 Porque justo tantas están saliendo como están volviendo, así que a largo plazo, nada sucede.【88】 Si entonces quito la tapa del recipiente, quito el vaso, y soplo el aire - si hago una corriente que barre por aquí, y se lleva estas moléculas de agua, reemplazándolas solo por aire - entonces el número que está saliendo sigue siendo el mismo que antes porque depende del movimiento del agua, pero el número que está volviendo se reduce mucho, porque hay muchas menos moléculas sobre el agua.【89】 Por lo tanto, hay más saliendo que entrando, y se evapora - por lo tanto, si quieres que se evapore, enciende el ventilador.【90】【91】Ahora hay algo más: ¿qué moléculas se van?【92】 Cuando una molécula se va, es debido a una acumulación accidental extra de un poco más de lo ordinario golpeando, o fo- golpeando.【93】 Por lo tanto, las que se van tienen, en promedio, más energía que la molécula promedio que está aquí.【94】 Así que las que se van se llevan energía, y dejan a las que quedan atrás con un movimiento promedio menor del que tenían antes - las más móviles uh mo- son las que se van.【95】 Así que el líquido se enfría gradualmente, si se evapora.【96】 Por supuesto, cuando una vuelve, debido a la atracción al agua de abajo, cuando entra hay una repentina gran atracción, y hay un chasquido - en otras palabras, una generación de calor.【97】 Así que cuando vuelven generan calor;【98】 cuando se van se llevan el calor - y el resultado, por supuesto, cuando no hay evaporación neta, es nada - no hay cambio de temperatura.【99】 Pero si soplo, para mantener un aumento continuo en el número - hay más saliendo que entrando - entonces el agua se enfría.【100】 Por lo tanto, sopla la sopa si quieres enfriarla.【101】【102】También quiero que notes que los procesos son más complicados.【103】 No solo el agua va al aire, sino que puedes imaginar que entre las colisiones, de vez en cuando, una de estas moléculas puede entrar aquí, perderse en el lío y abrirse camino hacia el agua, de modo que el aire se disuelve en el agua - tanto el oxígeno, que no está ilustrado, como las moléculas de nitrógeno se abrirán camino en el agua, y el agua contendrá nitrógeno.【104】 Por supuesto, si de repente quitamos el aire, entonces estas moléculas de nitrógeno saldrán más rápidamente de lo que entran, y al hacerlo formarán burbujas.【105】 Esto es muy malo para los buzos, como bien sabes: cuando tienes aire a alta presión, que estás respirando, entonces en la sangre se disuelve más nitrógeno de lo habitual, porque la alta presión simplemente significa una gran densidad del nitrógeno - de modo que más de ellos están entrando, cuando es alta.【106】 Cuando disminuyes la presión, intentan salir y formar burbujas.【107】 Así que eso es lo que sucede, y las burbujas no son buenas para el corazón.【108】',
-            "output": [
-                "También podemos ver otra cosa: Si aumentamos la temperatura sin cambiar la densidad del gas,【0】 es decir, si aumentamos la velocidad de los átomos, ¿qué va a pasar con la presión? Bueno, los átomos golpean más fuerte porque se mueven más rápido,【1】 y además golpean con más frecuencia, así que la presión aumenta. Vea cuán simples son las ideas de la teoría atómica.【2】",
-                'Consideremos otra situación. Supongamos que el pistón se mueve hacia adentro, de modo que los átomos se comprimen lentamente en un espacio más pequeño.【3】【4】 ¿Qué sucede cuando un átomo golpea el pistón en movimiento?【5】 Evidentemente, gana velocidad por la colisión. Puedes probarlo haciendo rebotar una pelota de ping-pong en una paleta que se mueve hacia adelante, por ejemplo, y verás que sale con más velocidad de la que tenía al golpear.【6】 (Ejemplo especial: si un átomo está quieto y el pistón lo golpea, ciertamente se moverá).【7】 Así que los átomos están "más calientes" cuando se alejan del pistón de lo que estaban antes de golpearlo.【8】 Por lo tanto, todos los átomos que están en el recipiente habrán ganado velocidad.【9】 Esto significa que _cuando comprimimos un gas lentamente, la temperatura del gas aumenta_.【10】【11】 Así, bajo una _compresión_ lenta, un gas _aumentará_ su temperatura, y bajo una _expansión_ lenta _disminuirá_ su temperatura.【12】【13】【14】',
-                'Ahora volvemos a nuestra gota de agua y miramos en otra dirección.【17】 Supongamos que disminuimos la temperatura de nuestra gota de agua.【18】 Supongamos que el movimiento de las moléculas de los átomos en el agua está disminuyendo constantemente.【19】 Sabemos que existen fuerzas de atracción entre los átomos, por lo que después de un tiempo no podrán moverse tan bien.【20】 Lo que sucederá a temperaturas muy bajas se indica en la Fig. 1-4:【21】 las moléculas se bloquean en un nuevo patrón que es el _hielo_.【22】 Este diagrama esquemático particular del hielo es incorrecto porque está en dos dimensiones, pero es cualitativamente correcto.【23】【24】【25】 El punto interesante es que el material tiene un _lugar definido para cada átomo_,【26】 y puedes apreciar fácilmente que si de alguna manera u otra mantuviéramos todos los átomos en un extremo de la gota en una disposición determinada, cada átomo en un lugar específico, entonces debido a la estructura de interconexiones, que es rígida, el otro extremo a millas de distancia (en nuestra escala ampliada) tendrá una ubicación definida.【27】 Así que si sostenemos una aguja de hielo en un extremo, el otro extremo resiste nuestro empuje hacia un lado, a diferencia del caso del agua, en el que la estructura se descompone debido al aumento del movimiento, de modo que los átomos se mueven de diferentes maneras.【28】 La diferencia entre sólidos y líquidos es, entonces, que en un sólido los átomos están dispuestos en algún tipo de matriz, llamada _matriz cristalina_,【29】 y no tienen una posición aleatoria a largas distancias;【30】 la posición de los átomos en un lado del cristal está determinada por la de otros átomos a millones de átomos de distancia en el otro lado del cristal.【31】 La Figura 1-4 es una disposición inventada para el hielo, y aunque contiene muchas de las características correctas del hielo, no es la disposición verdadera.【32】 Una de las características correctas es que hay una parte de la simetría que es hexagonal.【33】 Puedes ver que si giramos la imagen alrededor de un eje en 60∘60∘, la imagen vuelve a sí misma. Así que hay una _simetría_ en el hielo que explica la apariencia de seis lados de los copos de nieve.【34】【35】 Otra cosa que podemos ver en la Fig. 1-4 es por qué el hielo se encoge cuando se derrite.【36】 El patrón cristalino particular del hielo mostrado aquí tiene muchos "agujeros",【37】 al igual que la verdadera estructura del hielo.【38】 Cuando la organización se descompone, estos agujeros pueden ser ocupados por moléculas. La mayoría de las sustancias simples, con la excepción del agua y el metal de imprenta, se _expanden_ al derretirse,【39】 porque los átomos están estrechamente empaquetados en el cristal sólido y al derretirse necesitan más espacio para moverse, pero una estructura abierta colapsa, como en el caso del agua.【40】【41】',
-                'Ahora bien, aunque el hielo tiene una forma cristalina "rígida", su temperatura puede cambiar - el hielo tiene calor.【42】 Si lo deseamos, podemos cambiar la cantidad de calor.【43】 ¿Qué es el calor en el caso del hielo?【44】 Los átomos no están quietos.【45】 Están temblando y vibrando. Así que aunque hay un orden definido en el cristal - una estructura definida - todos los átomos están vibrando "en su lugar".【46】【47】 A medida que aumentamos la temperatura, vibran con mayor y mayor amplitud, hasta que se sacuden fuera de su lugar.【48】【49】 A esto lo llamamos _fusión_. A medida que disminuimos la temperatura, la vibración disminuye y disminuye hasta que, en el cero absoluto, hay una cantidad mínima de vibración que los átomos pueden tener, pero _no cero_.【50】 Esta cantidad mínima de movimiento que los átomos pueden tener no es suficiente para fundir una sustancia, con una excepción: el helio.【51】 El helio simplemente disminuye los movimientos atómicos tanto como puede, pero incluso en el cero absoluto todavía hay suficiente movimiento para evitar que se congele.【52】【53】 El helio, incluso en el cero absoluto, no se congela, a menos que la presión sea tan grande como para hacer que los átomos se aplasten entre sí.【54】 Si aumentamos la presión, _podemos_ hacer que se solidifique.【55】【56】',
-                "Hasta aquí la descripción de sólidos, líquidos y gases desde el punto de vista atómico.【57】 Sin embargo, la hipótesis atómica también describe _procesos_,【58】 así que ahora examinaremos varios procesos desde una perspectiva atómica. El primer proceso que analizaremos está asociado con la superficie del agua.【59】 ¿Qué sucede en la superficie del agua?【60】 Ahora haremos la imagen más complicada - y más realista - imaginando que la superficie está en el aire.【61】 La Figura 1-5 muestra la superficie del agua en el aire.【62】【63】 Vemos las moléculas de agua como antes, formando un cuerpo de agua líquida, pero ahora también vemos la superficie del agua.【64】 Sobre la superficie encontramos varias cosas:【65】 En primer lugar, hay moléculas de agua, como en el vapor.【66】 Este es el _vapor de agua_, que siempre se encuentra sobre el agua líquida. (Existe un equilibrio entre el vapor de agua y el agua que se describirá más adelante.)【67】 Además, encontramos algunas otras moléculas - 【68】【69】aquí dos átomos de oxígeno unidos entre sí, formando una _molécula de oxígeno_,【70】 allí dos átomos de nitrógeno también unidos para formar una molécula de nitrógeno.【71】 El aire consiste casi enteramente de nitrógeno, oxígeno, algo de vapor de agua y cantidades menores de dióxido de carbono, argón y otras sustancias.【72】 Así que sobre la superficie del agua está el aire, un gas, que contiene algo de vapor de agua.【73】 Ahora, ¿qué está sucediendo en esta imagen?【74】 Las moléculas en el agua siempre están moviéndose.【75】 De vez en cuando, una en la superficie resulta golpeada un poco más fuerte de lo habitual y es expulsada.【76】 Es difícil ver eso sucediendo en la imagen porque es una imagen _estática_.【77】 Pero podemos imaginar que una molécula cerca de la superficie acaba de ser golpeada y está saliendo volando, o quizás otra ha sido golpeada y está saliendo volando.【78】 Así, molécula por molécula, el agua desaparece - se evapora.【79】 Pero si _cerramos_ el recipiente arriba, después de un tiempo encontraremos un gran número de moléculas de agua entre las moléculas de aire.【80】【81】 De vez en cuando, una de estas moléculas de vapor baja volando hacia el agua y se queda atrapada de nuevo.【82】 Así que vemos que lo que parece una cosa muerta y sin interés - un vaso de agua con una tapa, que ha estado ahí quizás durante veinte años - es un fenómeno dinámico e interesante que está ocurriendo todo el tiempo.【83】 Para nuestros ojos, nuestros ojos toscos, nada está cambiando,【84】 pero si pudiéramos verlo mil millones de veces ampliado, veríamos que desde su propio punto de vista siempre está cambiando: las moléculas están dejando la superficie;【85】 las moléculas están regresando.【86】",
-                '¿Por qué _nosotros_ no vemos _ningún cambio_?【87】 ¡Porque hay tantas moléculas saliendo como regresando!【88】 A largo plazo "no sucede nada". Si luego quitamos la tapa del recipiente y soplamos el aire húmedo, reemplazándolo con aire seco, entonces el número de moléculas que salen es el mismo que antes, porque esto depende del movimiento del agua, pero el número que regresa se reduce enormemente porque hay muchas menos moléculas de agua sobre el agua.【89】 Por lo tanto, hay más saliendo que entrando, y el agua se evapora.【90】 Por consiguiente, ¡si deseas evaporar agua, enciende el ventilador!【91】',
-                "Aquí hay algo más: ¿Qué moléculas se van?【92】 Cuando una molécula se va, se debe a una acumulación accidental y extra de un poco más de energía de lo normal, que necesita para poder separarse de las atracciones de sus vecinas.【93】 Por lo tanto, dado que las que se van tienen más energía que el promedio, las que quedan tienen _menos_ movimiento promedio que antes.【94】 Así que el líquido se _enfría_ gradualmente si se evapora.【96】 Por supuesto, cuando una molécula de vapor viene del aire al agua de abajo, hay una repentina gran atracción cuando la molécula se acerca a la superficie.【97】 Esto acelera la molécula entrante y resulta en la generación de calor. Así que cuando se van se llevan el calor; cuando vuelven generan calor.【98】 Por supuesto, cuando no hay evaporación neta, el resultado es nulo: el agua no cambia de temperatura.【99】 Si soplamos sobre el agua para mantener un predominio continuo en el número de moléculas que se evaporan, entonces el agua se enfría.【100】 Por lo tanto, ¡sopla la sopa para enfriarla!【101】【102】",
-                'Por supuesto, debe darse cuenta de que los procesos que acabamos de describir son más complicados de lo que hemos indicado.【103】 No solo el agua pasa al aire, sino que también, de vez en cuando, una de las moléculas de oxígeno o nitrógeno entrará y se "perderá" en la masa de moléculas de agua, abriéndose paso en el agua. Así, el aire se disuelve en el agua; las moléculas de oxígeno y nitrógeno se abrirán paso en el agua y el agua contendrá aire.【104】 Si de repente quitamos el aire del recipiente, entonces las moléculas de aire saldrán más rápidamente de lo que entran, y al hacerlo formarán burbujas.【105】 Esto es muy malo para los buzos, como quizás sepa.【106】【107】【108】',
-            ],
-        },
-        {
-            "input": 'Ahora permítanme pasar a otro proceso.【0】 En la siguiente diapositiva vemos otro proceso desde un punto de vista atómico - un sólido disolviéndose en agua.【1】 Supongamos que ponemos un cristal de sal en el agua.【2】 ¿Qué sucede?【3】 La sal es un sólido;【4】 es un cristal, y por lo tanto hay una disposición organizada, que es un arreglo cúbico aquí, de átomos de sal.【5】 Aquí hay una ilustración, en tres dimensiones, de la sal - eh sodio y cloro.【6】 Estos no son estrictamente hablando átomos, sino lo que llamamos iones.【7】 Estos eh... Un ion es un átomo que ha ganado o perdido algunos electrones - tiene un número incorrecto de electrones.【8】 Y eh este es un ion de cloro - es un átomo de cloro con un electrón extra - y este es un ion de sodio - es decir, un átomo de sodio con un electrón menos.【9】 Ahora, todos se mantienen unidos por atracción eléctrica en la sal sólida, pero cuando la pones en agua, encontrarás que debido a las atracciones del oxígeno negativo y los hidrógenos positivos por los iones, habrá, gradualmente en el movimiento, algunos de estos átomos que se soltarán.【10】 Aquí hay una imagen de uno, el átomo de cloro, soltándose - y eh ahí están, flotando en el agua, en forma de iones.【11】 Notarás algunas características muy - estas imágenes están hechas con mucho cuidado, je - notarás algunas características delicadas.【12】 Por ejemplo, alrededor del cloro es más probable que estén los extremos de hidrógeno del agua - mientras que alrededor del sodio, el extremo de oxígeno - porque el sodio es positivo, y el extremo de oxígeno de la molécula de agua es negativo, y se atraen eléctricamente - así que así es como será, y esto es más o menos realista.【13】 Y eh nosotros Por supuesto no he pensado en todo, así que solo puedo señalar aquellas cosas que son realistas en la diapositiva;【14】 aquellas cosas que no lo son, no las he pensado.【15】 Ahora, en este caso particular, sin embargo, ion por ion, el sodio se di- disuelve en el agua.【16】 ¿Cómo puedes saber por esta imagen si esto es sal disolviéndose en agua, o sal cristalizándose fuera del agua, digamos, que se está evaporando - un aumento en la concentración de sal?【17】 No puedes - porque mientras los átomos se están yendo, otros átomos están bajando;【18】 todavía tenemos este asunto dinámico, al igual que teníamos en el caso de la evaporación - y depende de si hay más sal en el agua, o menos sal en el agua, que la cantidad necesaria para el equilibrio.【19】 Por "equilibrio" me refiero a que la tasa a la que se están yendo debe coincidir con la tasa a la que están regresando.【20】 Entonces, si apenas hay sal en el agua - si es casi agua pura - más se van que regresan, y la sustancia se disuelve.【21】 Si, por otro lado, has hecho que haya demasiados átomos o demasiado en el agua - entonces más bajan, y la cosa está cristalizando.【22】【23】Nota que, por cierto, si estás interesado en moléculas, el concepto de moléculas es solo aproximado, y solo existe para cierto número de sustancias.【24】 Aunque está bastante claro en el caso del agua que esos tres átomos están unidos, es imposible decir, en el caso del cloruro de sodio, dónde está la "molécula": no hay molécula de cloruro de sodio en el sólido;【25】 solo hay una disposición de átomos de sodio y cloro en un patrón - eh el patrón cúbico dado aquí.【26】【27】El... eh... Si aumentamos la temperatura, aumentamos el movimiento.【28】 Entonces la tasa a la que las cosas son removidas aumenta - pero también aumenta la tasa a la que las cosas son traídas de vuelta - y resulta bastante difícil en general predecir la ley general sobre en qué dirección va a ir - cuando aumentas la temperatura, si vas a disolver más, o disolver menos.【29】 La mayoría de las sustancias se disuelven más, pero algunas sustancias se disuelven menos.【30】 Así que no podemos decir, pero podemos adivinar que cambiará de una manera u otra, porque sería un accidente de la mayor forma si, cuando aumentas la tasa de movimiento, la tasa a la que se sueltan, y la tasa a la que vuelven a trabajar, resultaran estar dese-qui-libradas - cambiadas ambas en la misma cantidad.【31】 Ambas tasas aumentan, por supuesto, pero la cuestión es, cuál aumenta más.【32】【33】Ahora, en todos los procesos que he descrito hasta ahora, los átomos o los iones no han "cambiado de pareja.【34】" Es decir, tenemos aquí una molécula de agua con dos oxígenos y un hidrógeno;【35】 señalamos que había algo como oxígeno, que eran dos moléc- dos átomos de oxígeno solos.【36】 Pero hay circunstancias en las que los átomos adoptan nuevas combinaciones, formando nuevas moléculas.【37】【38】Esto se ilustra en la siguiente diapositiva - una situación en la que ocurre la realineación de las pare- de las "parejas".【39】 Esto es lo que llamamos una reacción química;【40】 a los otros los llamamos un proceso físico, pero no hay una distinción clara entre estas cosas - a la naturaleza no le importa cómo la llamemos;【41】 ella simplemente sigue haciéndolo de la manera que quiere.【42】 Ahora, esto se supone que representa carbono.【43】 No traje un cristal de carbono;【44】 es diamante, por ejemplo.【45】 Si quieres quemar un diamante en el aire, puedes - pero eres algo tonto.【46】 Ahora, aquí está eh quemándose en oxígeno.【47】 Lo he simplificado: no tengo aire - esto es el oxígeno.【48】 Ahora, en el caso del oxígeno estos dos átomos de oxígeno se unen muy fuertemente.【49】 ¿Por qué no tres?【50】 ¿Por qué no se unen cuatro?【51】 Esa es una de las características muy peculiares de eh las fuerzas interatómicas: son muy especiales, y les gustan ciertos socios particulares en ciertas direcciones particulares, y así sucesivamente - y es trabajo de la física analizar por qué cada uno "quiere lo que quiere.【52】" Pero en cualquier caso, forma - saturado, o "feliz" - un par.【53】【54】Los átomos de carbono en el cristal, que sería - el grafito, o... o diamante - se ve así.【55】 Ahora, por ejemplo, uno de estos puede bajar al carbono, y poner y cada uno tomar un átomo de carbono, y salir volando en una nueva combinación, carbono-oxígeno - que se llama el gas monóxido de carbono un oxígeno por cada carbono, y se le da el nombre químico CO - es muy simple.【56】 Esto es prácticamente una imagen de esa molécula.【57】 El carbono atrae al oxígeno mucho más que el oxígeno atrae al oxígeno, o el carbono atrae al carbono.【58】 Por lo tanto, cuando esto sucede, esto puede bajar con una pequeña energía, pero puede ser capaz de recoger estas cosas, y se unirán con una venganza tremenda, y se agitarán - y cualquier otra cosa cerca de ellos recogerá la energía, porque golpean si golpeas algo que está agitándose fuerte, recoges una energía.【59】 Así que hay una trem-e-enda gran cantidad de energía de movimiento - energía cinética en el gas se genera aquí.【60】 Esto, por supuesto, es la combustión - estamos obteniendo calor de la combinación de oxígeno y carbono - el calor está en forma ordinaria del alto movimiento del gas caliente, pero por supuesto en ciertas circunstancias puede ser tan enorme que genera luz - y así obtienes llamas de esto.【61】【62】Además, el monóxido de carbono no está completamente "satisfecho" - es posible que se le una otro oxígeno - así que podríamos tener una reacción mucho más complicada ilustrada aquí, en la que el oxígeno se está combinando con el carbono - pero no estamos seguros, y al mismo tiempo hay sucede que hay una colisión de un monóxido de carbono, aquí - y no estamos seguros si este oxígeno va a terminar unido a este, en este uno a ese, o cómo - pero este podría unirse a este y formar esta molécula, que es un carbono y dos oxígenos, que se hace en la forma - CO2 - y es dióxido de carbono.【63】 Si tienes suficiente oxígeno presente, y lo quemas continuamente - mantienes la reacción en marcha - formará todo dióxido de carbono, en última instancia.【64】 Pero si quemas la cosa con muy poco oxígeno, y eh haces una reacción muy rápida - como en un gas- por ejemplo en un motor de automóvil, donde la coli- donde la explosión es tan rápida que no hay tiempo para que haga mu- todo el dióxido de carbono - y una cantidad considerable de monóxido de carbono sale.【65】 La principal diferencia entre esto y otros procesos es el hecho de que se forman nuevas parejas para formar nuevas moléculas, y esta reorganización se llama una reacción química - y, lo más interesante, en tales reorganizaciones se libera una gran cantidad de energía, formando explosiones, y llamas, y demás, dependiendo de las reacciones.【66】 Ahora, los químicos han estudiado estos arreglos de los átomos, y encuentran que todo puede ser entendido - todo es algún tipo de arreglo de átomos - y para ilustrar esto, me gustaría solo ex- tomar un ejemplo de algo más.【67】【68】Si vamos a un campo y olemos violetas, por ejemplo, lo que es ese olor, es algún tipo de molécula o arreglo de átomos que ha encontrado su camino hacia nuestra nariz.【69】 Entonces, eh primero que nada, ¿cómo encuentra su camino?【70】 Bueno, eso es bast- bastante fácil: si hay algún tipo de molécula o arreglo de átomos que provienen de una violeta - ya que el gas tiene todos los átomos bastante separados puede - agitándose y golpeando por todas partes, tra- - accidentalmente encontrar su camino hacia la nariz.【71】 No hay un deseo particular de entrar en la nariz;【72】 es simplemente - es simplemente que son una multitud agitada de átomos en moléc- en el ga- en el aire, y este trozo particular de materia, abriéndose camino, gradualmente hacia arriba, eh sucedió que encontró su camino hacia la nariz.【73】',
-            "output": [
-                'Ahora pasamos a otro proceso.【0】 En la Fig. 1-6 vemos, desde un punto de vista atómico, un sólido disolviéndose en agua.【1】 Si ponemos un cristal de sal en el agua, ¿qué sucederá?【2】 La sal es un sólido;【3】 un cristal, una disposición organizada de "átomos de sal".【4】 La Figura 1-7 es una ilustración de la estructura tridimensional de la sal común, el cloruro de sodio.【5】 Estrictamente hablando, el cristal no está hecho de átomos, sino de lo que llamamos _iones_.【6】 Un ion es un átomo que tiene algunos electrones extra o ha perdido algunos electrones.【7】 En un cristal de sal encontramos iones de cloro (átomos de cloro con un electrón extra) e iones de sodio (átomos de sodio con un electrón faltante).【8】 Los iones se mantienen unidos por atracción eléctrica en la sal sólida, pero cuando los ponemos en el agua encontramos que, debido a las atracciones del oxígeno negativo y el hidrógeno positivo por los iones, gradualmente en el movimiento, algunos de los iones se desprenderán.【9】【10】 En la Fig. 1-6 vemos un ion de cloro desprendiéndose, y otros átomos flotando en el agua en forma de iones.【11】 Esta imagen fue hecha con cierto cuidado.【12】 Nótese, por ejemplo, que es más probable que los extremos de hidrógeno de las moléculas de agua estén cerca del ion de cloro, mientras que cerca del ion de sodio es más probable encontrar el extremo de oxígeno, porque el sodio es positivo y el extremo de oxígeno del agua es negativo, y se atraen eléctricamente.【13】【14】【15】 ¿Podemos decir a partir de esta imagen si la sal se está _disolviendo en_ agua o _cristalizando fuera_ del agua?【16】 Por supuesto que _no_ podemos decirlo,【17】 porque mientras algunos átomos están dejando el cristal, otros átomos se están reincorporando.【18】 El proceso es _dinámico_, al igual que en el caso de la evaporación,【19】 y depende de si hay más o menos sal en el agua que la cantidad necesaria para el equilibrio.【20】 Por equilibrio nos referimos a esa situación en la que la tasa a la que los átomos se van coincide exactamente con la tasa a la que regresan.【21】 Si casi no hay sal en el agua, más átomos se van que los que regresan, y la sal se disuelve.【22】 Si, por otro lado, hay demasiados "átomos de sal", más regresan que los que se van, y la sal está cristalizando.【23】',
-                'De paso, mencionamos que el concepto de una _molécula_ de una sustancia es solo aproximado y existe únicamente para cierta clase de sustancias.【24】 Es claro en el caso del agua que los tres átomos están realmente unidos. No es tan claro en el caso del cloruro de sodio en estado sólido.【25】 Solo hay una disposición de iones de sodio y cloro en un patrón cúbico.【26】 No hay una forma natural de agruparlos como "moléculas de sal".【27】',
-                "Volviendo a nuestra discusión sobre solución y precipitación, si aumentamos la temperatura de la solución salina, entonces la velocidad a la que los átomos son removidos aumenta, y también lo hace la velocidad a la que los átomos regresan.【28】 Resulta ser muy difícil, en general, predecir en qué dirección irá, si se disolverá más o menos del sólido.【29】 La mayoría de las sustancias se disuelven más, pero algunas sustancias se disuelven menos,【30】 a medida que aumenta la temperatura. Podemos adivinar que cambiará de una manera u otra, porque sería una casualidad de la mayor magnitud si, cuando aumentamos la velocidad de agitación, la velocidad a la que se desprenden y la velocidad a la que regresan resultaran cambiar ambas en la misma cantidad.【31】 Ambas velocidades aumentan, por supuesto, pero la cuestión es cuál aumenta más.【32】【33】",
-                "En todos los procesos que se han descrito hasta ahora, los átomos y los iones no han cambiado de pareja,【34】 pero por supuesto hay circunstancias en las que los átomos sí cambian de combinaciones,【37】 formando nuevas moléculas.【38】",
-                "Esto se ilustra en la Fig. 1-8.【39】 Un proceso en el que ocurre la reorganización de los socios atómicos es lo que llamamos una _reacción química_.【40】 Los otros procesos descritos hasta ahora se denominan procesos físicos, pero no hay una distinción clara entre los dos.【41】 (A la naturaleza no le importa cómo lo llamemos, ella simplemente sigue haciéndolo.)【42】 Esta figura se supone que representa el carbono quemándose en oxígeno.【43】【44】【45】【46】【47】 En el caso del oxígeno, _dos_ átomos de oxígeno se unen muy fuertemente.【48】【49】 (¿Por qué no se unen _tres_ o incluso _cuatro_?【50】【51】 Esa es una de las características muy peculiares de tales procesos atómicos. Los átomos son muy especiales: les gustan ciertos socios particulares, ciertas direcciones particulares, y así sucesivamente. Es trabajo de la física analizar por qué cada uno quiere lo que quiere.【52】 En cualquier caso, dos átomos de oxígeno forman, saturados y felices, una molécula.)【53】【54】",
-                'Los átomos de carbono se supone que están en un cristal sólido (que podría ser grafito o diamante).【55】 Ahora, por ejemplo, una de las moléculas de oxígeno puede acercarse al carbono, y cada átomo puede tomar un átomo de carbono y salir volando en una nueva combinación - "carbono-oxígeno" - que es una molécula del gas llamado monóxido de carbono.【56】 Se le da el nombre químico CO.【57】 Es muy simple: las letras "CO" son prácticamente una imagen de esa molécula.【58】 Pero el carbono atrae al oxígeno mucho más de lo que el oxígeno atrae al oxígeno o el carbono atrae al carbono. Por lo tanto, en este proceso el oxígeno puede llegar con solo un poco de energía, pero el oxígeno y el carbono se unirán con una tremenda venganza y conmoción, y todo lo que esté cerca de ellos absorberá la energía.【59】 Se genera así una gran cantidad de energía de movimiento, energía cinética.【60】 Esto, por supuesto, es la _combustión_; estamos obteniendo _calor_ de la combinación de oxígeno y carbono.【61】 El calor está normalmente en forma de movimiento molecular del gas caliente, pero en ciertas circunstancias puede ser tan enorme que genera _luz_. Así es como se producen las _llamas_.【62】',
-                "Además, el monóxido de carbono no está del todo satisfecho. Es posible que se una a otro oxígeno, de modo que podríamos tener una reacción mucho más complicada en la que el oxígeno se combina con el carbono, mientras que al mismo tiempo ocurre una colisión con una molécula de monóxido de carbono.【63】 Un átomo de oxígeno podría unirse al CO y finalmente formar una molécula, compuesta por un carbono y dos oxígenos, que se designa como CO2 y se llama dióxido de carbono. Si hay suficiente oxígeno presente, y se quema continuamente - se mantiene la reacción en marcha - finalmente se formará todo dióxido de carbono.【64】 Si quemamos el carbono con muy poco oxígeno en una reacción muy rápida (por ejemplo, en un motor de automóvil, donde la explosión es tan rápida que no hay tiempo para que se forme dióxido de carbono) se forma una cantidad considerable de monóxido de carbono.【65】 En muchos de estos reordenamientos, se libera una gran cantidad de energía, formando explosiones, llamas, etc., dependiendo de las reacciones.【66】 Los químicos han estudiado estos ordenamientos de los átomos y han descubierto que cada sustancia es algún tipo de _ordenamiento de átomos_.【67】【68】",
-                'Para ilustrar esta idea, consideremos otro ejemplo. Si entramos en un campo de pequeñas violetas, sabemos lo que es "ese olor". Es algún tipo de _molécula_【69】, o disposición de átomos, que ha logrado entrar en nuestras narices. En primer lugar, ¿_cómo_ logró entrar?【70】 Eso es bastante fácil. Si el olor es algún tipo de molécula en el aire, moviéndose y siendo golpeada en todas direcciones, podría haber entrado _accidentalmente_ en la nariz.【71】【73】 Ciertamente no tiene ningún deseo particular de entrar en nuestra nariz.【72】 Es simplemente una parte indefensa de una multitud agitada de moléculas, y en sus vagabundeos sin rumbo, este trozo particular de materia se encuentra por casualidad en la nariz.【73】',
-            ],
-        },
-        {
-            "input": 'Ahora, los químicos pueden tomar moléculas especiales como el olor de las violetas, analizarlas y decirte la disposición exacta en el espacio de los átomos - al igual que sabemos que el dióxido de carbono es una línea recta de aquí a aquí;【0】 eso también se puede determinar fácilmente por métodos físicos.【1】 Pero en las disposiciones mucho más complicadas de átomos que hay en química, mediante un proceso de trabajo detectivesco muy notable, puedes encontrar las disposiciones de los átomos.【2】 Primero, permítanme ilustrar la imagen de cómo se ve sobre una violeta - cómo se ve el aire en las cercanías de una violeta.【3】 Eso está ilustrado en la siguiente diapositiva.【4】 Aquí está el nitrógeno y el oxígeno del aire.【5】 ¿Qué es eso?【6】 Bueno, vapor de agua.【7】 ¿Qué está haciendo?【8】 Bueno, ¡una violeta está húmeda!【9】 Quiero decir, ya sabes, todas las plantas transpiran, y así que hay algo de vapor de agua en el aire.【10】 ¡Y luego está este monstruo!【11】 Los círculos blancos son átomos de carbono, los círculos pequeños son átomos de hidrógeno, y el círculo negro es un átomo de oxígeno.【12】 Y estos, señores, tienen un patrón particular para que se organicen: es mucho más complicado que el dióxido de carbono;【13】 es una disposición enormemente complicada.【14】 Desafortunadamente, no puedo realmente representar todo lo que se sabe sobre ello químicamente, porque en realidad se conoce, en tres dimensiones, la disposición precisa de esas moléc- esos átomos - es decir, si, por ejemplo, ves que lo dibujo en dos dimensiones, pero este carbono y aquel pueden estar girados de esta manera, en relación con este carbono y aquel, y así sucesivamente.【15】 Y estos seis carbonos - que forman un anillo aquí - no forman un anillo plano sino una especie de anillo arrugado, y todos los ángulos y distancias se conocen con una precisión de, digamos, un uno por ciento en este caso particular.【16】 Sin embargo, para la emoción del asunto, desafortunadamente hice esta diapositiva hace casi nueve años, y resulta que mi respeto por la química estaba un poco exagerado, porque desde entonces descubrieron que habían cometido un pequeño error en la disposición del olor de las violetas.【17】 Sin embargo, te diré cuál es el error;【18】 no es muy grande.【19】 Pero quiero señalar que lo que es una fórmula química es simplemente una imagen de tal molécula.【20】 Cuando el químico escribe esta cosa en la pizarra, está tratando de dibujar, a grandes rasgos, esto: no lo está dibujando exactamente en tres dimensiones, pero te dice qué átomos están tocando cuáles.【21】 Así que tengo, por ejemplo, un anillo de seis carbonos, y una cadena de carbonos colgando del extremo - y así ves un anillo de seis carbonos, y una cadena de carbonos colgando del extremo, con un oxígeno segundo desde el final - oxígeno segundo desde el final - tres hidrógenos unidos a ese carbono, dos carbonos y tres hidrógenos sobresaliendo aquí, y así sucesivamente.【22】 Así que el químico, al escribir esta fórmula, ha descubierto la disposición de los átomos en la forma de la molécula.【23】【24】¿Cómo lo hace?【25】 Mezcla botellas llenas de cosas, y si se vuelve rojo le dice que hay un grupo de un carbono y tres hidrógenos unidos aquí;【26】 si se vuelve azul, por otro lado, esa no es la forma en que es en absoluto.【27】 Este es uno de los trabajos de detective más fantásticos que se hayan hecho jamás - química orgánica: descubrir la disposición de los átomos en estos arreglos enormemente complicados observando lo que sucede cuando mezclas las diferentes sustancias.【28】 El físico nunca creyó del todo que el químico supiera de lo que estaba hablando, cuando le decía la disposición del átomo.【29】 Y en años más o menos recientes - en veinte años, treinta años - ha sido posible, a través de la difracción de electrones, mirar de alguna manera tales moléculas - no tan complicadas como esta, pero unas que contienen partes de esta.【30】 Y ha sido posible mirar - a veces, hoy en día, sí, incluso tan complicadas como esta, y ha sido posible localizar cada átomo por un método físico que no tiene nada que ver con mezclar y mirar los colores, sino midiendo dónde están.【31】 Y, he aquí, los químicos casi siempre tienen razón.【32】【33】Por cierto, debo disculparme por esta en particular, el olor de las violetas siendo desconocido entonces - resultó que tenían un error en el análisis, y elegí la molécula equivocada;【34】 debería haber elegido una hace nueve años que conocían mejor.【35】 En cualquier caso, la imagen correcta del olor de las violetas se da aquí.【36】 Es el mismo anillo que antes, la misma cadena que antes;【37】 si miras de cerca verás una diferencia: hay un CH3 extra unido aquí - hay una reorganización de los hidrógenos - no hay ninguno aquí, y hay uno extra aquí, y así sucesivamente - pero está muy cerca de como era antes, y lamento no haber podido hacer una nueva diapositiva y no avergonzar a los químicos.【38】 La sustancia que he dibujado aquí es alfa irona.【39】 Resulta que hay, de la violeta, tres moléculas diferentes que tienen una ligera diferencia en la disposición de los átomos de hidrógeno - eso es todo;【40】 cambios menores - dos átomos de hidrógeno - a la otra forma.【41】【42】Ahora, un problema importante en química es nombrar la sustancia para que sepas lo que es.【43】 Encontrar un nombre para esta forma - y apreciarás el problema de encontrar un nombre para una forma - más que una forma, incluso: no solo debes obtener la forma, sino que tienes que decir cuál es - "este es un oxígeno, no un nitrógeno" - exactamente lo que son.【44】 Necesitas un nombre para la forma y la ubicación particular del átomo.【45】 Y así puedes apreciar que los nombres químicos deben ser complejos si son completos.【46】 Y así ves que el nombre de esta cosa en una forma más completa que te dirá la forma es cuatro guion coma dos dos tres seis guion tetrametil guion uno guion ciclohexenil cierre paréntesis guion tres guion buteno guion dos guion uno - y eso te dice que esta es la disposición.【47】 Pero puedes apreciar las dificultades que tienen los químicos, y también apreciar por qué los nombres son tan largos: no es porque quieran ser obstinados, sino porque tienen un problema extremadamente difícil: describir esta cosa, en palabras.【48】 Por qué no simplemente dibujan las imágenes todo el tiempo, no lo sé - me parece más fácil.【49】【50】Ahora, ¿cómo sabemos que hay átomos?【51】 Por todos los efectos de los que hablé, hicimos una hipótesis de que hay átomos - y uno tras otro, las cosas salen como decimos.【52】 Deberían hacerlo, si están hechas de átomos - y esa es la mayor parte de la evidencia de los átomos.【53】 Hay evidencia algo más directa;【54】 un buen ejemplo de eso es el siguiente.【55】 Los átomos son tan pequeños que no puedes verlos con un microscopio óptico - un microscopio ordinario - de hecho, incluso hoy en día, con un microscopio electrónico, todavía no puedes ver átomos individuales.【56】 Pero con un microscopio óptico puedes ver algo que es mucho más grande.【57】 Ahora, si los átomos están siempre en movimiento, digamos en el agua, y pongo una gran bola de algo en el agua - mucho más grande que el átomo - esa bola se moverá, muy parecido a una pelota de empuje en ese gran juego: tienes una pelota muy grande, un montón de gente debajo, todos empujando en varias direcciones, y la pelota se mueve por el campo de manera irregular.【58】 Así que de manera irregular una bola muy grande se moverá debido a las desigualdades accidentales de las colisiones en un lado u otro.【59】 Unos pocos más golpean en un lado que en el otro en un momento dado y la bola comienza a moverse en esta dirección;【60】 luego rápidamente "cambia de opinión", y así sucesivamente.【61】 Por lo tanto, al poner... si miras partículas muy pequeñas de suciedad, bueno, de cosas, de diferentes cosas - coloides, o algo en agua a través de un microscopio excelente, puedes ver un movimiento perpetuo de las partículas, que es resultado del bombardeo de los átomos.【62】 Esa es la evidencia más directa de los átomos, y espero que sea posible organizar en un laboratorio para configurar un microscopio para que puedas echar un vistazo a estos átomos vibrantes.【63】【64】Tengo aquí disposiciones de los varios, o de algunos de los diferentes tipos de sólidos.【65】 Aquí hay un sólido que es un poco más complicado, que es la calcita, y el cristal real de calcita verdadera se sienta aquí, y puedes ver la relación entre la forma del cristal y la forma de la disposición.【66】 Aquí hay otra disposición que los químicos están usando para estudiar la disposición de los átomos en varias moléculas: esto es casi tan complicado como la irona;【67】 resulta ser un aminoácido importante en las cosas vivas, llamado tirosina - pero es simplemente ilustrativo de lo que sabemos sobre el átomo.【68】【69】Ahora, todo está hecho de átomos - esa es la hipótesis clave.【70】 La hipótesis más impresionante en toda la biología, por ejemplo - la hipótesis más importante - es que todo lo que hacen los animales, lo hacen los átomos.【71】 En otras palabras, que no hay nada que hagan los seres vivos que no pueda entenderse desde el punto de vista de que están hechos de átomos moviéndose según las leyes de la física.【72】 Esto no ha sido evidente desde el principio;【73】 se necesitó algo de experimentación para sugerir esta hipótesis, y ahora es aceptada y es la más útil para producir nuevas ideas en el campo de la biología.【74】【75】Si un trozo de acero o un trozo de sal, que consiste en átomos uno al lado del otro, uno al lado de estas pequeñas gotas - milla tras milla de lo mismo, repetido una y otra vez - forma olas y espuma, y hace ruidos apresurados, y hace los patrones divertidos mientras corre sobre el cemento;【76】 si todo esto, toda la vida de un arroyo de agua no puede ser más que un montón de átomos, ¿cuánto más es posible?【77】 Si, en lugar de organizar los átomos en algún patrón definido una y otra vez repetido, una y otra vez - o incluso en pequeños grumos de complejidad, como el olor de las violetas - hacemos una disposición de átomos que es siempre diferente de un lugar a otro, con diferentes tipos, y así sucesivamente, en otras palabras, enormes matrices que cambian continuamente, sin repetirse, ¿cuánto más maravilloso es posible que estas cosas se comporten?【78】 ¿Y es posible que esta cosa que camina de un lado a otro frente a ti, hablándote, sea una gran masa de estas cosas en una disposición muy compleja - y que la mera complejidad de ello asombre la imaginación en cuanto a lo que puede hacer - de modo que cuando decimos "Soy un montón de átomos", no digo que soy meramente un montón de átomos, porque: un montón de átomos que no se repite de uno a otro bien podría tener las posibilidades que ves ante ti.【79】',
-            "output": [
-                'Ahora los químicos pueden tomar moléculas especiales como el olor de las violetas, analizarlas y decirnos la _disposición exacta_ de los átomos en el espacio.【0】 Sabemos que la molécula de dióxido de carbono es recta y simétrica: O - C - O.【1】 (Esto también se puede determinar fácilmente mediante métodos físicos.) Sin embargo, incluso para las disposiciones de átomos mucho más complicadas que existen en química, se puede, mediante un largo y notable proceso de trabajo detectivesco, encontrar las disposiciones de los átomos.【2】 La Figura 1-9 es una imagen del aire en las proximidades de una violeta;【3】【4】 de nuevo encontramos nitrógeno y oxígeno en el aire,【5】【6】 y vapor de agua.【7】【8】 (¿Por qué hay vapor de agua?【9】 Porque la violeta está _húmeda_.【10】 Todas las plantas transpiran.) Sin embargo, también vemos un "monstruo"【11】 compuesto de átomos de carbono, átomos de hidrógeno y átomos de oxígeno,【12】 que han elegido un patrón particular en el que disponerse.【13】 Es una disposición mucho más complicada que la del dióxido de carbono;【14】 de hecho, es una disposición enormemente complicada. Desafortunadamente, no podemos representar todo lo que realmente se conoce sobre ella químicamente, porque la disposición precisa de todos los átomos se conoce en realidad en tres dimensiones,【15】 mientras que nuestra imagen está solo en dos dimensiones. Los seis carbonos que forman un anillo no forman un anillo plano, sino una especie de anillo "arrugado".【16】 Todos los ángulos y distancias son conocidos.【17】【18】【19】 Así que una _fórmula_ química es simplemente una imagen de tal molécula.【20】 Cuando el químico escribe algo así en la pizarra, está tratando de "dibujar", a grandes rasgos, en dos dimensiones.【21】 Por ejemplo, vemos un "anillo" de seis carbonos, y una "cadena" de carbonos colgando en el extremo, con un oxígeno segundo desde el final, tres hidrógenos unidos a ese carbono, dos carbonos y tres hidrógenos sobresaliendo aquí, etc.【22】【23】【24】',
-                "¿Cómo descubre el químico cuál es la disposición?【25】 Mezcla botellas llenas de sustancias, y si se vuelve rojo, le indica que consiste en un hidrógeno y dos carbonos unidos aquí;【26】 si se vuelve azul, por otro lado, esa no es en absoluto la forma en que está.【27】 Este es uno de los trabajos de detective más fantásticos que se han hecho jamás: la química orgánica.【28】 Para descubrir la disposición de los átomos en estas matrices enormemente complicadas, el químico observa lo que sucede cuando mezcla dos sustancias diferentes.【29】 El físico nunca podía creer del todo que el químico supiera de lo que estaba hablando cuando describía la disposición de los átomos.【30】 Durante unos veinte años ha sido posible, en algunos casos, observar tales moléculas (no tan complicadas como esta, pero algunas que contienen partes de ella) mediante un método físico, y ha sido posible localizar cada átomo, no mirando colores, sino _midiendo dónde están_.【31】 Y he aquí que, los químicos casi siempre tienen razón.【32】【33】",
-                "Resulta que, de hecho, en el aroma de las violetas hay tres moléculas ligeramente diferentes,【40】 que se diferencian solo en la disposición de los átomos de hidrógeno.【41】【42】",
-                "Un problema de la química es nombrar una sustancia, para que sepamos qué es.【43】 ¡Encuentra un nombre para esta forma! El nombre no solo debe indicar la forma, sino también que aquí hay un átomo de oxígeno, allí uno de hidrógeno - exactamente qué y dónde está cada átomo.【44】【45】 Así que podemos apreciar que los nombres químicos deben ser complejos para ser completos.【46】 Ves que el nombre de esta cosa en la forma más completa que te dirá su estructura es 4-(2, 2, 3, 6 tetrametil-5-ciclohexenil)-3-buten-2-ona,【47】 y eso te dice que esta es la disposición. Podemos apreciar las dificultades que tienen los químicos, y también entender la razón de nombres tan largos.【48】 No es que deseen ser oscuros, sino que tienen un problema extremadamente difícil al tratar de describir las moléculas con palabras.【49】【50】",
-                '¿Cómo _sabemos_ que existen los átomos?【51】 Por uno de los trucos mencionados anteriormente: hacemos la _hipótesis_ de que existen los átomos, y uno tras otro los resultados salen como predecimos, como deberían si las cosas _están_ hechas de átomos.【52】 También hay evidencia algo más directa,【53】【54】 un buen ejemplo de la cual es el siguiente:【55】 Los átomos son tan pequeños que no se pueden ver con un microscopio óptico - de hecho, ni siquiera con un microscopio _electrónico_.【56】 (Con un microscopio óptico solo se pueden ver cosas mucho más grandes.)【57】 Ahora bien, si los átomos están siempre en movimiento, digamos en el agua, y ponemos una gran bola de algo en el agua, una bola mucho más grande que los átomos, la bola se agitará - como en un juego de pelota empujada, donde una pelota muy grande es empujada por mucha gente.【58】 La gente empuja en varias direcciones, y la pelota se mueve por el campo de manera irregular.【59】 Así, de la misma manera, la "bola grande" se moverá debido a las desigualdades de las colisiones de un lado a otro, de un momento a otro.【60】【61】 Por lo tanto, si observamos partículas muy pequeñas (coloides) en el agua a través de un excelente microscopio, vemos un movimiento perpetuo de las partículas, que es el resultado del bombardeo de los átomos.【62】 Esto se llama _movimiento browniano_.【63】【64】',
-                'Podemos ver más evidencia de los átomos en la estructura de los cristales.【65】 En muchos casos, las estructuras deducidas por análisis de rayos X coinciden en sus "formas" espaciales con las formas que realmente exhiben los cristales tal como se encuentran en la naturaleza.【66】 Los ángulos entre las diversas "caras" de un cristal coinciden, con una precisión de segundos de arco, con los ángulos deducidos bajo la suposición de que un cristal está compuesto por muchas "capas" de átomos.【67】【68】【69】',
-                "_Todo está hecho de átomos_.【70】 Esa es la hipótesis clave. La hipótesis más importante en toda la biología, por ejemplo, es que _todo lo que hacen los animales, lo hacen los átomos_.【71】 En otras palabras, _no hay nada que hagan los seres vivos que no pueda entenderse desde el punto de vista de que están hechos de átomos actuando según las leyes de la física_.【72】 Esto no se sabía desde el principio:【73】 se necesitaron algunos experimentos y teorías para sugerir esta hipótesis, pero ahora es aceptada, y es la teoría más útil para producir nuevas ideas en el campo de la biología.【74】【75】",
-                'Si una pieza de acero o una pieza de sal, compuesta de átomos uno al lado del otro, puede tener propiedades tan interesantes; si el agua - que no es más que estas pequeñas gotas, kilómetro tras kilómetro de lo mismo sobre la tierra - puede formar olas y espuma, y hacer ruidos precipitados y patrones extraños mientras corre sobre el cemento;【76】 si todo esto, toda la vida de un arroyo de agua, no puede ser más que un montón de átomos, _¿cuánto más es posible_?【77】 Si en lugar de organizar los átomos en algún patrón definido, repetido una y otra vez, o incluso formando pequeños grumos de complejidad como el olor de las violetas, hacemos un arreglo que es _siempre diferente_ de un lugar a otro, con diferentes tipos de átomos organizados de muchas maneras, cambiando continuamente, sin repetirse, ¿cuánto más maravillosamente es posible que esta cosa se comporte?【78】 ¿Es posible que esa "cosa" que camina de un lado a otro frente a ti, hablándote, sea una gran masa de estos átomos en un arreglo muy complejo, de tal manera que la pura complejidad de ello asombre la imaginación en cuanto a lo que puede hacer? Cuando decimos que somos un montón de átomos, no queremos decir que somos _meramente_ un montón de átomos, porque un montón de átomos que no se repite de uno a otro bien podría tener las posibilidades que ves frente a ti en el espejo.【79】',
-            ],
-        },
-    ],
-}
+def index_incremental(
+    previous: Content,
+    new_events: Sequence[SpeechEvent],
+    llm: LanguageModel,
+    max_tokens: int = 4096,
+    temperature: float = 0.5,
+    chunk_size: int = 2048,
+    lang: Optional[str] = None,
+    concurrency: int = 1,
+) -> Content:
+    """
+    Updates previously indexed content with events appended to its transcript.
+    Passages of `previous` are kept up to the last stable marker: the last passage may end
+    mid-thought, so it is re-processed together with `new_events`. Title and summary are refreshed
+    from the previous summary and the new paragraphs; chapters are refreshed from the start of the
+    last previous chapter. The cost of an update depends on the size of the delta, not on the
+    total length.
+    """
+    transcript = Transcript.from_events(chain(previous.transcript, new_events))
+
+    stable = previous.passages[:-1]
+    while stable and not get_markers(stable[-1]):
+        stable.pop()
+    start = max(get_markers(stable[-1])) + 1 if stable else 0
+
+    paragraphs = []
+    if start < len(transcript):
+        text = render({i: transcript[i].text for i in range(start, len(transcript))})
+        paragraphs = get_paragraphs(
+            text, llm, max_tokens, temperature, chunk_size, lang=lang, concurrency=concurrency
+        )
+
+    last_chapter = max([marker for marker in previous.chapters if marker < start], default=0)
+    # Passages without markers are kept with the marked passages around them
+    first_in_chapter = next(
+        (
+            i
+            for i, paragraph in enumerate(stable)
+            if max(get_markers(paragraph), default=-1) >= last_chapter
+        ),
+        len(stable),
+    )
+    chapter_paragraphs = stable[first_in_chapter:] + paragraphs
+
+    def refresh_meta() -> tuple[str, str]:
+        try:
+            return get_meta_hierarchical(llm, [previous.summary] + paragraphs, lang=lang)
+        except Exception:
+            return previous.title, previous.summary
+
+    def refresh_chapters() -> dict[int, str]:
+        chapters = {marker: title for marker, title in previous.chapters.items() if marker < last_chapter}
+        try:
+            chapters.update(get_chapters_hierarchical(llm, chapter_paragraphs, lang=lang))
+        except Exception:
+            return previous.chapters
+        return chapters
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        meta = executor.submit(refresh_meta)
+        chapters = executor.submit(refresh_chapters)
+        title, summary = meta.result()
+
+        return Content(
+            title=title,
+            summary=summary,
+            chapters=chapters.result(),
+            passages=stable + paragraphs,
+            transcript=transcript,
+            images=previous.images,
+            origin=previous.origin,
+        )
+
+
+def __getattr__(name: str) -> Any:
+    # Rewrite examples used to live here as a module-level literal.
+    if name == "rewrite_examples":
+        return {
+            lang: [{"input": input, "output": output} for input, output in get_rewrite_examples(lang).items()]
+            for lang in available_languages()
+        }
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,7 +2,7 @@ import json
 import re
 from pathlib import Path
 
-from platogram.types import SpeechEvent
+from platogram.types import SpeechEvent, Transcript
 from platogram.utils import parse_hh_mm_ss
 
 
@@ -75,7 +75,7 @@ def parse_subtitles(file: Path) -> list[SpeechEvent]:
         raise ValueError(f"Unsupported subtitle file format: {file.suffix}")
 
 
-def parse_waffly(file: Path) -> list[SpeechEvent]:
+def parse_waffly(file: Path) -> Transcript:
     if file.suffix != ".json":
         raise ValueError(
             f"Expected file extension to be '.json', but got {file.suffix}"
@@ -85,15 +85,15 @@ def parse_waffly(file: Path) -> list[SpeechEvent]:
         raw = json.load(f)
 
     if raw and "sentences" in raw[0]:
-        sentences: list[dict] = sum([phrase["sentences"] for phrase in raw], [])
-        return [
-            SpeechEvent(time_ms=sentence["start"], text=sentence["text"])
-            for sentence in sentences
-        ]
+        sentences = [sentence for phrase in raw for sentence in phrase["sentences"]]
+        return Transcript.from_columns(
+            (sentence["start"] for sentence in sentences),
+            (sentence["text"] for sentence in sentences),
+            (None for _ in sentences),
+        )
     else:
-        return [
-            SpeechEvent(time_ms=start, text=text, speaker=speaker)
-            for text, start, speaker in [
-                (word["text"], int(word["start"]), word["speaker"]) for word in raw
-            ]
-        ]
+        return Transcript.from_columns(
+            (word["start"] for word in raw),
+            (word["text"] for word in raw),
+            (word["speaker"] for word in raw),
+        )
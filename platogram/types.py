@@ -1,6 +1,9 @@
-from typing import Literal
+from array import array
+from collections.abc import Iterable, Sequence
+from typing import Any, Callable, Literal, overload
 
-from pydantic import BaseModel
+from pydantic import BaseModel, GetCoreSchemaHandler, PrivateAttr
+from pydantic_core import core_schema
 
 
 class User(BaseModel):
@@ -19,11 +22,239 @@ class SpeechEvent(BaseModel):
     speaker: str | None = None
 
 
+class Transcript(Sequence[SpeechEvent]):
+    """
+    Immutable columnar sequence of speech events.
+
+    Times are an int64 array, texts one UTF-8 buffer with int64 offsets, and speakers a
+    dictionary-encoded int32 column (-1 for no speaker), which is tens of bytes per event
+    plus the text instead of a pydantic object per event. Columns may be arrays or
+    memoryviews of the same item types, e.g. over a memory-mapped file. Indexing and iteration create
+    SpeechEvent views on the fly, slicing returns a Transcript. In pydantic models it
+    validates from a list of events or dicts and serializes to a list of dicts, the same
+    as `list[SpeechEvent]`.
+    """
+
+    __slots__ = ("times", "offsets", "buffer", "speaker_ids", "speakers")
+
+    def __init__(
+        self,
+        times: array | memoryview,
+        offsets: array | memoryview,
+        buffer: bytes | memoryview,
+        speaker_ids: array | memoryview,
+        speakers: list[str],
+    ) -> None:
+        self.times = times
+        self.offsets = offsets
+        self.buffer = buffer
+        self.speaker_ids = speaker_ids
+        self.speakers = speakers
+
+    @classmethod
+    def from_columns(
+        cls, times: Iterable[int], texts: Iterable[str], speakers: Iterable[str | None]
+    ) -> "Transcript":
+        time_column = array("q")
+        offsets = array("q", [0])
+        buffer = bytearray()
+        speaker_ids = array("i")
+        speaker_lookup: dict[str, int] = {}
+        for time_ms, text, speaker in zip(times, texts, speakers, strict=True):
+            time_column.append(int(time_ms))
+            buffer += text.encode()
+            offsets.append(len(buffer))
+            speaker_ids.append(
+                -1 if speaker is None else speaker_lookup.setdefault(speaker, len(speaker_lookup))
+            )
+        return cls(time_column, offsets, bytes(buffer), speaker_ids, list(speaker_lookup))
+
+    @classmethod
+    def from_events(cls, events: Iterable[SpeechEvent | dict[str, Any]]) -> "Transcript":
+        if isinstance(events, Transcript):
+            return events
+
+        times, texts, speakers = [], [], []
+        for event in events:
+            if isinstance(event, SpeechEvent):
+                times.append(event.time_ms)
+                texts.append(event.text)
+                speakers.append(event.speaker)
+            else:
+                try:
+                    time_ms, text, speaker = event["time_ms"], event["text"], event.get("speaker")
+                    valid = (
+                        type(time_ms) is int
+                        and type(text) is str
+                        and (speaker is None or type(speaker) is str)
+                    )
+                except (KeyError, TypeError, AttributeError):
+                    valid = False
+                if not valid:
+                    # Coerces the event or raises ValidationError, like list[SpeechEvent] does
+                    event = SpeechEvent.model_validate(event)
+                    time_ms, text, speaker = event.time_ms, event.text, event.speaker
+                times.append(time_ms)
+                texts.append(text)
+                speakers.append(speaker)
+        return cls.from_columns(times, texts, speakers)
+
+    @classmethod
+    def validate(cls, value: Any) -> "Transcript":
+        if isinstance(value, (str, bytes, dict)) or not isinstance(value, Iterable):
+            raise ValueError("Transcript must be a list of speech events")
+        return cls.from_events(value)
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def text(self, i: int) -> str:
+        return str(self.buffer[self.offsets[i] : self.offsets[i + 1]], "utf-8")
+
+    def speaker(self, i: int) -> str | None:
+        speaker_id = self.speaker_ids[i]
+        return None if speaker_id < 0 else self.speakers[speaker_id]
+
+    @overload
+    def __getitem__(self, i: int) -> SpeechEvent: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> "Transcript": ...
+
+    def __getitem__(self, i: int | slice) -> "SpeechEvent | Transcript":
+        if isinstance(i, slice):
+            start, stop, step = i.indices(len(self))
+            if step != 1:
+                return Transcript.from_events(self[j] for j in range(start, stop, step))
+            stop = max(start, stop)
+            base = self.offsets[start]
+            return Transcript(
+                self.times[start:stop],
+                array("q", (offset - base for offset in self.offsets[start : stop + 1])),
+                self.buffer[base : self.offsets[stop]],
+                self.speaker_ids[start:stop],
+                self.speakers,
+            )
+
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("Transcript index out of range")
+        return self.event(i)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.event(i)
+
+    def event(self, i: int) -> SpeechEvent:
+        # Validating three scalars is faster than model_construct() in pydantic 2
+        return SpeechEvent(time_ms=self.times[i], text=self.text(i), speaker=self.speaker(i))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Transcript):
+            return (
+                self.times == other.times
+                and self.offsets == other.offsets
+                and self.buffer == other.buffer
+                and [self.speaker(i) for i in range(len(self))]
+                == [other.speaker(i) for i in range(len(other))]
+            )
+        if isinstance(other, Sequence):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Transcript({len(self)} events)"
+
+    # Immutable, so copies can share columns, including memoryviews that cannot be copied
+    def __copy__(self) -> "Transcript":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "Transcript":
+        return self
+
+    def __reduce__(self) -> tuple:
+        return (
+            Transcript,
+            (
+                array("q", self.times),
+                array("q", self.offsets),
+                bytes(self.buffer),
+                array("i", self.speaker_ids),
+                self.speakers,
+            ),
+        )
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        return [
+            {"time_ms": self.times[i], "text": self.text(i), "speaker": self.speaker(i)}
+            for i in range(len(self))
+        ]
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            cls.validate,
+            json_schema_input_schema=handler.generate_schema(list[SpeechEvent]),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                cls.to_dicts,
+                return_schema=core_schema.list_schema(core_schema.dict_schema()),
+            ),
+        )
+
+
 class Content(BaseModel):
     title: str
     summary: str
     chapters: dict[int, str]
     passages: list[str]
-    transcript: list[SpeechEvent]
+    transcript: Transcript
     images: list[str] | None = None
     origin: str | None = None
+
+
+class LazyContent(Content):
+    """
+    Content with some fields left unloaded. A field that was not loaded up front is loaded
+    with `loader(field name)` on first access, so reading metadata does not pay for parsing
+    the transcript or passages. Serialization and comparison load all fields first.
+    """
+
+    _loader: Callable[[str], Any] | None = PrivateAttr(default=None)
+
+    @classmethod
+    def partial(cls, loader: Callable[[str], Any], **fields: Any) -> "LazyContent":
+        content = cls.model_construct(**fields)
+        for name, field in cls.model_fields.items():
+            if name not in fields and not field.is_required():
+                # model_construct() fills defaults in, but defaults are not stored values
+                del content.__dict__[name]
+        content._loader = loader
+        return content
+
+    def __getattr__(self, name: str) -> Any:
+        if name in type(self).model_fields:
+            loader = self._loader
+            if loader is not None:
+                value = loader(name)
+                self.__dict__[name] = value
+                return value
+        return super().__getattr__(name)  # type: ignore
+
+    def load(self) -> Content:
+        return Content.model_construct(
+            **{name: getattr(self, name) for name in type(self).model_fields}
+        )
+
+    def model_dump(self, **kwargs: Any) -> dict[str, Any]:
+        return self.load().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        return self.load().model_dump_json(**kwargs)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyContent):
+            other = other.load()
+        return self.load() == other
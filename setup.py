@@ -4,6 +4,7 @@ setup(
     name="platogram",
     version="0.1.0",
     packages=find_packages(),
+    package_data={"platogram": ["data/rewrite_examples/*.json"]},
     install_requires=[
         # List any specific dependencies for platogram here
     ],
@@ -29,3 +29,19 @@ def test_process_url():
         assert content.transcript
         assert len(content.images) == len(content.transcript)
         assert all((library.home / image).exists() for image in content.images)
+
+
+def test_import_is_lazy():
+    import subprocess
+    import sys
+
+    heavy = ["yt_dlp", "requests", "anthropic", "tqdm", "platogram.ops", "platogram.ingest"]
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            "-c",
+            f"import sys, platogram, platogram.cli; print([m for m in {heavy} if m in sys.modules])",
+        ],
+        text=True,
+    )
+    assert output.strip() == "[]"
@@ -0,0 +1,260 @@
+import re
+import shutil
+import socket
+import subprocess
+import threading
+from collections import Counter
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from platogram import ingest
+from platogram.frames import (
+    SCENE_WIDTH,
+    RemoteVideo,
+    deduplicate_keyframes,
+    extract_frames,
+    extract_keyframes,
+)
+
+pytestmark = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not found")
+
+
+@pytest.fixture(scope="module")
+def video(tmp_path_factory) -> Path:
+    # 10 frames per second, the frame number is drawn in the top left corner
+    path = tmp_path_factory.mktemp("video") / "video.mp4"
+    subprocess.run(
+        [
+            "ffmpeg",
+            "-f",
+            "lavfi",
+            "-i",
+            "testsrc=duration=6:size=160x120:rate=10",
+            "-g",
+            "25",
+            "-pix_fmt",
+            "yuv420p",
+            str(path),
+        ],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return path
+
+
+@pytest.fixture(scope="module")
+def slides(tmp_path_factory) -> Path:
+    # Two seconds per slide, the third slide is the first one again
+    path = tmp_path_factory.mktemp("slides") / "slides.mp4"
+    sources = ["testsrc", "smptebars", "testsrc", "rgbtestsrc"]
+    inputs = []
+    for source in sources:
+        inputs += ["-f", "lavfi", "-i", f"{source}=duration=2:size=160x120:rate=10"]
+    subprocess.run(
+        ["ffmpeg", *inputs, "-filter_complex", "[0][1][2][3]concat=n=4:v=1,format=yuv420p"]
+        + [str(path)],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return path
+
+
+def reference_frame(video: Path, output_dir: Path, timestamp_ms: int) -> bytes:
+    path = output_dir / f"reference_{timestamp_ms}.png"
+    subprocess.run(
+        ["ffmpeg", "-ss", f"{timestamp_ms / 1000:.3f}", "-i", str(video)]
+        + ["-frames:v", "1", "-f", "image2", str(path)],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return path.read_bytes()
+
+
+def test_extract_frames_matches_seek(video, tmp_path):
+    timestamps_ms = [3000, 0, 1050, 1050, 1100, 2499, 5900]
+    images = extract_frames(video, tmp_path / "images", timestamps_ms, workers=3)
+
+    assert [image.name for image in images] == [
+        f"image_{timestamp_ms:09d}.png" for timestamp_ms in timestamps_ms
+    ]
+    for timestamp_ms, image in zip(timestamps_ms, images):
+        assert image.read_bytes() == reference_frame(video, tmp_path, timestamp_ms)
+    assert sorted(path.name for path in (tmp_path / "images").iterdir()) == sorted(
+        {image.name for image in images}
+    )
+
+
+def test_extract_frames_after_end(video, tmp_path):
+    images = extract_frames(video, tmp_path, [5950, 60000], image_format="jpg", width=80)
+    assert [image.suffix for image in images] == [".jpg", ".jpg"]
+    assert images[0].read_bytes() == images[1].read_bytes()
+
+
+def test_extract_frames_empty(video, tmp_path):
+    assert extract_frames(video, tmp_path, []) == []
+
+
+def test_extract_images_keeps_local_video(video, tmp_path):
+    images = ingest.extract_images(f"file://{video}", tmp_path, [500], image_format="webp")
+    assert images[0].name == "image_000000500.webp" and images[0].exists()
+    assert video.exists()
+
+
+def test_extract_keyframes(slides, tmp_path):
+    timestamps_ms = list(range(0, 8000, 500))
+    images = extract_keyframes(slides, tmp_path, timestamps_ms, chapter_timestamps_ms=[7000])
+
+    assert len(images) == len(timestamps_ms)
+    assert [image.name for image in images[::4]] == [
+        "image_000000000.png",
+        "image_000002000.png",
+        "image_000000000.png",
+        "image_000006000.png",
+    ]
+    assert images[:4] == [images[0]] * 4
+    # The chapter at 7 s is the slide on screen since 6 s
+    assert images[14] == images[12]
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+        {image.name for image in images}
+    )
+
+
+def test_deduplicate_keyframes():
+    keyframes = [(0, 0b1111), (1000, 0b1110), (2000, 0xFF00), (3000, 0b0111)]
+    assert deduplicate_keyframes(keyframes, max_distance=1) == {
+        0: 0,
+        1000: 0,
+        2000: 2000,
+        3000: 0,
+    }
+    assert deduplicate_keyframes(keyframes, max_distance=0) == {
+        0: 0,
+        1000: 1000,
+        2000: 2000,
+        3000: 3000,
+    }
+
+
+class RangeRequestHandler(SimpleHTTPRequestHandler):
+    """
+    Static file server with single-range requests that counts the bytes it sends per path.
+    The send buffer is small, so that little more than what the client reads is counted.
+    """
+
+    bytes_sent: Counter[str] = Counter()
+
+    def setup(self):
+        self.request.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 16 * 1024)
+        super().setup()
+
+    def send_head(self):
+        match = re.fullmatch(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+        path = Path(self.translate_path(self.path))
+        if not match or not path.is_file():
+            return super().send_head()
+
+        size = path.stat().st_size
+        start = int(match.group(1))
+        end = min(int(match.group(2) or size - 1), size - 1)
+        file = path.open("rb")
+        file.seek(start)
+        self.send_response(206)
+        self.send_header("Content-Type", self.guess_type(str(path)))
+        self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+        self.remaining = end - start + 1
+        return file
+
+    def copyfile(self, source, outputfile):
+        remaining = getattr(self, "remaining", None)
+        while chunk := source.read(65536 if remaining is None else min(65536, remaining)):
+            try:
+                outputfile.write(chunk)
+            except (BrokenPipeError, ConnectionResetError):
+                return
+            RangeRequestHandler.bytes_sent[self.path] += len(chunk)
+            if remaining is not None:
+                remaining -= len(chunk)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def http_server(tmp_path):
+    handler = partial(RangeRequestHandler, directory=str(tmp_path))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    RangeRequestHandler.bytes_sent = Counter()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+@pytest.fixture
+def http_video(tmp_path, http_server):
+    # Two minutes of noise, so that the file is large and frames compress poorly
+    path = tmp_path / "video.mp4"
+    subprocess.run(
+        ["ffmpeg", "-f", "lavfi", "-i", "nullsrc=duration=120:size=320x240:rate=25,noise=alls=100"]
+        + ["-g", "50", "-pix_fmt", "yuv420p", "-movflags", "+faststart", str(path)],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return path, f"{http_server}/video.mp4"
+
+
+def test_extract_frames_remote(http_video, tmp_path):
+    path, url = http_video
+    video = ingest.get_stream(url)
+    assert video.url == url
+
+    RangeRequestHandler.bytes_sent = Counter()
+    timestamps_ms = [1000, 60000, 95500]
+    images = extract_frames(video, tmp_path / "images", timestamps_ms)
+
+    assert RangeRequestHandler.bytes_sent["/video.mp4"] < path.stat().st_size / 3
+    for timestamp_ms, image in zip(timestamps_ms, images):
+        assert image.read_bytes() == reference_frame(path, tmp_path, timestamp_ms)
+
+
+def test_extract_keyframes_remote(http_server, tmp_path, monkeypatch):
+    # Four slides of 20 seconds in a large rendition and a small one for scene detection
+    sources = ["testsrc", "smptebars", "testsrc", "rgbtestsrc"]
+    inputs = []
+    for source in sources:
+        inputs += ["-f", "lavfi", "-i", f"{source}=duration=20:size=320x240:rate=25"]
+    for name, scale, quality in [("large", 320, 1), ("small", 160, 10)]:
+        subprocess.run(
+            ["ffmpeg", *inputs, "-filter_complex"]
+            + [f"[0][1][2][3]concat=n=4:v=1,scale={scale}:-2,format=yuv420p"]
+            + ["-c:v", "mpeg4", "-q:v", str(quality), "-g", "25"]
+            + ["-movflags", "+faststart", str(tmp_path / f"{name}.mp4")],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def get_stream(url, width=None):
+        name = "small" if width == SCENE_WIDTH else "large"
+        return RemoteVideo(url=f"{http_server}/{name}.mp4")
+
+    monkeypatch.setattr(ingest, "get_stream", get_stream)
+    timestamps_ms = list(range(0, 80000, 1000))
+    images = ingest.extract_keyframes(
+        f"{http_server}/page", tmp_path / "images", timestamps_ms, stream=True
+    )
+
+    assert len(images) == len(timestamps_ms) and len(set(images)) == 3
+    assert RangeRequestHandler.bytes_sent["/small.mp4"] > 0
+    # Only the three distinct slides are read from the large rendition
+    large_size = (tmp_path / "large.mp4").stat().st_size
+    assert RangeRequestHandler.bytes_sent["/large.mp4"] < large_size / 3
@@ -1,6 +1,18 @@
-import platogram
-
+import hashlib
+import os
+import threading
+import tracemalloc
+from functools import partial
+from http.server import (
+    BaseHTTPRequestHandler,
+    SimpleHTTPRequestHandler,
+    ThreadingHTTPServer,
+)
 from pathlib import Path
+
+import pytest
+
+import platogram
 from platogram import ingest
 
 
@@ -26,3 +38,136 @@ def test_slurp_youtube_transcribe():
         "https://www.youtube.com/shorts/XsLK3tPy9SI", asr_model
     )
     assert transcript
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """Serves `body`, dropping the connection halfway through the first response."""
+
+    body = b""
+    ranges: list[str | None] = []
+
+    def do_GET(self):
+        FlakyHandler.ranges.append(self.headers.get("Range"))
+        start = int(self.headers["Range"][6:-1]) if self.headers.get("Range") else 0
+        self.send_response(206 if start else 200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body) - start))
+        self.end_headers()
+        # Memoryview slices, so that the server doesn't count against the client's memory
+        body = memoryview(self.body)
+        if len(FlakyHandler.ranges) == 1:
+            self.wfile.write(body[: len(body) // 2])
+            self.close_connection = True
+        else:
+            self.wfile.write(body[start:])
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def flaky_server():
+    FlakyHandler.body = os.urandom(8 * 1024 * 1024)
+    FlakyHandler.ranges = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/asset"
+    server.shutdown()
+
+
+def test_download_file_resumes(flaky_server, tmp_path):
+    sha256 = hashlib.sha256(FlakyHandler.body).hexdigest()
+    tracemalloc.start()
+    try:
+        file = ingest.download_file(flaky_server, tmp_path, chunk_size=64 * 1024, sha256=sha256)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert file == tmp_path / "asset.json"
+    assert file.read_bytes() == FlakyHandler.body
+    assert FlakyHandler.ranges == [None, f"bytes={len(FlakyHandler.body) // 2}-"]
+    assert peak < len(FlakyHandler.body) / 4
+
+
+def test_download_file_checksum_mismatch(flaky_server, tmp_path):
+    with pytest.raises(ValueError):
+        ingest.download_file(flaky_server, tmp_path, sha256="0" * 64)
+    assert not list(tmp_path.iterdir())
+
+
+class CountingHandler(SimpleHTTPRequestHandler):
+    requests: list[str] = []
+
+    def log_message(self, format, *args):
+        CountingHandler.requests.append(self.requestline)
+
+
+def test_media_session_resolves_once(tmp_path):
+    (tmp_path / "video.mp4").write_bytes(os.urandom(64 * 1024))
+    CountingHandler.requests = []
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), partial(CountingHandler, directory=str(tmp_path))
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/video.mp4"
+    try:
+        output_dir = tmp_path / "output"
+        output_dir.mkdir()
+        assert ingest.get_id(url) == "video"
+        video = ingest.download_video(url, output_dir)
+        assert ingest.get_stream(url).url == url
+    finally:
+        server.shutdown()
+
+    assert video is not None
+    assert video.read_bytes() == (tmp_path / "video.mp4").read_bytes()
+    # One request to resolve the URL and one to download the video
+    assert len(CountingHandler.requests) == 2
+
+
+class FlakyYoutubeDL:
+    """Fails the first resolution, like a network error, and counts resolutions."""
+
+    calls = 0
+
+    def __init__(self, params):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def extract_info(self, url, download=True, process=True):
+        FlakyYoutubeDL.calls += 1
+        if FlakyYoutubeDL.calls == 1:
+            raise ConnectionError("network down")
+        return {"id": "video", "_type": "video"}
+
+
+def test_media_session_retries_and_expires(monkeypatch):
+    monkeypatch.setattr(ingest, "YoutubeDL", FlakyYoutubeDL)
+    FlakyYoutubeDL.calls = 0
+    session = ingest.MediaSession("https://example.com/video", ttl_s=60)
+
+    with pytest.raises(ConnectionError):
+        session.extract()
+    assert session.extract()["id"] == "video"
+    assert session.extract()["id"] == "video"
+    assert FlakyYoutubeDL.calls == 2
+
+    monkeypatch.setattr(session, "extracted_at", session.extracted_at - 61)
+    session.extract()
+    assert FlakyYoutubeDL.calls == 3
+
+
+def test_get_media_session_is_bounded(monkeypatch):
+    monkeypatch.setattr(ingest, "MAX_MEDIA_SESSIONS", 2)
+    monkeypatch.setattr(ingest, "media_sessions", ingest.OrderedDict())
+    first = ingest.get_media_session("https://example.com/1")
+    assert ingest.get_media_session("https://example.com/1") is first
+    ingest.get_media_session("https://example.com/2")
+    ingest.get_media_session("https://example.com/3")
+    assert list(ingest.media_sessions) == ["https://example.com/2", "https://example.com/3"]
@@ -1,7 +1,14 @@
 import json
+import pytest
 
 from pathlib import Path
-from platogram.library import get_semantic_local_chroma, get_keyword_local_bm25
+from concurrent.futures import ThreadPoolExecutor
+from platogram.library import (
+    get_keyword_local_bm25,
+    get_local_dumb,
+    get_local_sqlite,
+    get_semantic_local_chroma,
+)
 from platogram.types import Content
 from platogram.utils import make_filesystem_safe
 
@@ -41,3 +48,255 @@ def test_keyword_local_bm25(tmp_path: Path) -> None:
     assert len(distances) == 16
     assert len(context[0].passages) == len(distances)
     assert "United Nations" in context[0].passages[0]
+
+
+def test_keyword_local_bm25_multiple_documents(tmp_path: Path) -> None:
+    lib = get_keyword_local_bm25(tmp_path)
+
+    for name in ["jfk", "obama"]:
+        with open(f"samples/{name}.json", "r") as file:
+            lib.put(name, Content(**json.load(file)))
+
+    lib = get_keyword_local_bm25(tmp_path)
+    context, distances = lib.retrieve("United Nations", filter_keys=["jfk", "obama"], n_results=8)
+    assert {content.title for content in context} <= {
+        lib.get_content("jfk").title,
+        lib.get_content("obama").title,
+    }
+    assert sum(len(content.passages) for content in context) == len(distances) == 8
+    start = 0
+    for content in context:
+        scores = distances[start : start + len(content.passages)]
+        assert scores == sorted(scores, reverse=True)
+        start += len(content.passages)
+
+    context, distances = lib.retrieve("United Nations", filter_keys=["obama"], n_results=8)
+    assert [content.title for content in context] == [lib.get_content("obama").title]
+
+    lib.delete("obama")
+    context, _ = lib.retrieve("United Nations", filter_keys=[], n_results=8)
+    assert [content.title for content in context] == [lib.get_content("jfk").title]
+
+
+def test_keyword_local_bm25_incremental_matches_rebuild(tmp_path: Path) -> None:
+    lib = get_keyword_local_bm25(tmp_path)
+
+    with open("samples/jfk.json", "r") as file:
+        doc = Content(**json.load(file))
+
+    for i in range(10):
+        part = doc.model_copy(update={"passages": doc.passages[i::10]})
+        lib.put(f"part{i}", part)
+    lib.put("part3", doc.model_copy(update={"passages": doc.passages[:3]}))
+    lib.delete("part7")
+
+    index = lib.load_index()
+    assert len(index.segments) < 11
+    assert index.tombstones
+
+    (query,) = lib.tokenize(["United Nations freedom"])
+    incremental = index.search(query, k=12)
+    filtered = index.search(query, k=12, ids={"part3", "part5"})
+    assert {id for id, _, _ in filtered} <= {"part3", "part5"}
+    assert "part7" not in {id for id, _, _ in index.search(query, k=100)}
+
+    def assert_same(hits: list, expected: list) -> None:
+        assert [hit[:2] for hit in hits] == [hit[:2] for hit in expected]
+        assert [hit[2] for hit in hits] == pytest.approx([hit[2] for hit in expected])
+
+    lib.compact()
+    assert len(index.segments) == 1
+    assert not index.tombstones
+    assert_same(index.search(query, k=12), incremental)
+
+    lib.build_index()
+    assert_same(lib.load_index().search(query, k=12), incremental)
+    assert_same(lib.load_index().search(query, k=12, ids={"part3", "part5"}), filtered)
+
+
+def test_keyword_local_bm25_concurrent_writers(tmp_path: Path) -> None:
+    with open("samples/jfk.json", "r") as file:
+        doc = Content(**json.load(file))
+
+    first = get_keyword_local_bm25(tmp_path)
+    second = get_keyword_local_bm25(tmp_path)
+    for i in range(6):
+        part = doc.model_copy(update={"passages": doc.passages[i::6]})
+        (first if i % 2 else second).put(f"part{i}", part)
+    first.delete("part2")
+
+    # Documents that were never overwritten or deleted have no tombstones
+    assert set(first.load_index().tombstones) == {"part2"}
+
+    (query,) = first.tokenize(["United Nations freedom"])
+    ids = {id for id, _, _ in get_keyword_local_bm25(tmp_path).load_index().search(query, k=500)}
+    assert ids == {f"part{i}" for i in range(6)} - {"part2"}
+    assert {id for id, _, _ in second.load_index().search(query, k=500)} == ids
+
+
+def test_local_sqlite(tmp_path: Path) -> None:
+    with open("samples/jfk.json", "r") as file:
+        doc = Content(**json.load(file))
+
+    json_lib = get_local_dumb(tmp_path / "json")
+    json_lib.put("jfk", doc)
+    json_lib.put("short", doc.model_copy(update={"passages": doc.passages[:2]}))
+
+    from platogram.library.local_sqlite import migrate_json_library
+
+    lib = get_local_sqlite(tmp_path / "sqlite")
+    assert migrate_json_library(json_lib.home, lib) == ["jfk", "short"]
+    assert lib.ls() == ["jfk", "short"]
+    assert lib.exists("jfk") and not lib.exists("missing")
+    assert lib.get_content("jfk") == doc
+
+    lib.put("short", doc.model_copy(update={"passages": doc.passages[:1], "images": ["a.png"]}))
+    short = get_local_sqlite(tmp_path / "sqlite").get_content("short")
+    assert short.passages == doc.passages[:1]
+    assert short.images == ["a.png"]
+    assert short.transcript == doc.transcript
+
+    def read_write(i: int) -> int:
+        lib.put(f"doc{i}", doc)
+        return len(lib.get_content("jfk").transcript)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert set(executor.map(read_write, range(8))) == {len(doc.transcript)}
+
+    lib.delete("jfk")
+    assert not lib.exists("jfk")
+    with pytest.raises(FileNotFoundError):
+        lib.get_content("jfk")
+    (count,) = lib.connect().execute(
+        "SELECT COUNT(*) FROM transcript WHERE id = ?", ("jfk",)
+    ).fetchone()
+    assert count == 0
+
+
+@pytest.mark.parametrize("get_library", [get_local_dumb, get_local_sqlite])
+def test_get_content_fields(tmp_path: Path, get_library) -> None:
+    lib = get_library(tmp_path)
+
+    with open("samples/jfk.json", "r") as file:
+        doc = Content(**json.load(file))
+    lib.put("jfk", doc)
+
+    content = lib.get_content("jfk", fields=["title", "chapters"])
+    assert content.title == doc.title
+    assert content.chapters == doc.chapters
+    assert "transcript" not in content.__dict__ and "passages" not in content.__dict__
+
+    assert content.passages == doc.passages
+    assert content.transcript == doc.transcript
+    assert content == doc
+    assert content.model_dump() == doc.model_dump()
+
+    with pytest.raises(ValueError):
+        lib.get_content("jfk", fields=["transcripts"])
+
+
+def test_get_content_fields_reads_metadata_only(tmp_path: Path) -> None:
+    lib = get_local_dumb(tmp_path)
+
+    with open("samples/jfk.json", "r") as file:
+        doc = Content(**json.load(file))
+    lib.put("jfk", doc)
+    (tmp_path / "jfk.json").write_text("not json")
+
+    content = lib.get_content("jfk", fields=["title", "summary", "chapters"])
+    assert (content.title, content.summary, content.chapters) == (
+        doc.title,
+        doc.summary,
+        doc.chapters,
+    )
+    assert lib.ls() == ["jfk"]
+
+
+def test_local_dumb_binary(tmp_path: Path) -> None:
+    with open("samples/jfk.json", "r") as file:
+        doc = Content(**json.load(file))
+
+    lib = get_local_dumb(tmp_path, binary=True)
+    lib.put("jfk", doc)
+    assert (tmp_path / "jfk.plato").exists() and not (tmp_path / "jfk.json").exists()
+    assert lib.ls() == ["jfk"]
+
+    content = lib.get_content("jfk")
+    assert content == doc
+    assert content.transcript[3] == doc.transcript[3]
+    assert list(content.transcript[10:12]) == list(doc.transcript[10:12])
+    assert Content.model_validate_json(content.model_dump_json()) == doc
+
+    meta = lib.get_content("jfk", fields=["title", "chapters"])
+    assert (meta.title, meta.chapters) == (doc.title, doc.chapters)
+    assert "passages" not in meta.__dict__
+    assert meta.passages == doc.passages
+
+    # Overwriting replaces the file, so views of the previous version stay valid
+    lib.put("jfk", doc.model_copy(update={"title": "New"}))
+    assert content.transcript[-1] == doc.transcript[-1]
+    assert lib.get_content("jfk", fields=["title"]).title == "New"
+
+    get_local_dumb(tmp_path).put("jfk", doc)
+    assert not (tmp_path / "jfk.plato").exists()
+    assert lib.get_content("jfk") == doc
+    lib.delete("jfk")
+    assert lib.ls() == []
+
+
+@pytest.mark.parametrize("get_library", [get_local_dumb, get_local_sqlite])
+def test_content_cache(tmp_path: Path, get_library) -> None:
+    from platogram.library import content_cache
+
+    with open("samples/jfk.json", "r") as file:
+        doc = Content(**json.load(file))
+
+    lib = get_library(tmp_path)
+    lib.put("jfk", doc)
+    content_cache.clear()
+    before = content_cache.stats()
+
+    first = lib.get_content("jfk")
+    first.passages = first.passages[:1]
+    first.chapters.clear()
+    second = lib.get_content("jfk")
+    assert second == doc
+    stats = content_cache.stats()
+    assert stats["misses"] - before["misses"] == 1
+    assert stats["hits"] - before["hits"] == 1
+
+    lib.put("jfk", doc.model_copy(update={"title": "New"}))
+    assert lib.get_content("jfk").title == "New"
+
+    # Writes by another library instance are picked up through the file stamps
+    get_library(tmp_path).put("jfk", doc)
+    assert lib.get_content("jfk").title == doc.title
+
+    lib.delete("jfk")
+    with pytest.raises(FileNotFoundError):
+        lib.get_content("jfk")
+
+
+def test_cached_embedding_function(tmp_path: Path) -> None:
+    from platogram.library.embeddings import CachedEmbeddingFunction, EmbeddingCache
+
+    class CountingModel:
+        name = "test/counting"
+
+        def __init__(self) -> None:
+            self.batches: list[list[str]] = []
+
+        def embed(self, texts: list[str]) -> list[list[float]]:
+            self.batches.append(texts)
+            return [[float(len(text)), 0.5] for text in texts]
+
+    model = CountingModel()
+    embed = CachedEmbeddingFunction(model, EmbeddingCache(tmp_path / "e.sqlite"), batch_size=2)
+    texts = ["a", "bb", "a", "ccc", "dddd"]
+    assert embed(texts) == [[1.0, 0.5], [2.0, 0.5], [1.0, 0.5], [3.0, 0.5], [4.0, 0.5]]
+    assert [len(batch) for batch in model.batches] == [2, 2]
+
+    model = CountingModel()
+    embed = CachedEmbeddingFunction(model, EmbeddingCache(tmp_path / "e.sqlite"), batch_size=2)
+    assert embed(texts + ["eeeee"])[-1] == [5.0, 0.5]
+    assert model.batches == [["eeeee"]]
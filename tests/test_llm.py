@@ -123,3 +123,126 @@ def test_render_context() -> None:
 <text>Second Asset Sentence one.【3】Second Asset Sentence two.【4】Second Asset Sentence three.【5】</text>
 </content>"""
     )
+
+
+def test_count_tokens_offline() -> None:
+    llm = platogram.llm.get_model("anthropic/claude-3-5-sonnet", key="offline")
+    text = "Machine learning is a field of artificial intelligence.【1】"
+    assert llm.count_tokens(text) == llm.count_tokens(text) > 0
+    assert llm.count_tokens(text, estimate=True, lang="en") == -(-len(text) // 4.2)
+    assert llm.count_tokens(text, estimate=True, lang="es") > llm.count_tokens(
+        text, estimate=True, lang="en"
+    )
+
+
+def test_cached_token_counter() -> None:
+    from platogram.llm.tokens import CachedTokenCounter, EstimateTokenCounter
+
+    counter = CachedTokenCounter(EstimateTokenCounter("en"), maxsize=2)
+    for text in ["one", "two", "one", "three", "two"]:
+        counter.count_tokens(text)
+
+    assert counter.hits == 1
+    assert counter.misses == 4
+    assert len(counter.cache) == 2
+
+
+class StubMessages:
+    """Stands in for `anthropic.Client.messages`, records requests and returns canned text."""
+
+    def __init__(self) -> None:
+        self.requests: list[dict] = []
+
+    def create(self, **kwargs):
+        from types import SimpleNamespace
+
+        self.requests.append(kwargs)
+        return SimpleNamespace(
+            stop_reason="end_turn",
+            content=[SimpleNamespace(text=f"response {len(self.requests)}")],
+            usage=SimpleNamespace(
+                input_tokens=10,
+                output_tokens=5,
+                cache_creation_input_tokens=0 if len(self.requests) > 1 else 3000,
+                cache_read_input_tokens=3000 if len(self.requests) > 1 else 0,
+            ),
+        )
+
+
+def test_response_cache(tmp_path) -> None:
+    from platogram.llm.cache import ResponseCache
+    from platogram.types import User
+
+    cache = ResponseCache(tmp_path / "cache.sqlite")
+    llm = platogram.llm.get_model("anthropic/claude-3-5-sonnet", key="offline", cache=cache)
+    llm.client.messages = StubMessages()  # type: ignore
+
+    first = llm.prompt_model(messages=[User(content="Hello")])
+    second = llm.prompt_model(messages=[User(content="Hello")])
+    third = llm.prompt_model(messages=[User(content="Hello")], temperature=0.9)
+
+    assert first == second == "response 1"
+    assert third == "response 2"
+    assert len(llm.client.messages.requests) == 2  # type: ignore
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+    assert cache.stats()["entries"] == 2
+
+
+def test_response_cache_replays_streams(tmp_path) -> None:
+    from platogram.llm.cache import ResponseCache
+
+    cache = ResponseCache(tmp_path / "cache.sqlite")
+    key = cache.make_key(prompt="Hello", stream=True)
+    cache.put(key, ["Hel", "lo"])
+    assert cache.get(key) == ["Hel", "lo"]
+
+    llm = platogram.llm.get_model("anthropic/claude-3-5-sonnet", key="offline", cache=cache)
+    llm.call_model = lambda *args: iter(["Str", "eam"])  # type: ignore
+    assert list(llm.prompt_model(messages=[], stream=True)) == ["Str", "eam"]  # type: ignore
+
+    llm.call_model = None  # type: ignore
+    assert list(llm.prompt_model(messages=[], stream=True)) == ["Str", "eam"]  # type: ignore
+
+
+def test_response_cache_eviction_and_ttl(tmp_path) -> None:
+    from platogram.llm.cache import ResponseCache
+
+    cache = ResponseCache(tmp_path / "cache.sqlite", max_size_bytes=25)
+    cache.put("a", "x" * 10)
+    cache.put("b", "y" * 10)
+    assert cache.get("a") == "x" * 10
+    cache.put("c", "z" * 10)
+    assert cache.get("b") is None
+    assert cache.get("a") == "x" * 10
+
+    expired = ResponseCache(tmp_path / "cache.sqlite", ttl_s=0)
+    assert expired.get("a") is None
+
+
+def test_prompt_caching_request_shape() -> None:
+    from types import SimpleNamespace
+    from platogram.examples import get_rewrite_examples
+
+    llm = platogram.llm.get_model("anthropic/claude-3-5-sonnet", key="offline")
+    cached, plain = StubMessages(), StubMessages()
+    llm.client.messages = plain  # type: ignore
+    llm.client.beta = SimpleNamespace(prompt_caching=SimpleNamespace(messages=cached))  # type: ignore
+
+    examples = get_rewrite_examples("en")
+    for _ in range(2):
+        llm.get_paragraphs("Hello world.【0】", examples)
+
+    assert not plain.requests
+    request = cached.requests[0]
+    assert request["system"][0]["cache_control"] == {"type": "ephemeral"}
+    prefix = request["messages"][: 2 * len(examples)]
+    assert prefix[-1]["content"][0]["cache_control"] == {"type": "ephemeral"}
+    assert all(isinstance(m["content"], str) for m in prefix[:-1])
+    assert all(isinstance(m["content"], str) for m in request["messages"][2 * len(examples) :])
+    assert llm.usage["cache_creation_input_tokens"] == 3000  # type: ignore
+    assert llm.usage["cache_read_input_tokens"] == 3000  # type: ignore
+
+    llm.get_paragraphs("Hello world.【0】", {"Hi.【0】": ["Hi.【0】"]})
+    assert plain.requests
+    assert isinstance(plain.requests[0]["system"], str)
@@ -1,6 +1,49 @@
+import random
+import time
+
 import platogram
 import pytest
-from platogram.ops import chunk_text, get_paragraphs, parse
+from platogram.ops import (
+    chunk_text,
+    get_markers,
+    get_paragraphs,
+    get_paragraphs_iter,
+    get_chapters_hierarchical,
+    get_meta_hierarchical,
+    index,
+    index_incremental,
+    index_stream,
+    parse,
+    render,
+    stitch,
+)
+from platogram.types import SpeechEvent
+
+
+class FakeLLM:
+    """Groups every `size` segments into a paragraph, keeping text and markers intact."""
+
+    def __init__(self, size: int = 3) -> None:
+        self.size = size
+
+    def count_tokens(self, text: str, estimate: bool = False, lang: str | None = None) -> int:
+        return len(text)
+
+    def get_paragraphs(self, text_with_markers, examples, max_tokens=4096, temperature=0.5, lang=None):
+        items = list(parse(text_with_markers).items())
+        return [
+            render(dict(items[i : i + self.size])) for i in range(0, len(items), self.size)
+        ]
+
+    def get_meta(self, paragraphs, max_tokens=4096, temperature=0.5, lang=None):
+        return "Title", "Summary"
+
+    def get_chapters(self, passages, max_tokens=4096, temperature=0.5, lang=None):
+        return {0: "Chapter"}
+
+
+def make_text(n_segments: int) -> str:
+    return render({i: f"Sentence number {i}." for i in range(n_segments)})
 
 
 def test_get_paragraphs() -> None:
@@ -66,6 +109,280 @@ def test_consecutive_markers():
     assert chunk_text(text_with_markers, chunk_size, token_count_fn) == expected_chunks
 
 
+def test_chunk_counts_each_segment_once():
+    calls = []
+
+    def token_count_fn(text: str) -> int:
+        calls.append(text)
+        return len(text)
+
+    text_with_markers = "".join(f"segment {i}【{i}】" for i in range(100))
+    chunks = chunk_text(text_with_markers, 50, token_count_fn)
+    assert "".join(chunks) == text_with_markers
+    assert len(calls) == 100
+
+
+def test_chunk_matches_reference_boundaries():
+    def reference_chunk_text(text_with_markers, chunk_size, token_count_fn):
+        segments = parse(text_with_markers)
+        total_tokens = token_count_fn(render(segments))
+        num_chunks = (total_tokens + chunk_size - 1) // chunk_size
+        target_chunk_size = (total_tokens + num_chunks - 1) // num_chunks
+
+        chunks = []
+        chunk_segments: dict[int, str] = {}
+        for key, segment in segments.items():
+            updated_chunk_segments = {**chunk_segments, key: segment}
+            if token_count_fn(render(updated_chunk_segments)) > target_chunk_size and chunk_segments:
+                chunks.append(chunk_segments)
+                chunk_segments = {key: segment}
+            else:
+                chunk_segments = updated_chunk_segments
+
+        if chunk_segments:
+            chunks.append(chunk_segments)
+
+        return [render(chunk) for chunk in chunks]
+
+    rng = random.Random(42)
+    for _ in range(20):
+        text_with_markers = "".join(
+            f"{'x' * rng.randint(0, 40)}【{i}】" for i in range(rng.randint(1, 200))
+        )
+        chunk_size = rng.randint(1, 500)
+        assert chunk_text(text_with_markers, chunk_size, len) == reference_chunk_text(
+            text_with_markers, chunk_size, len
+        )
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_get_paragraphs_keeps_every_marker_once(concurrency: int) -> None:
+    paragraphs = get_paragraphs(
+        make_text(500), FakeLLM(), max_tokens=1024, temperature=0.5, chunk_size=400, concurrency=concurrency
+    )
+    assert sum([get_markers(paragraph) for paragraph in paragraphs], []) == list(range(500))
+
+
+def test_index_runs_post_stages_concurrently() -> None:
+    class SlowLLM(FakeLLM):
+        def __init__(self) -> None:
+            super().__init__()
+            self.intervals: dict[str, tuple[float, float]] = {}
+
+        def sleep(self, name: str) -> None:
+            start = time.perf_counter()
+            time.sleep(0.3)
+            self.intervals[name] = (start, time.perf_counter())
+
+        def get_meta(self, paragraphs, max_tokens=4096, temperature=0.5, lang=None):
+            self.sleep("meta")
+            raise RuntimeError("meta failed")
+
+        def get_chapters(self, passages, max_tokens=4096, temperature=0.5, lang=None):
+            self.sleep("chapters")
+            return {0: "Chapter"}
+
+    transcript = [SpeechEvent(time_ms=i * 1000, text=f"Sentence {i}.") for i in range(10)]
+    timings: dict[str, float] = {}
+    llm = SlowLLM()
+    content = index(transcript, llm, timings=timings)
+
+    assert (content.title, content.summary) == ("Missing Title", "Missing Summary")
+    assert content.chapters == {0: "Chapter"}
+    assert set(timings) == {"paragraphs", "meta", "chapters"}
+    assert timings["meta"] >= 0.3 and timings["chapters"] >= 0.3
+    (meta_start, meta_end), (chapters_start, chapters_end) = llm.intervals["meta"], llm.intervals["chapters"]
+    assert meta_start < chapters_end and chapters_start < meta_end
+
+
+@pytest.mark.parametrize("concurrency", [1, 2])
+def test_get_paragraphs_iter_yields_before_last_chunk(concurrency: int) -> None:
+    class CountingLLM(FakeLLM):
+        calls = 0
+
+        def get_paragraphs(self, *args, **kwargs):
+            self.calls += 1
+            return super().get_paragraphs(*args, **kwargs)
+
+    llm = CountingLLM()
+    paragraphs = get_paragraphs_iter(
+        make_text(500), llm, max_tokens=1024, temperature=0.5, chunk_size=400, concurrency=concurrency
+    )
+    first = next(paragraphs)
+    assert get_markers(first) == [0, 1, 2]
+    if concurrency == 1:
+        assert llm.calls == 1
+    assert len(list(paragraphs)) > 1
+
+
+def test_index_stream() -> None:
+    transcript = [SpeechEvent(time_ms=i * 1000, text=f"Sentence {i}.") for i in range(10)]
+    events = list(index_stream(transcript, FakeLLM()))
+
+    fields = [field for field, _ in events]
+    assert fields[: fields.count("paragraph")] == ["paragraph"] * fields.count("paragraph")
+    assert set(fields) == {"paragraph", "title", "summary", "chapters"}
+    assert [value for field, value in events if field == "paragraph"] == index(transcript, FakeLLM()).passages
+
+
+@pytest.mark.parametrize("concurrency", [1, 2])
+def test_index_resumes_from_checkpoint(tmp_path, concurrency: int) -> None:
+    class FlakyLLM(FakeLLM):
+        def __init__(self, fail_after: int | None = None) -> None:
+            super().__init__()
+            self.fail_after = fail_after
+            self.calls = 0
+
+        def get_paragraphs(self, *args, **kwargs):
+            if self.fail_after is not None and self.calls >= self.fail_after:
+                raise RuntimeError("LLM is down")
+            self.calls += 1
+            return super().get_paragraphs(*args, **kwargs)
+
+    transcript = [SpeechEvent(time_ms=i * 1000, text=f"Sentence number {i}.") for i in range(300)]
+    expected = index(transcript, FakeLLM(), chunk_size=400, concurrency=concurrency)
+
+    with pytest.raises(RuntimeError):
+        index(
+            transcript, FlakyLLM(fail_after=3), chunk_size=400, concurrency=concurrency, checkpoint_dir=tmp_path
+        )
+
+    llm = FlakyLLM()
+    content = index(transcript, llm, chunk_size=400, concurrency=concurrency, checkpoint_dir=tmp_path)
+    n_chunks = len(chunk_text(render({i: e.text for i, e in enumerate(transcript)}), 400, len))
+
+    assert content.passages == expected.passages
+    assert llm.calls <= n_chunks - 3
+    assert not any(tmp_path.iterdir())
+
+
+class BoundedLLM(FakeLLM):
+    """Fails like a real model would when the prompt is over `limit` tokens."""
+
+    def __init__(self, limit: int) -> None:
+        super().__init__()
+        self.limit = limit
+        self.calls = 0
+
+    def check(self, paragraphs: list[str]) -> None:
+        self.calls += 1
+        if sum(len(paragraph) for paragraph in paragraphs) > self.limit:
+            raise ValueError("Prompt is too long")
+
+    def get_meta(self, paragraphs, max_tokens=4096, temperature=0.5, lang=None):
+        self.check(paragraphs)
+        return f"Title {len(paragraphs)}", "Summary"
+
+    def get_chapters(self, passages, max_tokens=4096, temperature=0.5, lang=None):
+        self.check(passages)
+        markers = [get_markers(passage)[0] for passage in passages]
+        return {marker: f"Chapter {marker}" for marker in markers[:: max(len(markers) // 3, 1)]}
+
+
+def test_get_meta_hierarchical() -> None:
+    paragraphs = [f"Paragraph {i}【{i}】" for i in range(1000)]
+    llm = BoundedLLM(limit=2000)
+    title, summary = get_meta_hierarchical(llm, paragraphs, group_tokens=2000)
+    assert title.startswith("Title") and summary == "Summary"
+    assert llm.calls > 1
+
+
+def test_get_meta_hierarchical_long_summaries() -> None:
+    class VerboseLLM(BoundedLLM):
+        def get_meta(self, paragraphs, max_tokens=4096, temperature=0.5, lang=None):
+            self.check(paragraphs)
+            return "Title", "Summary " * 150
+
+    paragraphs = [f"Paragraph {i}【{i}】" for i in range(1000)]
+    llm = VerboseLLM(limit=2000)
+    title, summary = get_meta_hierarchical(llm, paragraphs, group_tokens=2000)
+    assert title == "Title"
+    assert llm.calls < 100
+
+
+def test_get_chapters_hierarchical() -> None:
+    paragraphs = [f"Paragraph {i}【{i}】" for i in range(1000)]
+    llm = BoundedLLM(limit=2000)
+    chapters = get_chapters_hierarchical(llm, paragraphs, group_tokens=2000)
+    assert chapters
+    assert len(chapters) < 10
+    assert 0 in chapters
+    assert all(0 <= marker < 1000 for marker in chapters)
+
+
+def test_index_incremental() -> None:
+    class CountingLLM(FakeLLM):
+        def __init__(self) -> None:
+            super().__init__()
+            self.rewritten: list[int] = []
+
+        def get_paragraphs(self, text_with_markers, *args, **kwargs):
+            self.rewritten.append(len(parse(text_with_markers)))
+            return super().get_paragraphs(text_with_markers, *args, **kwargs)
+
+        def get_chapters(self, passages, max_tokens=4096, temperature=0.5, lang=None):
+            return {get_markers(passages[0])[0]: "Chapter"}
+
+    transcript = [SpeechEvent(time_ms=i * 1000, text=f"Sentence number {i}.") for i in range(400)]
+    previous = index(transcript[:300], FakeLLM(), chunk_size=400)
+    previous.chapters = {0: "Intro", 150: "Middle", 290: "End"}
+
+    llm = CountingLLM()
+    content = index_incremental(previous, transcript[300:], llm, chunk_size=400)
+
+    assert sum([get_markers(passage) for passage in content.passages], []) == list(range(400))
+    assert content.passages[: len(previous.passages) - 1] == previous.passages[:-1]
+    assert sum(llm.rewritten) < 150
+    assert content.chapters == {0: "Intro", 150: "Middle", 288: "Chapter"}
+    assert len(content.transcript) == 400
+
+
+def test_index_incremental_unmarked_passage() -> None:
+    transcript = [SpeechEvent(time_ms=i * 1000, text=f"Sentence number {i}.") for i in range(60)]
+    previous = index(transcript[:40], FakeLLM(), chunk_size=400)
+    previous.passages.insert(len(previous.passages) // 2, "A passage without markers.")
+    previous.passages.insert(1, "Another one.")
+    previous.chapters = {0: "Intro", 20: "Middle"}
+
+    content = index_incremental(previous, transcript[40:], FakeLLM(), chunk_size=400)
+
+    assert "A passage without markers." in content.passages
+    assert sum([get_markers(passage) for passage in content.passages], []) == list(range(60))
+
+
+def test_register_rewrite_examples(tmp_path, monkeypatch) -> None:
+    import json
+    from platogram.examples import get_rewrite_examples, register_rewrite_examples
+
+    # Keep the registration from leaking into other tests
+    monkeypatch.setattr("platogram.examples.registered_examples", {})
+    get_rewrite_examples.cache_clear()
+
+    assert len(get_rewrite_examples("en")) == 5
+    assert get_rewrite_examples("es") is get_rewrite_examples("es")
+
+    file = tmp_path / "de.json"
+    file.write_text(
+        json.dumps({"version": 1, "lang": "de", "examples": [{"input": "Hallo.【0】", "output": ["Hallo.【0】"]}]})
+    )
+    try:
+        register_rewrite_examples("de", file)
+        assert get_rewrite_examples("de") == {"Hallo.【0】": ["Hallo.【0】"]}
+    finally:
+        get_rewrite_examples.cache_clear()
+
+    with pytest.raises(ValueError, match="No rewrite examples"):
+        get_rewrite_examples("xx")
+
+
+def test_stitch_cuts_straddling_paragraph():
+    windows = [
+        ["a【0】b【1】", "c【2】d【3】", "e【4】"],
+        ["d【3】e【4】f【5】", "g【6】"],
+    ]
+    assert list(stitch(windows, [0, 3])) == ["a【0】b【1】", "c【2】d【3】", "e【4】f【5】", "g【6】"]
+
+
 def test_parse_basic():
     text = "hello【1】world!【2】"
     expected = {1: "hello", 2: "world!"}
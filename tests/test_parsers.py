@@ -0,0 +1,88 @@
+import json
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from platogram.parsers import parse_waffly
+from platogram.types import Content, SpeechEvent, Transcript
+
+
+def make_waffly_words(n: int) -> list[dict]:
+    return [
+        {"text": f"word{i}", "start": i * 100, "speaker": "AB"[i % 2]} for i in range(n)
+    ]
+
+
+def test_parse_waffly_words(tmp_path: Path) -> None:
+    file = tmp_path / "words.json"
+    file.write_text(json.dumps(make_waffly_words(1000)))
+
+    transcript = parse_waffly(file)
+    assert isinstance(transcript, Transcript)
+    assert len(transcript) == 1000
+    assert transcript[1] == SpeechEvent(time_ms=100, text="word1", speaker="B")
+    assert transcript[-1].time_ms == 99_900
+
+    event_bytes = (
+        transcript.times.itemsize * len(transcript.times)
+        + transcript.offsets.itemsize * len(transcript.offsets)
+        + transcript.speaker_ids.itemsize * len(transcript.speaker_ids)
+        + len(transcript.buffer)
+    ) / len(transcript)
+    assert event_bytes < 32
+
+
+def test_parse_waffly_sentences(tmp_path: Path) -> None:
+    file = tmp_path / "sentences.json"
+    file.write_text(
+        json.dumps(
+            [
+                {"sentences": [{"start": 0, "text": "Hola."}, {"start": 500, "text": "¿Qué tal?"}]},
+                {"sentences": [{"start": 900, "text": "Bien."}]},
+            ]
+        )
+    )
+
+    assert list(parse_waffly(file)) == [
+        SpeechEvent(time_ms=0, text="Hola."),
+        SpeechEvent(time_ms=500, text="¿Qué tal?"),
+        SpeechEvent(time_ms=900, text="Bien."),
+    ]
+
+
+def test_transcript_slicing_and_serialization() -> None:
+    events = [
+        SpeechEvent(time_ms=i, text=f"é{i}", speaker=None if i % 3 else "S") for i in range(10)
+    ]
+    transcript = Transcript.from_events(events)
+
+    assert transcript == events
+    assert list(transcript[2:5]) == events[2:5]
+    assert list(transcript[::3]) == events[::3]
+    assert list(transcript[5:2]) == []
+    assert transcript[2:8][1:3] == events[3:5]
+
+    content = Content(
+        title="t", summary="s", chapters={}, passages=[], transcript=events
+    )
+    assert isinstance(content.transcript, Transcript)
+    data = content.model_dump(mode="json")
+    assert data["transcript"] == [event.model_dump() for event in events]
+    assert Content.model_validate_json(content.model_dump_json()) == content
+
+
+@pytest.mark.parametrize(
+    "transcript",
+    [[{"text": "a"}], [{"time_ms": 0, "text": None}], [{"time_ms": "x", "text": "a"}], "a", 5],
+)
+def test_transcript_validation_error(transcript) -> None:
+    with pytest.raises(ValidationError):
+        Content(title="t", summary="s", chapters={}, passages=[], transcript=transcript)
+
+
+def test_transcript_coerces_like_speech_event() -> None:
+    content = Content(
+        title="t", summary="s", chapters={}, passages=[], transcript=[{"time_ms": "5", "text": "a"}]
+    )
+    assert content.transcript[0] == SpeechEvent(time_ms=5, text="a")
@@ -255,7 +255,16 @@ def audio_to_paper(url_or_file: str, lang: str, output_dir: Path, user_id: str)
             logger.warning("Transcript doesn't contain markers. Adding a single marker.")
             transcript = f"【0】{transcript}"
 
-        content = plato.index(transcript, llm, lang=lang)
+        passages = []
+        fields = {}
+        for field, value in plato.index_stream(transcript, llm, lang=lang):
+            if field == "paragraph":
+                passages.append(value)
+                logger.info(f"Indexed {len(passages)} paragraphs")
+            else:
+                fields[field] = value
+                logger.info(f"Indexed {field}")
+        content = plato.Content(passages=passages, transcript=transcript, **fields)
 
         # Set language-specific prompts
         if lang == "en":